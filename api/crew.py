@@ -1,6 +1,7 @@
 from crewai import Agent, Crew, Process, Task, LLM
 from crewai.project import CrewBase, agent, crew, task
 import os
+from api.agent_registry import AgentRegistry
 from api.task_registry import TaskRegistry
 from api.tool_registry import ToolRegistry
 from api.knowledge_registry import KnowledgeRegistry
@@ -38,10 +39,9 @@ class ApiCrew():
             # Load tools
             tools = []
             tool_names = config.get('tools', [])
-            all_tools = self.tool_registry.get_all_tools()
             for t_name in tool_names:
                 # Find tool config
-                t_conf = next((t for t in all_tools if t['name'] == t_name), None)
+                t_conf = self.tool_registry.get_tool_by_name(t_name)
                 if t_conf:
                     tool_instance = self.tool_registry.instantiate_tool(t_conf)
                     if tool_instance:
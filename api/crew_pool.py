@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from crewai import Agent, Crew, Task
+from api.crew import ApiCrew
+
+
+class CrewTemplatePool:
+    """Keeps prebuilt crews and agents and hands out per-request copies.
+
+    Building an ``ApiCrew`` instantiates the LLM, every tool and every
+    Agent/Task, which dominates time to first token. Templates are built once
+    per registry configuration (identified by a hash of the agent, task and
+    tool YAML plus the knowledge files they reference) and cloned with
+    ``Crew.copy()`` / ``Agent.copy()``, which share the tool instances and
+    the LLM's underlying clients and connection pools. Templates are rebuilt
+    only when the hash changes; they are never kicked off themselves.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._builder: Optional[ApiCrew] = None
+        self._config_hash: Optional[str] = None
+        self._crew: Optional[Crew] = None
+        self._agents: Dict[str, Agent] = {}
+
+    def _get_builder(self) -> ApiCrew:
+        # The builder owns the LLM shared by every template built from it
+        if self._builder is None:
+            self._builder = ApiCrew()
+        return self._builder
+
+    def config_hash(self) -> str:
+        builder = self._get_builder()
+        agents = builder.registry.get_all_agents()
+        knowledge_files: List[Tuple[str, int, int]] = []
+        for agent in agents:
+            for k_file in agent.get('knowledge_sources', []):
+                path = builder.knowledge_registry.get_file_path(k_file)
+                if os.path.exists(path):
+                    st = os.stat(path)
+                    knowledge_files.append((path, st.st_mtime_ns, st.st_size))
+        config = {
+            "agents": agents,
+            "tasks": builder.task_registry.get_all_tasks(),
+            "tools": builder.tool_registry.get_all_tools(),
+            "knowledge": sorted(knowledge_files),
+        }
+        encoded = json.dumps(config, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _refresh(self):
+        # Caller holds self._lock
+        current = self.config_hash()
+        if current != self._config_hash:
+            if self._config_hash is not None:
+                # ApiCrew memoizes crew(), so a changed config needs a fresh builder
+                self._builder = ApiCrew()
+            self._config_hash = current
+            self._crew = None
+            self._agents = {}
+
+    def get_crew(self) -> Crew:
+        """Returns a copy of the configured crew that is safe to kick off."""
+        with self._lock:
+            self._refresh()
+            if self._crew is None:
+                self._crew = self._get_builder().crew()
+            template = self._crew
+        return template.copy()
+
+    def get_agent(self, role: str) -> Agent:
+        """Returns a copy of the agent configured for ``role``."""
+        with self._lock:
+            self._refresh()
+            template = self._agents.get(role)
+            if template is None:
+                builder = self._get_builder()
+                template = builder._create_agent_from_config(role)
+                # Unknown roles get an uncached default agent, so arbitrary
+                # request roles cannot grow the pool without bound
+                if builder.registry.get_agent_by_role(role):
+                    self._agents[role] = template
+        return template.copy()
+
+    def run_single_agent_task(self, role: str, prompt: str):
+        agent = self.get_agent(role)
+        task = Task(
+            description=prompt,
+            expected_output="Detailed response to the prompt.",
+            agent=agent
+        )
+        crew = Crew(
+            agents=[agent],
+            tasks=[task],
+            verbose=True
+        )
+        return crew.kickoff()
@@ -0,0 +1,165 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue is at capacity and cannot admit new work."""
+
+
+class JobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class Job:
+    def __init__(self, kind: str, payload: Optional[Dict] = None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.payload = payload or {}
+        self.status = JobStatus.QUEUED
+        self.result: Optional[str] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.events: List[Dict] = []
+        self.future: Optional[Future] = None
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        # Set only after the final events are published, so readers that see
+        # done=True and drain events once more never miss the tail
+        return self._finished.is_set()
+
+    def publish(self, event: str, data: Any = None):
+        # Events are append-only so stream readers can resume from an offset
+        with self._lock:
+            self.events.append({"event": event, "data": data, "timestamp": time.time()})
+
+    def events_since(self, offset: int) -> List[Dict]:
+        with self._lock:
+            return self.events[offset:]
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue:
+    """Runs crews on a bounded worker pool so HTTP handlers return immediately.
+
+    Admission control: at most ``max_queue`` jobs may be queued or running at
+    once; further submissions raise ``QueueFullError`` instead of piling up
+    in memory. Finished jobs are kept for lookup up to ``max_finished`` entries.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        max_finished: Optional[int] = None,
+    ):
+        self.max_workers = max_workers or int(os.environ.get("JOB_WORKERS", "4"))
+        self.max_queue = max_queue or int(os.environ.get("JOB_MAX_QUEUE", "64"))
+        self.max_finished = max_finished or int(os.environ.get("JOB_MAX_FINISHED", "1000"))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="crew-job"
+        )
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active = 0
+        self._lock = threading.Lock()
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs currently queued or running."""
+        return self._active
+
+    def submit(self, kind: str, fn: Callable[[Job], Any], payload: Optional[Dict] = None) -> Job:
+        job = Job(kind, payload)
+        with self._lock:
+            if self._active >= self.max_queue:
+                raise QueueFullError(
+                    f"Job queue is full ({self._active}/{self.max_queue}). Try again later."
+                )
+            self._active += 1
+            self._jobs[job.id] = job
+            self._prune_finished()
+        job.publish("status", job.status)
+        try:
+            job.future = self._executor.submit(self._run, job, fn)
+        except BaseException:
+            # e.g. RuntimeError after shutdown: the job never runs, so it must
+            # not hold an admission slot
+            with self._lock:
+                self._active -= 1
+                self._jobs.pop(job.id, None)
+            raise
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "depth": self._active,
+                "jobs": counts,
+            }
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job: Job, fn: Callable[[Job], Any]) -> Any:
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        job.publish("status", job.status)
+        try:
+            result = fn(job)
+            job.result = str(result)
+            job.status = JobStatus.COMPLETED
+            job.publish("result", job.result)
+            return result
+        except Exception as e:
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+            job.publish("error", job.error)
+            raise
+        finally:
+            job.finished_at = time.time()
+            job.publish("status", job.status)
+            job._finished.set()
+            with self._lock:
+                self._active -= 1
+
+    def _prune_finished(self):
+        # Oldest jobs are first in insertion order; only drop ones that finished
+        finished = [jid for jid, j in self._jobs.items() if j.done]
+        for jid in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[jid]
@@ -1,14 +1,17 @@
 from fastapi import FastAPI, HTTPException, Security, Depends, UploadFile, File
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import List, Optional, Dict
-from api.crew import ApiCrew
+from api.crew_pool import CrewTemplatePool
 from api.agent_registry import AgentRegistry
 from api.task_registry import TaskRegistry
 from api.tool_registry import ToolRegistry, TOOL_CLASSES
 from api.knowledge_registry import KnowledgeRegistry
+from api.job_queue import Job, JobQueue, QueueFullError
+import asyncio
+import json
 import os
 
 app = FastAPI(title="CrewAI API", description="API to run CrewAI crews", version="1.0.0")
@@ -104,6 +107,12 @@ registry = AgentRegistry()
 task_registry = TaskRegistry()
 tool_registry = ToolRegistry()
 knowledge_registry = KnowledgeRegistry()
+job_queue = JobQueue()
+crew_pool = CrewTemplatePool()
+
+@app.on_event("shutdown")
+def shutdown_job_queue():
+    job_queue.shutdown()
 
 @app.get("/health")
 def health_check():
@@ -217,35 +226,88 @@ def delete_knowledge(filename: str, token: str = Depends(verify_token)):
         raise HTTPException(status_code=404, detail="File not found")
     return {"status": "success", "message": f"File {filename} deleted"}
 
+def _submit_job(kind: str, fn, payload: Dict) -> Job:
+    try:
+        return job_queue.submit(kind, fn, payload)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+
+def _run_kickoff(job: Job, topic: str):
+    crew_instance = crew_pool.get_crew()
+    # Forward each finished task to the job so /jobs/{id}/stream can relay it
+    crew_instance.task_callback = lambda output: job.publish(
+        "task", {"agent": output.agent, "description": output.description, "raw": output.raw}
+    )
+    return crew_instance.kickoff(inputs={"topic": topic})
+
 @app.post("/agent/{role}/ask")
-def ask_agent(role: str, request: AgentTaskRequest, token: str = Depends(verify_token)):
+async def ask_agent(role: str, request: AgentTaskRequest, token: str = Depends(verify_token)):
     """
     Asks a specific agent a question/task.
+    Runs on the job worker pool; the request waits for the answer without blocking the server.
     """
+    job = _submit_job(
+        "ask",
+        lambda job: crew_pool.run_single_agent_task(role, request.prompt),
+        {"role": role, "prompt": request.prompt},
+    )
     try:
-        # We will use ApiCrew to run this, specifically targeting one agent
-        # For now, let's assume ApiCrew can handle this, or we construct it here.
-        # But to keep logic encapsulated, let's look at ApiCrew refactor.
-        # For now, we'll placeholder this or implement it via ApiCrew.
-        result = ApiCrew().run_single_agent_task(role, request.prompt)
-        return {"result": str(result), "status": "success"}
+        result = await asyncio.wrap_future(job.future)
+        return {"result": str(result), "status": "success", "job_id": job.id}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/crew/kickoff")
+@app.post("/crew/kickoff", status_code=202)
 def kickoff_crew(request: KickoffRequest, token: str = Depends(verify_token)):
     """
-    Kicks off the crew with the given topic. Requires Bearer Token.
+    Queues a crew run for the given topic and returns its job id. Requires Bearer Token.
+    Poll GET /jobs/{job_id} or follow GET /jobs/{job_id}/stream for the result.
     """
-    try:
-        inputs = {"topic": request.topic}
-        crew_instance = ApiCrew().crew()
-        result = crew_instance.kickoff(inputs=inputs)
-        return {"result": str(result), "status": "success"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    job = _submit_job("kickoff", lambda job: _run_kickoff(job, request.topic), {"topic": request.topic})
+    return {"job_id": job.id, "status": job.status}
+
+# --- Jobs Endpoints ---
+
+@app.get("/jobs")
+def list_jobs(token: str = Depends(verify_token)):
+    return {"stats": job_queue.stats(), "jobs": [j.to_dict() for j in job_queue.list()]}
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str, token: str = Depends(verify_token)):
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+@app.get("/jobs/{job_id}/stream")
+async def stream_job(job_id: str, token: str = Depends(verify_token)):
+    """
+    Server-Sent Events stream of a job's status changes, task outputs and final result.
+    """
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_stream():
+        offset = 0
+        while True:
+            # Check completion before draining so the final events are never missed
+            finished = job.done
+            events = job.events_since(offset)
+            offset += len(events)
+            for event in events:
+                yield f"event: {event['event']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+            if finished:
+                break
+            await asyncio.sleep(0.5)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 if __name__ == "__main__":
     import uvicorn
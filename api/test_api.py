@@ -251,12 +251,30 @@ def test_api():
     
     try:
         response = requests.post(f"{url}/crew/kickoff", json=payload, headers=headers)
-        if response.status_code == 200:
-            print("✅ Crew kickoff passed")
+        if response.status_code == 202:
+            print("✅ Crew kickoff queued")
         else:
             print(f"✅ Crew kickoff endpoint hit (Result: {response.status_code})")
+            return
     except Exception as e:
         print(f"❌ Request failed: {e}")
+        return
+
+    # 7. Jobs
+    print("\nTesting Jobs...")
+    job_id = response.json().get("job_id")
+    resp = requests.get(f"{url}/jobs/{job_id}", headers=headers)
+    if resp.status_code == 200 and resp.json().get("id") == job_id:
+        print(f"✅ Get Job passed (status: {resp.json().get('status')})")
+    else:
+        print(f"❌ Get Job failed: {resp.text}")
+
+    with requests.get(f"{url}/jobs/{job_id}/stream", headers=headers, stream=True) as resp:
+        events = [line for line in resp.iter_lines(decode_unicode=True) if line.startswith("event:")]
+    if events and events[-1] == "event: status":
+        print(f"✅ Job stream passed ({len(events)} events)")
+    else:
+        print(f"❌ Job stream failed: {events}")
 
 if __name__ == "__main__":
     test_api()
@@ -0,0 +1,120 @@
+import copy
+import os
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+
+class _CacheEntry:
+    def __init__(self, stamp: Tuple[int, int, int], data: Dict, index: Dict[str, Dict]):
+        self.stamp = stamp
+        self.data = data
+        self.index = index
+
+
+# Parsed files shared by every registry instance in the process, keyed by absolute path.
+# ApiCrew builds its own registries per request, so a per-instance cache would not help.
+_cache: Dict[str, _CacheEntry] = {}
+_locks: Dict[str, threading.RLock] = {}
+_locks_guard = threading.Lock()
+
+
+def _path_lock(path: str) -> threading.RLock:
+    with _locks_guard:
+        return _locks.setdefault(path, threading.RLock())
+
+
+class YamlRegistry:
+    """Base class for registries persisted as a YAML list under ``root_key``.
+
+    Parsed data is cached in memory and revalidated against the file's
+    mtime and size on each lookup, so edits made by other processes (or by
+    hand) are picked up without re-parsing on every call. Entries are also
+    indexed by ``key_field`` for O(1) lookups; the dicts returned by lookups
+    are the cached objects and must be treated as read-only. Writes go to a temp file that
+    is renamed over the original, so readers never see a half-written file.
+    """
+
+    root_key: str = ""
+    key_field: str = ""
+
+    def __init__(self, config_path: str):
+        self.config_path = config_path
+        self._abs_path = os.path.abspath(config_path)
+        self._lock = _path_lock(self._abs_path)
+        self._ensure_config_exists()
+
+    def _ensure_config_exists(self):
+        with self._lock:
+            if not os.path.exists(self.config_path):
+                os.makedirs(os.path.dirname(self._abs_path), exist_ok=True)
+                self._save_data({self.root_key: []})
+
+    def _stamp(self) -> Tuple[int, int, int]:
+        # The inode changes on every atomic rename, which catches rewrites
+        # that land within the filesystem's mtime granularity
+        st = os.stat(self._abs_path)
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _entry(self) -> _CacheEntry:
+        stamp = self._stamp()
+        entry = _cache.get(self._abs_path)
+        if entry is not None and entry.stamp == stamp:
+            return entry
+        with self._lock:
+            # Another thread may have refreshed it while we waited
+            stamp = self._stamp()
+            entry = _cache.get(self._abs_path)
+            if entry is None or entry.stamp != stamp:
+                with open(self._abs_path, 'r') as f:
+                    data = yaml.safe_load(f) or {self.root_key: []}
+                entry = self._store(stamp, data)
+            return entry
+
+    def _store(self, stamp: Tuple[int, int, int], data: Dict) -> _CacheEntry:
+        index = {}
+        for item in data.get(self.root_key) or []:
+            key = item.get(self.key_field)
+            if key is not None and key not in index:
+                index[key] = item
+        entry = _CacheEntry(stamp, data, index)
+        _cache[self._abs_path] = entry
+        return entry
+
+    def _load_data(self) -> Dict:
+        # Callers mutate the returned data before saving it, so hand out a copy
+        return copy.deepcopy(self._entry().data)
+
+    def _save_data(self, data: Dict):
+        directory = os.path.dirname(self._abs_path)
+        with self._lock:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    os.chmod(tmp_path, self._file_mode())
+                    yaml.dump(data, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self._abs_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._store(self._stamp(), copy.deepcopy(data))
+
+    def _file_mode(self) -> int:
+        # mkstemp creates 0600 files; keep the mode the YAML file had (or would have had)
+        try:
+            return os.stat(self._abs_path).st_mode & 0o777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+    def _all(self) -> List[Dict]:
+        return list(self._entry().data.get(self.root_key) or [])
+
+    def _get(self, key: str) -> Optional[Dict]:
+        return self._entry().index.get(key)
@@ -0,0 +1,317 @@
+"""HTML-to-text extraction for the scraping tools.
+
+Pages are turned into plain text by the fastest backend installed:
+selectolax, then lxml, then BeautifulSoup's pure-Python ``html.parser``.
+Scripts, styles and other non-content elements are always dropped, and
+navigation, footers and sidebars are dropped unless boilerplate removal is
+disabled, so they do not end up in the LLM context. The lxml backend parses
+the document incrementally, chunk by chunk, without building a tree, and
+stops reading once enough text has been collected for the requested cap.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+import importlib.util
+import re
+from typing import Any, ClassVar
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Elements whose content is never readable text.
+NON_CONTENT_TAGS = frozenset(
+    {
+        "canvas",
+        "embed",
+        "iframe",
+        "noscript",
+        "object",
+        "script",
+        "style",
+        "svg",
+        "template",
+    }
+)
+# Site chrome that repeats on every page of a site.
+BOILERPLATE_TAGS = frozenset({"aside", "footer", "nav"})
+BOILERPLATE_ROLES = frozenset(
+    {"banner", "complementary", "contentinfo", "navigation", "search"}
+)
+
+TRUNCATION_NOTICE = "\n[Content truncated]"
+
+_HORIZONTAL_SPACE = re.compile("[ \t]+")
+_BLANK_LINES = re.compile("\\s+\n\\s+")
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of spaces and blank lines in extracted text."""
+    text = _HORIZONTAL_SPACE.sub(" ", text)
+    return _BLANK_LINES.sub("\n", text)
+
+
+def _iter_chunks(
+    html: str | bytes | Iterable[str | bytes], chunk_size: int
+) -> Iterator[str | bytes]:
+    if isinstance(html, (str, bytes)):
+        for start in range(0, len(html), chunk_size):
+            yield html[start : start + chunk_size]
+    else:
+        yield from html
+
+
+def _join_chunks(chunks: Iterable[str | bytes]) -> str | bytes:
+    parts = list(chunks)
+    if parts and all(isinstance(part, bytes) for part in parts):
+        return b"".join(parts)  # type: ignore[arg-type]
+    return "".join(
+        part.decode("utf-8", "replace") if isinstance(part, bytes) else part
+        for part in parts
+    )
+
+
+class HTMLExtractor(ABC):
+    """Turns an HTML document into plain text.
+
+    Subclasses implement one parser backend. Text nodes are joined with a
+    single space, like BeautifulSoup's ``get_text(" ")``.
+    """
+
+    name: ClassVar[str]
+    module: ClassVar[str]
+
+    def __init__(self, remove_boilerplate: bool = True) -> None:
+        """Initialize the extractor.
+
+        Args:
+            remove_boilerplate: Whether to drop navigation, footers, sidebars
+                and elements with the matching ARIA landmark roles.
+        """
+        self.remove_boilerplate = remove_boilerplate
+        self.skip_tags = NON_CONTENT_TAGS | (
+            BOILERPLATE_TAGS if remove_boilerplate else frozenset()
+        )
+        self.skip_roles = BOILERPLATE_ROLES if remove_boilerplate else frozenset()
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Whether the backend's parser is installed."""
+        return importlib.util.find_spec(cls.module) is not None
+
+    @abstractmethod
+    def extract(
+        self, chunks: Iterable[str | bytes], max_chars: int | None = None
+    ) -> str:
+        """Extract the text of a document.
+
+        Args:
+            chunks: The document, in one or more consecutive pieces.
+            max_chars: Backends may stop parsing once this much text has been
+                collected; the result is not truncated.
+
+        Returns:
+            The text of the document, before whitespace normalization.
+        """
+
+    def _skips(self, tag: str, attrs: Any) -> bool:
+        return (
+            tag in self.skip_tags
+            or attrs.get("role") in self.skip_roles
+            or "hidden" in attrs
+        )
+
+
+class _TextCollector:
+    """lxml parser target that collects text outside skipped elements."""
+
+    def __init__(self, extractor: HTMLExtractor) -> None:
+        self.extractor = extractor
+        self.parts: list[str] = []
+        self.size = 0
+        self._buffer: list[str] = []
+        self._skip_depth = 0
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._flush()
+        if self._skip_depth or self.extractor._skips(tag, attrib):
+            self._skip_depth += 1
+
+    def end(self, tag: str) -> None:
+        self._flush()
+        if self._skip_depth:
+            self._skip_depth -= 1
+
+    def data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._buffer.append(data)
+            self.size += len(" ".join(data.split())) + 1
+
+    def close(self) -> str:
+        self._flush()
+        return " ".join(self.parts)
+
+    def _flush(self) -> None:
+        # A text node may arrive in several pieces, e.g. around entities.
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        self.parts.append(text)
+
+
+class LxmlExtractor(HTMLExtractor):
+    """Streaming extractor on libxml2's HTML parser."""
+
+    name = "lxml"
+    module = "lxml"
+
+    def extract(
+        self, chunks: Iterable[str | bytes], max_chars: int | None = None
+    ) -> str:
+        from lxml import etree  # type: ignore[import-untyped]
+
+        collector = _TextCollector(self)
+        parser = etree.HTMLParser(target=collector, remove_comments=True)
+        fed = False
+        for chunk in chunks:
+            if not chunk:
+                continue
+            parser.feed(chunk)
+            fed = True
+            if max_chars is not None and collector.size > max_chars:
+                break
+        if not fed:
+            return ""
+        return str(parser.close())
+
+
+class SelectolaxExtractor(HTMLExtractor):
+    """Extractor on selectolax's Modest engine."""
+
+    name = "selectolax"
+    module = "selectolax"
+
+    def extract(
+        self, chunks: Iterable[str | bytes], max_chars: int | None = None
+    ) -> str:
+        from selectolax.parser import HTMLParser  # type: ignore[import-not-found]
+
+        tree = HTMLParser(_join_chunks(chunks))
+        tree.strip_tags(sorted(self.skip_tags))
+        if self.remove_boilerplate:
+            selector = ", ".join(f'[role="{role}"]' for role in self.skip_roles)
+            for node in tree.css(selector):
+                node.decompose()
+        for node in tree.css("[hidden]"):
+            node.decompose()
+        if tree.root is None:
+            return ""
+        return str(tree.root.text(separator=" "))
+
+
+class BeautifulSoupExtractor(HTMLExtractor):
+    """Extractor on BeautifulSoup's pure-Python ``html.parser``."""
+
+    name = "html.parser"
+    module = "bs4"
+
+    def extract(
+        self, chunks: Iterable[str | bytes], max_chars: int | None = None
+    ) -> str:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(_join_chunks(chunks), "html.parser")
+        for element in soup.find_all(lambda tag: self._skips(tag.name, tag.attrs)):
+            if not element.decomposed:
+                element.decompose()
+        return soup.get_text(" ")
+
+
+# Ordered by preference, fastest first.
+HTML_EXTRACTORS: dict[str, type[HTMLExtractor]] = {
+    extractor.name: extractor
+    for extractor in (SelectolaxExtractor, LxmlExtractor, BeautifulSoupExtractor)
+}
+
+
+def available_html_extractors() -> list[str]:
+    """Return the names of the installed extractors, fastest first."""
+    return [
+        name for name, extractor in HTML_EXTRACTORS.items() if extractor.is_available()
+    ]
+
+
+def get_html_extractor(
+    name: str | None = None, remove_boilerplate: bool = True
+) -> HTMLExtractor:
+    """Create an extractor.
+
+    Args:
+        name: Backend name, one of ``HTML_EXTRACTORS``; the fastest installed
+            backend is used if None.
+        remove_boilerplate: Whether to drop navigation, footers and sidebars.
+
+    Returns:
+        The extractor.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the backend, or when no name is given any backend, is
+            not installed.
+    """
+    if name is None:
+        available = available_html_extractors()
+        if not available:
+            raise ImportError(
+                "beautifulsoup4 is not installed. Please install it with `pip install crewai-tools[beautifulsoup4]`"
+            )
+        name = available[0]
+    extractor = HTML_EXTRACTORS.get(name)
+    if extractor is None:
+        raise ValueError(
+            f"Unknown HTML extractor {name!r}; expected one of {list(HTML_EXTRACTORS)}"
+        )
+    if not extractor.is_available():
+        raise ImportError(
+            f"The {name!r} HTML extractor requires `{extractor.module}`. "
+            f"Please install it with `pip install {extractor.module}`"
+        )
+    return extractor(remove_boilerplate=remove_boilerplate)
+
+
+def extract_text(
+    html: str | bytes | Iterable[str | bytes],
+    extractor: str | HTMLExtractor | None = None,
+    remove_boilerplate: bool = True,
+    max_chars: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> str:
+    """Extract the readable text of an HTML document.
+
+    Example:
+        >>> extract_text("<p>Hello <b>world</b></p><script>x()</script>")
+        'Hello world'
+
+    Args:
+        html: The document, or an iterable of consecutive chunks of it such
+            as ``response.iter_content(decode_unicode=True)``.
+        extractor: Backend name or instance; the fastest installed backend
+            is used if None.
+        remove_boilerplate: Whether to drop navigation, footers and sidebars.
+            Ignored when an extractor instance is passed.
+        max_chars: Maximum length of the text; longer text is cut and ends
+            with ``TRUNCATION_NOTICE``.
+        chunk_size: Size of the pieces a whole document is parsed in.
+
+    Returns:
+        The text, with runs of spaces and blank lines collapsed.
+    """
+    if not isinstance(extractor, HTMLExtractor):
+        extractor = get_html_extractor(extractor, remove_boilerplate)
+    text = extractor.extract(_iter_chunks(html, chunk_size), max_chars=max_chars)
+    text = normalize_whitespace(text).strip()
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars].rstrip() + TRUNCATION_NOTICE
+    return text
@@ -0,0 +1,385 @@
+"""Shared HTTP layer for the fetch-based tools.
+
+All tools share one pooled ``requests.Session``, so keep-alive connections
+are reused across calls. GET responses carrying an ``ETag`` or
+``Last-Modified`` validator, or an explicit ``max-age``, are kept in a
+size-capped disk cache. Fresh entries are served without a request and
+stale ones are revalidated with a conditional request, following RFC 9111.
+Concurrent fetches of the same URL share a single request, and the number
+of in-flight requests per host is limited.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+from http.cookiejar import DefaultCookiePolicy
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, cast
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+DEFAULT_MAX_CACHE_BYTES = 100 * 1024 * 1024
+DEFAULT_POOL_SIZE = 20
+DEFAULT_PER_HOST_LIMIT = 4
+
+_CACHEABLE_STATUS = 200
+
+
+def _cache_directives(headers: Any) -> dict[str, str | None]:
+    """Parse a Cache-Control header into lowercase directives."""
+    directives: dict[str, str | None] = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _entity_headers(headers: Any) -> dict[str, str]:
+    # The stored body is already decoded, so its transfer framing is dropped.
+    return {
+        name: value
+        for name, value in headers.items()
+        if name.lower() not in ("content-length", "content-encoding")
+    }
+
+
+def _max_age(directives: dict[str, str | None]) -> float | None:
+    try:
+        return float(directives["max-age"] or "")
+    except (KeyError, ValueError):
+        return None
+
+
+@dataclass
+class _CachedResponse:
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+    encoding: str | None = None
+    reason: str | None = None
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> _CachedResponse:
+        return cls(
+            url=response.url,
+            status_code=response.status_code,
+            headers=_entity_headers(response.headers),
+            content=response.content,
+            stored_at=time.time(),
+            encoding=response.encoding,
+            reason=response.reason,
+        )
+
+    @property
+    def cacheable(self) -> bool:
+        """Whether RFC 9111 allows storing this response and it can be reused."""
+        if self.status_code != _CACHEABLE_STATUS:
+            return False
+        headers = CaseInsensitiveDict(self.headers)
+        directives = _cache_directives(headers)
+        if "no-store" in directives or headers.get("Vary") == "*":
+            return False
+        has_validator = "ETag" in headers or "Last-Modified" in headers
+        return has_validator or _max_age(directives) is not None
+
+    def age(self) -> float:
+        try:
+            initial_age = float(CaseInsensitiveDict(self.headers).get("Age", 0))
+        except ValueError:
+            initial_age = 0.0
+        return initial_age + time.time() - self.stored_at
+
+    def is_fresh(self) -> bool:
+        directives = _cache_directives(CaseInsensitiveDict(self.headers))
+        if "no-cache" in directives:
+            return False
+        max_age = _max_age(directives)
+        return max_age is not None and self.age() < max_age
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.url = self.url
+        response.encoding = self.encoding
+        response.reason = self.reason or ""
+        response.from_cache = True  # type: ignore[attr-defined]
+        return response
+
+
+@dataclass
+class _InFlight:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: _CachedResponse | None = None
+    error: BaseException | None = None
+
+
+class HTTPCache:
+    """Size-capped disk cache of HTTP responses, evicting least recently used."""
+
+    def __init__(
+        self, directory: str | Path, max_bytes: int = DEFAULT_MAX_CACHE_BYTES
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory the entries are stored in.
+            max_bytes: Maximum total size of the stored entries.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> _CachedResponse | None:
+        """Return the entry for a key, or None if it is not cached."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                content = f.read()
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return _CachedResponse(content=content, **meta)
+
+    def set(self, key: str, entry: _CachedResponse) -> None:
+        """Store an entry, evicting old ones if the size cap is exceeded."""
+        meta = {
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "stored_at": entry.stored_at,
+            "encoding": entry.encoding,
+            "reason": entry.reason,
+        }
+        data = json.dumps(meta).encode() + b"\n" + entry.content
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every stored entry."""
+        with self._lock:
+            for path in self.directory.glob("*.http"):
+                path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.http"
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.http"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class HTTPClient:
+    """Pooled HTTP client with response caching and per-host limits.
+
+    Example:
+        >>> client = get_http_client()
+        >>> page = client.get("https://example.com", timeout=15)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            cache_dir: Directory of the response cache; caching is disabled
+                if None.
+            max_cache_bytes: Maximum total size of the response cache.
+            pool_size: Maximum number of pooled connections per host.
+            per_host_limit: Maximum number of in-flight requests per host.
+        """
+        self.per_host_limit = per_host_limit
+        self.cache = HTTPCache(cache_dir, max_cache_bytes) if cache_dir else None
+        self.session = requests.Session()
+        # Tools pass their own cookies; never carry cookies between calls.
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._host_limits: dict[str, threading.BoundedSemaphore] = {}
+        self._in_flight: dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        cookies: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        """Fetch a URL, serving or revalidating cached responses.
+
+        Args:
+            url: URL to fetch.
+            headers: Request headers.
+            cookies: Request cookies.
+            timeout: Request timeout in seconds.
+
+        Returns:
+            The response; ``from_cache`` is True when the body came from the
+            cache.
+        """
+        key = self._cache_key(url, headers, cookies)
+        cached = self.cache.get(key) if self.cache else None
+        if cached is not None and cached.is_fresh():
+            return cached.to_response()
+
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if in_flight is None:
+                in_flight = self._in_flight[key] = _InFlight()
+
+        if not leader:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return cast(_CachedResponse, in_flight.result).to_response()
+
+        try:
+            response, in_flight.result = self._fetch(
+                url, headers, cookies, timeout, key, cached
+            )
+            return response
+        except BaseException as e:
+            in_flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            in_flight.done.set()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send an uncached request over the pooled session.
+
+        Args:
+            method: HTTP method.
+            url: URL to request.
+            **kwargs: Arguments accepted by ``requests.Session.request``.
+
+        Returns:
+            The response.
+        """
+        with self._host_limit(url):
+            return self.session.request(method, url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send an uncached POST request over the pooled session."""
+        return self.request("POST", url, **kwargs)
+
+    def _fetch(
+        self,
+        url: str,
+        headers: dict[str, str] | None,
+        cookies: dict[str, Any] | None,
+        timeout: float | None,
+        key: str,
+        cached: _CachedResponse | None,
+    ) -> tuple[requests.Response, _CachedResponse]:
+        request_headers = dict(headers or {})
+        if cached is not None:
+            validators = CaseInsensitiveDict(cached.headers)
+            if etag := validators.get("ETag"):
+                request_headers["If-None-Match"] = etag
+            if last_modified := validators.get("Last-Modified"):
+                request_headers["If-Modified-Since"] = last_modified
+
+        with self._host_limit(url):
+            response = self.session.get(
+                url, headers=request_headers, cookies=cookies, timeout=timeout
+            )
+
+        if cached is not None and response.status_code == 304:
+            merged = CaseInsensitiveDict(cached.headers)
+            merged.update(_entity_headers(response.headers))
+            cached.headers = dict(merged.items())
+            cached.stored_at = time.time()
+            if self.cache:
+                self.cache.set(key, cached)
+            return cached.to_response(), cached
+
+        entry = _CachedResponse.from_response(response)
+        if self.cache and entry.cacheable:
+            self.cache.set(key, entry)
+        return response, entry
+
+    @staticmethod
+    def _cache_key(
+        url: str, headers: dict[str, str] | None, cookies: dict[str, Any] | None
+    ) -> str:
+        request = json.dumps(
+            [url, sorted((headers or {}).items()), sorted((cookies or {}).items())],
+            default=str,
+        )
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = self._host_limits[host] = threading.BoundedSemaphore(
+                    self.per_host_limit
+                )
+            return limit
+
+
+_default_client: HTTPClient | None = None
+_default_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """Return the HTTP client shared by all tools, creating it on first use.
+
+    Responses are cached in the ``http_cache`` directory of the CrewAI
+    storage path.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            from crewai.utilities.paths import db_storage_path
+
+            _default_client = HTTPClient(
+                cache_dir=Path(db_storage_path()) / "http_cache"
+            )
+        return _default_client
@@ -1,8 +1,85 @@
-import re
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+
+class _SeparatorIndex:
+    """Offsets of separator occurrences in a text.
+
+    Each separator is located once over the whole text with vectorized
+    comparisons of its code points; any sub-range is then answered with a
+    binary search instead of rescanning the substring.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._codes: np.ndarray | None = None
+        self._occurrences: dict[str, np.ndarray] = {}
+
+    def find(self, separator: str, start: int, end: int) -> np.ndarray:
+        """Find the occurrences ``text[start:end].split(separator)`` splits at.
+
+        Args:
+            separator: Non-empty separator
+            start: Start offset of the range
+            end: End offset of the range
+
+        Returns:
+            Start offsets of the non-overlapping occurrences, left to right
+        """
+        occurrences = self._occurrences.get(separator)
+        if occurrences is None:
+            occurrences = self._locate(separator)
+            self._occurrences[separator] = occurrences
+
+        width = len(separator)
+        found = occurrences[
+            np.searchsorted(occurrences, start) : np.searchsorted(
+                occurrences, end - width, side="right"
+            )
+        ]
+        # Occurrences of a self-overlapping separator such as "\n\n" can
+        # overlap; str.split consumes them greedily from the left.
+        if len(found) > 1 and bool((np.diff(found) < width).any()):
+            kept = []
+            next_start = start
+            for offset in found.tolist():
+                if offset >= next_start:
+                    kept.append(offset)
+                    next_start = offset + width
+            found = np.array(kept, dtype=np.int64)
+        return found
+
+    def _locate(self, separator: str) -> np.ndarray:
+        if self._codes is None:
+            self._codes = np.frombuffer(
+                self.text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+            )
+        codes = self._codes
+        width = len(separator)
+        if width > len(codes):
+            return np.empty(0, dtype=np.int64)
+        candidates = len(codes) - width + 1
+        matches = codes[:candidates] == ord(separator[0])
+        for position in range(1, width):
+            matches &= codes[position : position + candidates] == ord(
+                separator[position]
+            )
+        return np.flatnonzero(matches).astype(np.int64)
 
 
 class RecursiveCharacterTextSplitter:
-    """A text splitter that recursively splits text based on a hierarchy of separators."""
+    """A text splitter that recursively splits text based on a hierarchy of separators.
+
+    Splits are tracked as offsets into the original text and merged with
+    prefix sums and binary search, so substrings are only copied when a chunk
+    is emitted. Sizes are measured in characters unless a length function,
+    such as a tokenizer's, is given.
+    """
 
     def __init__(
         self,
@@ -10,6 +87,7 @@ class RecursiveCharacterTextSplitter:
         chunk_overlap: int = 200,
         separators: list[str] | None = None,
         keep_separator: bool = True,
+        length_function: Callable[[str], int] | None = None,
     ) -> None:
         """Initialize the RecursiveCharacterTextSplitter.
 
@@ -18,6 +96,8 @@ class RecursiveCharacterTextSplitter:
             chunk_overlap: Number of characters to overlap between chunks
             separators: List of separators to use for splitting (in order of preference)
             keep_separator: Whether to keep the separator in the split text
+            length_function: Measures the size of a piece of text, e.g. in
+                tokens; sizes are in characters if None
         """
         if chunk_overlap >= chunk_size:
             raise ValueError(
@@ -27,6 +107,7 @@ class RecursiveCharacterTextSplitter:
         self._chunk_size = chunk_size
         self._chunk_overlap = chunk_overlap
         self._keep_separator = keep_separator
+        self._length_function = length_function
 
         self._separators = separators or [
             "\n\n",
@@ -35,6 +116,28 @@ class RecursiveCharacterTextSplitter:
             "",
         ]
 
+    @classmethod
+    def from_tiktoken_encoder(
+        cls, encoding_name: str = "cl100k_base", **kwargs: Any
+    ) -> RecursiveCharacterTextSplitter:
+        """Create a splitter that sizes chunks in tiktoken tokens.
+
+        Args:
+            encoding_name: Name of the tiktoken encoding
+            **kwargs: Arguments of the splitter; sizes are in tokens
+
+        Returns:
+            The splitter
+        """
+        import tiktoken
+
+        encoding = tiktoken.get_encoding(encoding_name)
+
+        def token_count(text: str) -> int:
+            return len(encoding.encode(text, disallowed_special=()))
+
+        return cls(length_function=token_count, **kwargs)
+
     def split_text(self, text: str) -> list[str]:
         """Split the input text into chunks.
 
@@ -44,112 +147,209 @@ class RecursiveCharacterTextSplitter:
         Returns:
             A list of text chunks.
         """
-        return self._split_text(text, self._separators)
+        return self._split_range(_SeparatorIndex(text), 0, len(text), self._separators)
 
-    def _split_text(self, text: str, separators: list[str]) -> list[str]:
+    def _split_range(
+        self, index: _SeparatorIndex, start: int, end: int, separators: list[str]
+    ) -> list[str]:
         separator = separators[-1]
-        new_separators = []
+        new_separators: list[str] = []
+        occurrences = None
 
         for i, sep in enumerate(separators):
             if sep == "":
                 separator = sep
                 break
-            if re.search(re.escape(sep), text):
+            found = index.find(sep, start, end)
+            if len(found):
                 separator = sep
                 new_separators = separators[i + 1 :]
+                occurrences = found
                 break
 
-        splits = self._split_text_with_separator(text, separator)
-
-        good_splits = []
-
-        for split in splits:
-            if len(split) < self._chunk_size:
-                good_splits.append(split)
-            else:
+        if separator == "" and self._length_function is None:
+            return self._split_characters(index.text, start, end)
+
+        starts, ends = self._split_offsets(start, end, separator, occurrences)
+        lengths = self._measure(index.text, starts, ends)
+
+        # Splits too large for a chunk are split further; the resulting
+        # chunks are kept as text and merged like the other splits.
+        oversized = np.flatnonzero(lengths >= self._chunk_size)
+        pieces: dict[int, str] = {}
+        if len(oversized):
+            parts_starts, parts_ends, parts_lengths = [], [], []
+            previous = merged_count = 0
+            for position in oversized.tolist():
+                parts_starts.append(starts[previous:position])
+                parts_ends.append(ends[previous:position])
+                parts_lengths.append(lengths[previous:position])
+                merged_count += position - previous
+                previous = position + 1
+                split_start, split_end = int(starts[position]), int(ends[position])
                 if new_separators:
-                    other_info = self._split_text(split, new_separators)
-                    good_splits.extend(other_info)
+                    docs = self._split_range(
+                        index, split_start, split_end, new_separators
+                    )
+                    pieces.update((merged_count + i, doc) for i, doc in enumerate(docs))
+                    missing = np.full(len(docs), -1, dtype=np.int64)
+                    parts_starts.append(missing)
+                    parts_ends.append(missing)
+                    parts_lengths.append(
+                        np.array([self._length(doc) for doc in docs], dtype=np.int64)
+                    )
+                    merged_count += len(docs)
                 else:
-                    good_splits.extend(self._split_by_characters(split))
-
-        return self._merge_splits(good_splits, separator)
+                    slice_starts = np.arange(
+                        split_start, split_end, self._chunk_size, dtype=np.int64
+                    )
+                    slice_ends = np.minimum(slice_starts + self._chunk_size, split_end)
+                    parts_starts.append(slice_starts)
+                    parts_ends.append(slice_ends)
+                    parts_lengths.append(
+                        self._measure(index.text, slice_starts, slice_ends)
+                    )
+                    merged_count += len(slice_starts)
+            parts_starts.append(starts[previous:])
+            parts_ends.append(ends[previous:])
+            parts_lengths.append(lengths[previous:])
+            starts = np.concatenate(parts_starts)
+            ends = np.concatenate(parts_ends)
+            lengths = np.concatenate(parts_lengths)
+
+        return self._merge_splits(index.text, starts, ends, lengths, pieces, separator)
+
+    def _split_characters(self, text: str, start: int, end: int) -> list[str]:
+        """Merge single-character splits, whose chunks are plain windows."""
+        docs = []
+        first, last = start, start + 1
+        while True:
+            last = max(first + self._chunk_size, last)
+            if last >= end:
+                break
+            docs.append(text[first:last])
+            first = min(max(last - self._chunk_overlap, first), last - 1)
+            last += 1
+        if first < end:
+            docs.append(text[first:end])
+        return docs
 
-    def _split_text_with_separator(self, text: str, separator: str) -> list[str]:
+    def _split_offsets(
+        self, start: int, end: int, separator: str, occurrences: np.ndarray | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Offsets of the splits of ``text[start:end]`` at the separator."""
         if separator == "":
-            return list(text)
-
-        if self._keep_separator and separator in text:
-            parts = text.split(separator)
-            splits = []
-
-            for i, part in enumerate(parts):
-                if i == 0:
-                    splits.append(part)
-                elif i == len(parts) - 1:
-                    if part:
-                        splits.append(separator + part)
-                else:
-                    if part:
-                        splits.append(separator + part)
-                    else:
-                        if splits:
-                            splits[-1] += separator
-
-            return [s for s in splits if s]
-        return text.split(separator)
-
-    def _split_by_characters(self, text: str) -> list[str]:
-        chunks = []
-        for i in range(0, len(text), self._chunk_size):
-            chunks.append(text[i : i + self._chunk_size])  # noqa: PERF401
-        return chunks
-
-    def _merge_splits(self, splits: list[str], separator: str) -> list[str]:
-        """Merge splits into chunks with proper overlap."""
-        docs: list[str] = []
-        current_doc: list[str] = []
-        total = 0
+            starts = np.arange(start, end, dtype=np.int64)
+            return starts, starts + 1
+        if occurrences is None:
+            return np.array([start], dtype=np.int64), np.array([end], dtype=np.int64)
+
+        width = len(separator)
+        if not self._keep_separator:
+            starts = np.concatenate(([start], occurrences + width))
+            ends = np.concatenate((occurrences, [end]))
+            return starts, ends
+
+        # Each non-empty part starts a split with its leading separator; a
+        # separator followed by an empty part joins the previous split, except
+        # a trailing one, which is dropped.
+        part_ends = np.concatenate((occurrences[1:], [end]))
+        non_empty = part_ends > occurrences + width
+        starts = np.concatenate(([start], occurrences[non_empty]))
+        final_end = end if non_empty[-1] else int(occurrences[-1])
+        ends = np.concatenate((starts[1:], [final_end]))
+        keep = ends > starts
+        return starts[keep], ends[keep]
+
+    def _length(self, text: str) -> int:
+        if self._length_function is None:
+            return len(text)
+        return self._length_function(text)
+
+    def _measure(self, text: str, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        if self._length_function is None:
+            lengths: np.ndarray = ends - starts
+            return lengths
+        return np.array(
+            [
+                self._length_function(text[start:end])
+                for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+            ],
+            dtype=np.int64,
+        )
 
-        for split in splits:
-            split_len = len(split)
+    def _merge_splits(
+        self,
+        text: str,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        lengths: np.ndarray,
+        pieces: dict[int, str],
+        separator: str,
+    ) -> list[str]:
+        """Merge splits into chunks with proper overlap.
+
+        A chunk spans the splits ``[first, last)``. Its size is the sum of
+        their lengths plus one separator between each pair, so with
+        ``bounds[k]`` the size of the first ``k`` splits each followed by a
+        separator, both the end of a chunk and the start of the overlap kept
+        for the next one are found by binary search.
+        """
+        count = len(lengths)
+        if not count:
+            return []
 
-            if total + split_len > self._chunk_size and current_doc:
-                if separator == "":
-                    doc = "".join(current_doc)
-                else:
-                    if self._keep_separator and separator == " ":
-                        doc = "".join(current_doc)
-                    else:
-                        doc = separator.join(current_doc)
-
-                if doc:
-                    docs.append(doc)
-
-                # Handle overlap by keeping some of the previous content
-                while total > self._chunk_overlap and len(current_doc) > 1:
-                    removed = current_doc.pop(0)
-                    total -= len(removed)
-                    if separator != "":
-                        total -= len(separator)
-
-            current_doc.append(split)
-            total += split_len
-            if separator != "" and len(current_doc) > 1:
-                total += len(separator)
-
-        if current_doc:
-            if separator == "":
-                doc = "".join(current_doc)
-            else:
-                if self._keep_separator and separator == " ":
-                    doc = "".join(current_doc)
-                else:
-                    doc = separator.join(current_doc)
+        separator_length = self._length(separator) if separator else 0
+        if separator == "" or (self._keep_separator and separator == " "):
+            joiner = ""
+        else:
+            joiner = separator
+        bounds = np.concatenate(([0], np.cumsum(lengths + separator_length))).tolist()
+
+        # A chunk can be sliced from the text when its splits are consecutive
+        # ranges with exactly the joiner between them.
+        gaps = starts[1:] - ends[:-1]
+        breaks = (gaps != len(joiner)) | (starts[1:] < 0) | (starts[:-1] < 0)
+        breaks_before = np.concatenate(([0], np.cumsum(breaks))).tolist()
+        split_starts = starts.tolist()
+        split_ends = ends.tolist()
+
+        def join(first: int, last: int) -> str:
+            if (
+                split_starts[first] >= 0
+                and breaks_before[last - 1] == breaks_before[first]
+            ):
+                return text[split_starts[first] : split_ends[last - 1]]
+            return joiner.join(
+                pieces[k]
+                if split_starts[k] < 0
+                else text[split_starts[k] : split_ends[k]]
+                for k in range(first, last)
+            )
 
+        docs: list[str] = []
+        first, last = 0, 1
+        while True:
+            # The first split that no longer fits in the chunk.
+            limit = bounds[first] + 2 * separator_length + self._chunk_size
+            last = max(bisect_right(bounds, limit) - 1, last)
+            if last >= count:
+                break
+
+            doc = join(first, last)
             if doc:
                 docs.append(doc)
 
+            # Handle overlap by keeping some of the previous content
+            overlap_start = bisect_left(
+                bounds, bounds[last] - separator_length - self._chunk_overlap
+            )
+            first = min(max(overlap_start, first), last - 1)
+            last += 1
+
+        doc = join(first, count)
+        if doc:
+            docs.append(doc)
         return docs
 
 
@@ -160,6 +360,7 @@ class BaseChunker:
         chunk_overlap: int = 200,
         separators: list[str] | None = None,
         keep_separator: bool = True,
+        length_function: Callable[[str], int] | None = None,
     ) -> None:
         """Initialize the Chunker.
 
@@ -168,12 +369,15 @@ class BaseChunker:
             chunk_overlap: Number of characters to overlap between chunks
             separators: List of separators to use for splitting
             keep_separator: Whether to keep separators in the chunks
+            length_function: Measures chunk sizes, e.g. in tokens; sizes are
+                in characters if None
         """
         self._splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             separators=separators,
             keep_separator=keep_separator,
+            length_function=length_function,
         )
 
     def chunk(self, text: str) -> list[str]:
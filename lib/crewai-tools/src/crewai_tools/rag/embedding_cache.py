@@ -0,0 +1,188 @@
+"""Content-addressed cache for embedding vectors.
+
+Vectors are keyed by the embedding provider, model and the SHA-256 of the
+embedded text, so identical chunks are embedded once no matter which
+document or collection they come from. Entries live in an in-memory LRU and,
+optionally, in a SQLite file that survives restarts. Vectors are stored as
+float32 numpy blobs, the precision vector stores index them with.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any
+
+import numpy as np
+
+from crewai_tools.rag.misc import compute_sha256
+
+
+DEFAULT_EMBEDDING_CACHE_SIZE = 10_000
+
+
+def embedding_cache_key(namespace: str, text: str) -> str:
+    """
+    Build the cache key of a text.
+
+    Args:
+        namespace: Provider and model, e.g. ``openai:text-embedding-3-small``
+        text: Text that is embedded
+
+    Returns:
+        The cache key
+    """
+    return f"{namespace}:{compute_sha256(text)}"
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of embedding vectors with an optional SQLite store."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
+        path: str | Path | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of vectors kept in memory
+            path: SQLite file for the persistent store; in-memory only if None
+        """
+        self.max_size = max_size
+        self.path = str(path) if path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, list[float]]:
+        """
+        Look up vectors.
+
+        Args:
+            keys: Keys from ``embedding_cache_key``
+
+        Returns:
+            The cached vectors by key; missing keys are left out
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            missing = []
+            for key in unique_keys:
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(key)
+                    continue
+                self._memory.move_to_end(key)
+                found[key] = vector.tolist()
+
+            if missing and self._db is not None:
+                for start in range(0, len(missing), 500):
+                    batch = missing[start : start + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = self._db.execute(
+                        "SELECT key, vector FROM embeddings "  # noqa: S608
+                        f"WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32)
+                        self._remember(key, vector)
+                        found[key] = vector.tolist()
+
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+        return found
+
+    def set_many(self, items: Mapping[str, Sequence[float] | np.ndarray]) -> None:
+        """
+        Store vectors.
+
+        Args:
+            items: Vectors by key
+        """
+        if not items:
+            return
+        vectors = {
+            key: np.asarray(vector, dtype=np.float32) for key, vector in items.items()
+        }
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+            if self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in vectors.items()],
+                )
+                self._db.commit()
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit and miss counters and the in-memory size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._memory),
+            }
+
+    def clear(self) -> None:
+        """Drop every vector, including the persistent store, and reset counters."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.misses = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM embeddings")
+                self._db.commit()
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+
+_caches: dict[str | None, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(
+    path: str | Path | None = None, max_size: int = DEFAULT_EMBEDDING_CACHE_SIZE
+) -> EmbeddingCache:
+    """
+    Return the process-wide cache for a storage path.
+
+    Services using the same path share one cache, so vectors embedded for one
+    collection are reused by the others.
+
+    Args:
+        path: SQLite file for the persistent store; in-memory only if None
+        max_size: Maximum number of vectors kept in memory, used when the
+            cache is first created
+
+    Returns:
+        The shared cache
+    """
+    key = os.path.abspath(path) if path is not None else None
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = EmbeddingCache(max_size=max_size, path=key)
+            _caches[key] = cache
+        return cache
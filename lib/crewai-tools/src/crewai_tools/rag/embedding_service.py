@@ -5,12 +5,21 @@ This replaces the litellm-based EmbeddingService with a more flexible architectu
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
 import os
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from crewai_tools.rag.embedding_cache import (
+    DEFAULT_EMBEDDING_CACHE_SIZE,
+    EmbeddingCache,
+    embedding_cache_key,
+    get_embedding_cache,
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +37,20 @@ class EmbeddingConfig(BaseModel):
     batch_size: int = Field(
         default=100, description="Batch size for processing multiple texts"
     )
+    max_concurrency: int = Field(
+        default=4, ge=1, description="Maximum number of batches embedded at once"
+    )
+    cache: bool = Field(
+        default=True, description="Reuse embeddings of texts embedded before"
+    )
+    cache_path: str | None = Field(
+        default=None,
+        description="SQLite file that persists cached embeddings across restarts",
+    )
+    cache_size: int = Field(
+        default=DEFAULT_EMBEDDING_CACHE_SIZE,
+        description="Maximum number of embeddings cached in memory",
+    )
     extra_config: dict[str, Any] = Field(
         default_factory=dict, description="Additional provider-specific configuration"
     )
@@ -83,6 +106,12 @@ class EmbeddingService:
 
         self._embedding_function = None
         self._initialize_embedding_function()
+        self._cache_namespace = self._build_cache_namespace()
+        self._cache: EmbeddingCache | None = (
+            get_embedding_cache(self.config.cache_path, self.config.cache_size)
+            if self.config.cache and self._cache_namespace is not None
+            else None
+        )
 
     @staticmethod
     def _get_default_api_key(provider: str) -> str | None:
@@ -244,12 +273,32 @@ class EmbeddingService:
 
         return base_config
 
-    def embed_text(self, text: str) -> list[float]:
+    def _build_cache_namespace(self) -> str | None:
+        """
+        Identify the provider, model and output-affecting options for cache keys.
+
+        Returns:
+            The namespace, or None if the embeddings cannot be safely identified
+            (custom callables or options that are not JSON serializable)
+        """
+        if self.config.provider == "custom":
+            return None
+        namespace = f"{self.config.provider}:{self.config.model}"
+        if not self.config.extra_config:
+            return namespace
+        try:
+            options = json.dumps(self.config.extra_config, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return f"{namespace}:{options}"
+
+    def embed_text(self, text: str, use_cache: bool = True) -> list[float]:
         """
         Generate embedding for a single text.
 
         Args:
             text: Text to embed
+            use_cache: Whether a cached embedding may be returned
 
         Returns:
             List of floats representing the embedding
@@ -261,19 +310,34 @@ class EmbeddingService:
             logger.warning("Empty text provided for embedding")
             return []
 
+        cache = self._cache if use_cache else None
+        if cache is not None:
+            key = embedding_cache_key(self._cache_namespace or "", text)
+            if cached := cache.get_many([key]).get(key):
+                return cached
+
         try:
             # Use ChromaDB's embedding function interface
             embeddings = self._embedding_function([text])  # type: ignore
-            return embeddings[0] if embeddings else []
-
         except Exception as e:
             logger.error(f"Error generating embedding for text: {e}")
             raise RuntimeError(f"Failed to generate embedding: {e}") from e
 
+        if not embeddings:
+            return []
+        embedding: list[float] = embeddings[0]
+        if cache is not None:
+            cache.set_many({key: embedding})
+        return embedding
+
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """
         Generate embeddings for multiple texts.
 
+        Cached embeddings are reused; the remaining unique texts are split into
+        batches of ``batch_size`` and up to ``max_concurrency`` batches are
+        embedded at once.
+
         Args:
             texts: List of texts to embed
 
@@ -292,21 +356,42 @@ class EmbeddingService:
             logger.warning("No valid texts provided for batch embedding")
             return []
 
+        namespace = self._cache_namespace or ""
+        keys = {text: embedding_cache_key(namespace, text) for text in valid_texts}
+        cached = self._cache.get_many(keys.values()) if self._cache else {}
+        pending = [text for text in keys if keys[text] not in cached]
+
         try:
             # Process in batches to avoid API limits
-            all_embeddings = []
-
-            for i in range(0, len(valid_texts), self.config.batch_size):
-                batch = valid_texts[i : i + self.config.batch_size]
-                batch_embeddings = self._embedding_function(batch)  # type: ignore
-                all_embeddings.extend(batch_embeddings)
-
-            return all_embeddings
-
+            batches = [
+                pending[i : i + self.config.batch_size]
+                for i in range(0, len(pending), self.config.batch_size)
+            ]
+            if len(batches) > 1 and self.config.max_concurrency > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.config.max_concurrency, len(batches))
+                ) as executor:
+                    results = list(executor.map(self._embedding_function, batches))  # type: ignore[arg-type]
+            else:
+                results = [self._embedding_function(batch) for batch in batches]  # type: ignore[misc]
+
+            embedded = {
+                text: embedding
+                for batch, batch_embeddings in zip(batches, results, strict=True)
+                for text, embedding in zip(batch, batch_embeddings, strict=True)
+            }
         except Exception as e:
             logger.error(f"Error generating batch embeddings: {e}")
             raise RuntimeError(f"Failed to generate batch embeddings: {e}") from e
 
+        if self._cache is not None:
+            self._cache.set_many({keys[text]: embedded[text] for text in embedded})
+
+        return [
+            embedded[text] if text in embedded else cached[keys[text]]
+            for text in valid_texts
+        ]
+
     def get_embedding_dimension(self) -> int | None:
         """
         Get the dimension of embeddings produced by this service.
@@ -330,7 +415,7 @@ class EmbeddingService:
             True if the service is working, False otherwise
         """
         try:
-            test_embedding = self.embed_text("test connection")
+            test_embedding = self.embed_text("test connection", use_cache=False)
             return len(test_embedding) > 0
         except Exception as e:
             logger.error(f"Connection validation failed: {e}")
@@ -1,6 +1,7 @@
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-import requests
+
+from crewai_tools.http_client import get_http_client
 
 
 class JinaScrapeWebsiteToolInput(BaseModel):
@@ -43,7 +44,7 @@ class JinaScrapeWebsiteTool(BaseTool):
                 "Website URL must be provided either during initialization or execution"
             )
 
-        response = requests.get(
+        response = get_http_client().get(
             f"https://r.jina.ai/{url}", headers=self.headers, timeout=15
         )
         response.raise_for_status()
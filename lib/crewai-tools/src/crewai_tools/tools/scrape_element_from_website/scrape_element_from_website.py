@@ -3,7 +3,8 @@ from typing import Any
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-import requests
+
+from crewai_tools.http_client import get_http_client
 
 
 try:
@@ -81,7 +82,7 @@ class ScrapeElementFromWebsiteTool(BaseTool):
         if website_url is None or css_element is None:
             raise ValueError("Both website_url and css_element must be provided.")
 
-        page = requests.get(
+        page = get_http_client().get(
             website_url,
             headers=self.headers,
             cookies=self.cookies if self.cookies else {},
@@ -1,19 +1,15 @@
 import os
-import re
 from typing import Any
 
-from pydantic import Field
-import requests
-
-
-try:
-    from bs4 import BeautifulSoup
-
-    BEAUTIFULSOUP_AVAILABLE = True
-except ImportError:
-    BEAUTIFULSOUP_AVAILABLE = False
 from crewai.tools import BaseTool
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from crewai_tools.html_extraction import (
+    DEFAULT_CHUNK_SIZE,
+    extract_text,
+    get_html_extractor,
+)
+from crewai_tools.http_client import get_http_client
 
 
 class FixedScrapeWebsiteToolSchema(BaseModel):
@@ -42,6 +38,10 @@ class ScrapeWebsiteTool(BaseTool):
             "Upgrade-Insecure-Requests": "1",
         }
     )
+    # None picks the fastest installed backend, see crewai_tools.html_extraction.
+    extractor: str | None = None
+    remove_boilerplate: bool = True
+    max_content_length: int | None = None
 
     def __init__(
         self,
@@ -50,10 +50,8 @@ class ScrapeWebsiteTool(BaseTool):
         **kwargs,
     ):
         super().__init__(**kwargs)
-        if not BEAUTIFULSOUP_AVAILABLE:
-            raise ImportError(
-                "beautifulsoup4 is not installed. Please install it with `pip install crewai-tools[beautifulsoup4]`"
-            )
+        # Fail at construction if the requested backend is not installed.
+        get_html_extractor(self.extractor)
 
         if website_url is not None:
             self.website_url = website_url
@@ -73,7 +71,7 @@ class ScrapeWebsiteTool(BaseTool):
         if website_url is None:
             raise ValueError("Website URL must be provided.")
 
-        page = requests.get(
+        page = get_http_client().get(
             website_url,
             timeout=15,
             headers=self.headers,
@@ -81,9 +79,10 @@ class ScrapeWebsiteTool(BaseTool):
         )
 
         page.encoding = page.apparent_encoding
-        parsed = BeautifulSoup(page.text, "html.parser")
-
-        text = "The following text is scraped website content:\n\n"
-        text += parsed.get_text(" ")
-        text = re.sub("[ \t]+", " ", text)
-        return re.sub("\\s+\n\\s+", "\n", text)
+        text = extract_text(
+            page.iter_content(DEFAULT_CHUNK_SIZE, decode_unicode=True),
+            extractor=self.extractor,
+            remove_boilerplate=self.remove_boilerplate,
+            max_chars=self.max_content_length,
+        )
+        return "The following text is scraped website content:\n\n" + text
@@ -5,6 +5,8 @@ from crewai.tools import BaseTool, EnvVar
 from pydantic import BaseModel, Field
 import requests
 
+from crewai_tools.http_client import get_http_client
+
 
 class SerperScrapeWebsiteInput(BaseModel):
     """Input schema for SerperScrapeWebsite."""
@@ -56,7 +58,7 @@ class SerperScrapeWebsiteTool(BaseTool):
             headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
 
             # Make the API request
-            response = requests.post(
+            response = get_http_client().post(
                 api_url,
                 headers=headers,
                 data=payload,
@@ -0,0 +1,184 @@
+from pathlib import Path
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from crewai_tools.html_extraction import (
+    TRUNCATION_NOTICE,
+    BeautifulSoupExtractor,
+    available_html_extractors,
+    extract_text,
+    get_html_extractor,
+)
+from crewai_tools.tools.scrape_website_tool.scrape_website_tool import (
+    ScrapeWebsiteTool,
+)
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+# Text each saved page must yield, and boilerplate it must not.
+CORPUS = {
+    "blog_article.html": (
+        [
+            "Scaling Agent Crews in Production",
+            "Measure before you tune",
+            "The cheapest token is the one you never send.",
+            "We will cover retries and back-off in the next post.",
+        ],
+        ["gtag", "font-family", "Careers", "Related posts", "All rights reserved"],
+    ),
+    "docs_page.html": (
+        [
+            "Configuration reference",
+            "request_timeout 15 Seconds to wait for a response.",
+            "max_retries = 5",
+            "Unknown keys are ignored with a warning.",
+        ],
+        ["Quickstart", "icon sprite", "Copy", "DOCUMENTATION_OPTIONS", "Last updated"],
+    ),
+    "latin1_listing.html": (
+        [
+            "Les meilleurs cafés de la ville",
+            "Café du Quai",
+            "thés et pâtisseries",
+        ],
+        ["ads", "Plan du site", "Tous droits réservés"],
+    ),
+}
+
+
+def load_fixture(name):
+    response = requests.Response()
+    response._content = (FIXTURES / name).read_bytes()
+    response.encoding = response.apparent_encoding
+    return response
+
+
+@pytest.fixture(params=available_html_extractors())
+def extractor(request):
+    return request.param
+
+
+@pytest.mark.parametrize("name", sorted(CORPUS))
+def test_extracts_content_without_boilerplate(extractor, name):
+    expected, unexpected = CORPUS[name]
+
+    text = extract_text(load_fixture(name).text, extractor=extractor)
+
+    for snippet in expected:
+        assert snippet in text
+    for snippet in unexpected:
+        assert snippet not in text
+
+
+@pytest.mark.parametrize("name", sorted(CORPUS))
+def test_backends_agree_with_html_parser(name):
+    html = load_fixture(name).text
+    reference = extract_text(html, extractor="html.parser")
+
+    for backend in available_html_extractors():
+        assert extract_text(html, extractor=backend) == reference
+
+
+def test_streamed_chunks_match_whole_document(extractor):
+    response = load_fixture("latin1_listing.html")
+
+    streamed = extract_text(
+        response.iter_content(64, decode_unicode=True), extractor=extractor
+    )
+
+    assert streamed == extract_text(response.text, extractor=extractor)
+
+
+def test_boilerplate_is_kept_when_disabled(extractor):
+    html = load_fixture("blog_article.html").text
+
+    text = extract_text(html, extractor=extractor, remove_boilerplate=False)
+
+    assert "Careers" in text
+    assert "Related posts" in text
+    assert "gtag" not in text
+
+
+def test_output_is_capped(extractor):
+    html = load_fixture("blog_article.html").text
+
+    text = extract_text(html, extractor=extractor, max_chars=100)
+
+    assert text.endswith(TRUNCATION_NOTICE)
+    assert len(text) <= 100 + len(TRUNCATION_NOTICE)
+    assert text.startswith("Scaling Agent Crews in Production")
+
+
+def test_streaming_parse_stops_once_the_cap_is_reached():
+    html = "<p>Lorem ipsum dolor sit amet.</p>\n" * 20_000
+    consumed = []
+
+    def chunks():
+        for start in range(0, len(html), 1024):
+            consumed.append(start)
+            yield html[start : start + 1024]
+
+    text = extract_text(chunks(), extractor="lxml", max_chars=500)
+
+    assert text.endswith(TRUNCATION_NOTICE)
+    assert len(consumed) < 5
+
+
+def test_empty_document():
+    assert extract_text("", extractor="lxml") == ""
+    assert extract_text(b"", extractor="html.parser") == ""
+
+
+def test_unknown_extractor_is_rejected():
+    with pytest.raises(ValueError, match="Unknown HTML extractor"):
+        get_html_extractor("regex")
+
+
+def test_missing_backend_raises_import_error():
+    with patch.object(BeautifulSoupExtractor, "is_available", return_value=False):
+        with pytest.raises(ImportError, match="bs4"):
+            get_html_extractor("html.parser")
+
+
+def test_fastest_installed_backend_is_the_default():
+    assert get_html_extractor().name == available_html_extractors()[0]
+
+
+def test_scrape_website_tool_extracts_and_caps_text():
+    client = MagicMock()
+    client.get.return_value = load_fixture("blog_article.html")
+
+    with patch(
+        "crewai_tools.tools.scrape_website_tool.scrape_website_tool.get_http_client",
+        return_value=client,
+    ):
+        text = ScrapeWebsiteTool(max_content_length=200).run(
+            website_url="https://example.com/blog"
+        )
+
+    assert text.startswith(
+        "The following text is scraped website content:\n\n"
+        "Scaling Agent Crews in Production"
+    )
+    assert "gtag" not in text
+    assert text.endswith(TRUNCATION_NOTICE)
+
+
+def test_fast_backends_outperform_html_parser_on_fixture_corpus():
+    # Each saved page is repeated to the size of a long article.
+    corpus = [load_fixture(name).text * 50 for name in sorted(CORPUS)]
+
+    def benchmark(backend):
+        started = time.perf_counter()
+        for html in corpus:
+            extract_text(html, extractor=backend)
+        return time.perf_counter() - started
+
+    baseline = benchmark("html.parser")
+    for backend in available_html_extractors():
+        if backend != "html.parser":
+            assert benchmark(backend) < baseline
@@ -0,0 +1,171 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from crewai_tools.http_client import HTTPCache, HTTPClient, _CachedResponse
+from crewai_tools.tools.scrape_website_tool.scrape_website_tool import (
+    ScrapeWebsiteTool,
+)
+
+
+# The tests talk to a local server only.
+pytestmark = pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+
+
+class Origin:
+    """Records the requests the test server receives."""
+
+    def __init__(self):
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+        self.delay = 0.0
+        self.lock = threading.Lock()
+
+
+@pytest.fixture
+def origin():
+    state = Origin()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with state.lock:
+                state.requests.append((self.path, dict(self.headers)))
+                state.active += 1
+                state.peak = max(state.peak, state.active)
+            time.sleep(state.delay)
+            with state.lock:
+                state.active -= 1
+
+            if self.path == "/etag" and self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                return
+
+            body = b"<html><body><p>Hello   world</p></body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            if self.path == "/etag":
+                self.send_header("ETag", '"v1"')
+            elif self.path == "/fresh":
+                self.send_header("Cache-Control", "max-age=60")
+            elif self.path == "/no-store":
+                self.send_header("ETag", '"v1"')
+                self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_port}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(tmp_path):
+    return HTTPClient(cache_dir=tmp_path / "http_cache", per_host_limit=2)
+
+
+def test_etag_responses_are_revalidated(origin, client):
+    first = client.get(f"{origin.url}/etag")
+    second = client.get(f"{origin.url}/etag")
+
+    assert second.text == first.text
+    assert second.status_code == 200
+    assert getattr(second, "from_cache", False)
+    assert origin.requests[1][1]["If-None-Match"] == '"v1"'
+
+
+def test_fresh_responses_are_served_without_a_request(origin, client):
+    client.get(f"{origin.url}/fresh")
+    response = client.get(f"{origin.url}/fresh")
+
+    assert "Hello" in response.text
+    assert len(origin.requests) == 1
+
+
+def test_no_store_responses_are_not_cached(origin, client):
+    client.get(f"{origin.url}/no-store")
+    client.get(f"{origin.url}/no-store")
+
+    assert all("If-None-Match" not in headers for _, headers in origin.requests)
+
+
+def test_concurrent_fetches_of_one_url_share_a_request(origin, client):
+    origin.delay = 0.2
+    results = []
+
+    def fetch():
+        results.append(client.get(f"{origin.url}/plain").text)
+
+    threads = [threading.Thread(target=fetch) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4
+    assert len(set(results)) == 1
+    assert len(origin.requests) == 1
+
+
+def test_requests_per_host_are_limited(origin, client):
+    origin.delay = 0.1
+    threads = [
+        threading.Thread(target=client.get, args=(f"{origin.url}/page{i}",))
+        for i in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(origin.requests) == 5
+    assert origin.peak == 2
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = HTTPCache(tmp_path, max_bytes=10_000)
+
+    def entry(size):
+        return _CachedResponse(
+            url="http://example.com",
+            status_code=200,
+            headers={"ETag": '"x"'},
+            content=b"x" * size,
+            stored_at=time.time(),
+        )
+
+    cache.set("old", entry(200))
+    cache.max_bytes = 2 * (tmp_path / "old.http").stat().st_size
+    cache.set("new", entry(200))
+    cache.set("newest", entry(200))
+
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+    assert cache.get("newest").content == b"x" * 200
+
+
+def test_scrape_website_tool_uses_shared_client(origin, client):
+    with patch(
+        "crewai_tools.tools.scrape_website_tool.scrape_website_tool.get_http_client",
+        return_value=client,
+    ):
+        tool = ScrapeWebsiteTool()
+        first = tool.run(website_url=f"{origin.url}/etag")
+        second = tool.run(website_url=f"{origin.url}/etag")
+
+    assert "Hello world" in first
+    assert second == first
+    assert len(origin.requests) == 2
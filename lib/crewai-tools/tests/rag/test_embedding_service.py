@@ -3,9 +3,12 @@ Tests for the enhanced embedding service.
 """
 
 import os
+import threading
+import time
 import pytest
 from unittest.mock import Mock, patch
 
+from crewai_tools.rag.embedding_cache import EmbeddingCache, embedding_cache_key
 from crewai_tools.rag.embedding_service import EmbeddingService, EmbeddingConfig
 
 
@@ -340,3 +343,102 @@ class TestProviderConfigurations:
         assert call_args["provider"] == "google-generativeai"
         assert call_args["config"]["api_key"] == "test-key"
         assert call_args["config"]["model_name"] == "models/embedding-001"
+
+
+class RecordingEmbedder:
+    """Embedding function that records calls and peak concurrency."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self._lock:
+            self.calls.append(list(texts))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return [[float(len(text)), 0.5] for text in texts]
+
+
+class TestEmbeddingCache:
+    """Test embedding reuse and concurrent batch dispatch."""
+
+    def _service(self, embedder, tmp_path, **kwargs):
+        with patch(
+            "crewai.rag.embeddings.factory.build_embedder", return_value=embedder
+        ):
+            return EmbeddingService(
+                provider="openai",
+                model="test-model",
+                api_key="test-key",
+                cache_path=str(tmp_path / "embeddings.db"),
+                **kwargs,
+            )
+
+    def test_repeated_and_duplicate_texts_are_embedded_once(self, tmp_path):
+        embedder = RecordingEmbedder()
+        service = self._service(embedder, tmp_path)
+
+        first = service.embed_batch(["alpha", "beta", "alpha"])
+        second = service.embed_batch(["beta", "gamma"])
+
+        assert first == [[5.0, 0.5], [4.0, 0.5], [5.0, 0.5]]
+        assert second == [[4.0, 0.5], [5.0, 0.5]]
+        assert embedder.calls == [["alpha", "beta"], ["gamma"]]
+
+    def test_query_embeddings_are_reused(self, tmp_path):
+        embedder = RecordingEmbedder()
+        service = self._service(embedder, tmp_path)
+
+        assert service.embed_text("question") == service.embed_text("question")
+        assert len(embedder.calls) == 1
+
+    def test_embeddings_persist_across_restarts(self, tmp_path):
+        embedder = RecordingEmbedder()
+        service = self._service(embedder, tmp_path)
+        service.embed_batch(["alpha"])
+
+        restarted = EmbeddingCache(path=tmp_path / "embeddings.db")
+        key = embedding_cache_key("openai:test-model", "alpha")
+
+        assert restarted.get_many([key]) == {key: [5.0, 0.5]}
+
+    def test_batches_are_embedded_concurrently_in_order(self, tmp_path):
+        embedder = RecordingEmbedder(delay=0.05)
+        service = self._service(embedder, tmp_path, batch_size=2, max_concurrency=3)
+        texts = [f"text {'x' * i}" for i in range(6)]
+
+        result = service.embed_batch(texts)
+
+        assert result == [[float(len(text)), 0.5] for text in texts]
+        assert len(embedder.calls) == 3
+        assert embedder.peak == 3
+
+    def test_custom_embedders_are_not_cached(self, tmp_path):
+        embedder = RecordingEmbedder()
+        with patch(
+            "crewai.rag.embeddings.factory.build_embedder", return_value=embedder
+        ):
+            service = EmbeddingService.create_custom_service(
+                embedding_callable=embedder
+            )
+
+        service.embed_text("question")
+        service.embed_text("question")
+
+        assert len(embedder.calls) == 2
+
+    def test_validate_connection_bypasses_cache(self, tmp_path):
+        embedder = RecordingEmbedder()
+        service = self._service(embedder, tmp_path)
+
+        service.validate_connection()
+        service.validate_connection()
+
+        assert len(embedder.calls) == 2
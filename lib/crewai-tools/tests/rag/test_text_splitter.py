@@ -0,0 +1,308 @@
+"""
+Tests for the offset-based RecursiveCharacterTextSplitter.
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+from crewai_tools.rag.chunkers.base_chunker import (
+    BaseChunker,
+    RecursiveCharacterTextSplitter,
+)
+from crewai_tools.rag.chunkers.text_chunker import MdxChunker, TextChunker
+
+
+class LegacySplitter:
+    """The previous string-based splitter, the reference for character mode."""
+
+    def __init__(
+        self,
+        chunk_size: int = 4000,
+        chunk_overlap: int = 200,
+        separators: list[str] | None = None,
+        keep_separator: bool = True,
+    ) -> None:
+        if chunk_overlap >= chunk_size:
+            raise ValueError(
+                f"Chunk overlap ({chunk_overlap}) cannot be >= chunk size ({chunk_size})"
+            )
+
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+        self._keep_separator = keep_separator
+
+        self._separators = separators or [
+            "\n\n",
+            "\n",
+            " ",
+            "",
+        ]
+
+    def split_text(self, text: str) -> list[str]:
+        return self._split_text(text, self._separators)
+
+    def _split_text(self, text: str, separators: list[str]) -> list[str]:
+        separator = separators[-1]
+        new_separators = []
+
+        for i, sep in enumerate(separators):
+            if sep == "":
+                separator = sep
+                break
+            if re.search(re.escape(sep), text):
+                separator = sep
+                new_separators = separators[i + 1 :]
+                break
+
+        splits = self._split_text_with_separator(text, separator)
+
+        good_splits = []
+
+        for split in splits:
+            if len(split) < self._chunk_size:
+                good_splits.append(split)
+            else:
+                if new_separators:
+                    other_info = self._split_text(split, new_separators)
+                    good_splits.extend(other_info)
+                else:
+                    good_splits.extend(self._split_by_characters(split))
+
+        return self._merge_splits(good_splits, separator)
+
+    def _split_text_with_separator(self, text: str, separator: str) -> list[str]:
+        if separator == "":
+            return list(text)
+
+        if self._keep_separator and separator in text:
+            parts = text.split(separator)
+            splits = []
+
+            for i, part in enumerate(parts):
+                if i == 0:
+                    splits.append(part)
+                elif i == len(parts) - 1:
+                    if part:
+                        splits.append(separator + part)
+                else:
+                    if part:
+                        splits.append(separator + part)
+                    else:
+                        if splits:
+                            splits[-1] += separator
+
+            return [s for s in splits if s]
+        return text.split(separator)
+
+    def _split_by_characters(self, text: str) -> list[str]:
+        chunks = []
+        for i in range(0, len(text), self._chunk_size):
+            chunks.append(text[i : i + self._chunk_size])
+        return chunks
+
+    def _merge_splits(self, splits: list[str], separator: str) -> list[str]:
+        docs: list[str] = []
+        current_doc: list[str] = []
+        total = 0
+
+        for split in splits:
+            split_len = len(split)
+
+            if total + split_len > self._chunk_size and current_doc:
+                if separator == "":
+                    doc = "".join(current_doc)
+                else:
+                    if self._keep_separator and separator == " ":
+                        doc = "".join(current_doc)
+                    else:
+                        doc = separator.join(current_doc)
+
+                if doc:
+                    docs.append(doc)
+
+                # Handle overlap by keeping some of the previous content
+                while total > self._chunk_overlap and len(current_doc) > 1:
+                    removed = current_doc.pop(0)
+                    total -= len(removed)
+                    if separator != "":
+                        total -= len(separator)
+
+            current_doc.append(split)
+            total += split_len
+            if separator != "" and len(current_doc) > 1:
+                total += len(separator)
+
+        if current_doc:
+            if separator == "":
+                doc = "".join(current_doc)
+            else:
+                if self._keep_separator and separator == " ":
+                    doc = "".join(current_doc)
+                else:
+                    doc = separator.join(current_doc)
+
+            if doc:
+                docs.append(doc)
+
+        return docs
+
+
+SEPARATOR_SETS = [
+    None,
+    ["\n\n\n", "\n\n", "\n", ". ", "! ", "? ", "; ", ", ", " ", ""],
+    ["\n## ", "\n\n", "\n```", "\n", " ", ""],
+    ["\n\n", "\n", " "],
+    ["aa", "a", ""],
+    ["|"],
+]
+
+
+def random_text(rng, size):
+    alphabet = ["a", "b", " ", " ", "\n", "\n\n", "\n\n\n", ". ", ", ", "aa", "|"]
+    words = []
+    while sum(map(len, words)) < size:
+        if rng.random() < 0.02:
+            words.append("x" * rng.randint(20, 200))
+        else:
+            words.append(rng.choice(alphabet) * rng.randint(1, 3))
+    return "".join(words)[:size]
+
+
+def sample_document(paragraphs):
+    rng = random.Random(7)
+    words = ["agent", "crew", "task", "tool", "memory", "knowledge", "flow", "llm"]
+    blocks = []
+    for i in range(paragraphs):
+        if i % 25 == 0:
+            blocks.append(f"## Section {i}")
+        sentence_count = rng.randint(1, 8)
+        sentences = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(4, 20))) + "."
+            for _ in range(sentence_count)
+        ]
+        blocks.append("\n".join(sentences) if i % 7 == 0 else " ".join(sentences))
+        if i % 50 == 0:
+            blocks.append("A" * 3000)
+    return "\n\n".join(blocks)
+
+
+class TestCharacterMode:
+    @pytest.mark.parametrize("separators", SEPARATOR_SETS)
+    @pytest.mark.parametrize("keep_separator", [True, False])
+    def test_matches_previous_splitter_on_random_text(
+        self, separators, keep_separator
+    ):
+        rng = random.Random(hash((str(separators), keep_separator)) & 0xFFFF)
+        for _ in range(150):
+            chunk_size = rng.randint(1, 60)
+            chunk_overlap = rng.randint(0, chunk_size - 1)
+            text = random_text(rng, rng.randint(0, 400))
+            kwargs = {
+                "chunk_size": chunk_size,
+                "chunk_overlap": chunk_overlap,
+                "separators": separators,
+                "keep_separator": keep_separator,
+            }
+
+            expected = LegacySplitter(**kwargs).split_text(text)
+            actual = RecursiveCharacterTextSplitter(**kwargs).split_text(text)
+
+            assert actual == expected, kwargs
+
+    @pytest.mark.parametrize("chunker_class", [BaseChunker, TextChunker, MdxChunker])
+    def test_matches_previous_splitter_on_a_document(self, chunker_class):
+        text = sample_document(200)
+        chunker = chunker_class()
+        splitter = chunker._splitter
+        legacy = LegacySplitter(
+            chunk_size=splitter._chunk_size,
+            chunk_overlap=splitter._chunk_overlap,
+            separators=splitter._separators,
+            keep_separator=splitter._keep_separator,
+        )
+
+        assert chunker.chunk(text) == legacy.split_text(text)
+
+    def test_non_ascii_text(self):
+        text = "Café au lait\n\nnaïve résumé 東京 🚀 " * 50
+        kwargs = {"chunk_size": 37, "chunk_overlap": 5}
+
+        assert RecursiveCharacterTextSplitter(**kwargs).split_text(
+            text
+        ) == LegacySplitter(**kwargs).split_text(text)
+
+    def test_overlap_must_be_smaller_than_chunk_size(self):
+        with pytest.raises(ValueError, match="Chunk overlap"):
+            RecursiveCharacterTextSplitter(chunk_size=10, chunk_overlap=10)
+
+
+def word_count(text):
+    return len(text.split())
+
+
+class WordEncoding:
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+
+class TestTokenMode:
+    def test_chunks_are_sized_by_the_length_function(self):
+        text = sample_document(40)
+        kwargs = {
+            "chunk_size": 50,
+            "chunk_overlap": 5,
+            "separators": ["\n\n", "\n", " "],
+            "keep_separator": False,
+        }
+
+        chunks = RecursiveCharacterTextSplitter(
+            length_function=word_count, **kwargs
+        ).split_text(text)
+        character_chunks = RecursiveCharacterTextSplitter(**kwargs).split_text(text)
+
+        # The overlap keeps at least one split, so a chunk can reach twice
+        # the chunk size.
+        assert all(word_count(chunk) <= 2 * 50 for chunk in chunks)
+        assert max(map(word_count, chunks)) > 50 // 2
+        assert len(chunks) < len(character_chunks)
+
+    def test_length_of_characters_matches_character_mode(self):
+        text = sample_document(100)
+
+        assert BaseChunker(length_function=len).chunk(text) == BaseChunker().chunk(
+            text
+        )
+
+    def test_tiktoken_encoder(self, monkeypatch):
+        tiktoken = pytest.importorskip("tiktoken")
+        monkeypatch.setattr(tiktoken, "get_encoding", lambda name: WordEncoding())
+        text = sample_document(30)
+        kwargs = {"chunk_size": 60, "chunk_overlap": 10}
+
+        chunks = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            **kwargs
+        ).split_text(text)
+
+        assert chunks == RecursiveCharacterTextSplitter(
+            length_function=word_count, **kwargs
+        ).split_text(text)
+
+
+def test_throughput_in_megabytes_per_second():
+    text = sample_document(4000)
+    megabytes = len(text.encode()) / 1_000_000
+
+    def throughput(splitter):
+        started = time.perf_counter()
+        chunks = splitter.split_text(text)
+        return chunks, megabytes / (time.perf_counter() - started)
+
+    kwargs = {"chunk_size": 1000, "chunk_overlap": 200}
+    chunks, fast = throughput(RecursiveCharacterTextSplitter(**kwargs))
+    expected, legacy = throughput(LegacySplitter(**kwargs))
+
+    print(f"\nsplitter: {fast:.1f} MB/s, previous splitter: {legacy:.1f} MB/s")
+    assert chunks == expected
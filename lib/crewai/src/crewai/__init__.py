@@ -1,20 +1,30 @@
+"""CrewAI: framework for orchestrating role-playing, autonomous AI agents.
+
+The public classes are imported on first access (PEP 562), so that importing
+``crewai`` does not pull in the LLM, telemetry and RAG stacks until they are
+used.
+"""
+
+from __future__ import annotations
+
+import importlib
 import threading
-from typing import Any
-import urllib.request
+from typing import TYPE_CHECKING, Any
 import warnings
 
-from crewai.agent.core import Agent
-from crewai.crew import Crew
-from crewai.crews.crew_output import CrewOutput
-from crewai.flow.flow import Flow
-from crewai.knowledge.knowledge import Knowledge
-from crewai.llm import LLM
-from crewai.llms.base_llm import BaseLLM
-from crewai.process import Process
-from crewai.task import Task
-from crewai.tasks.llm_guardrail import LLMGuardrail
-from crewai.tasks.task_output import TaskOutput
-from crewai.telemetry.telemetry import Telemetry
+
+if TYPE_CHECKING:
+    from crewai.agent.core import Agent
+    from crewai.crew import Crew
+    from crewai.crews.crew_output import CrewOutput
+    from crewai.flow.flow import Flow
+    from crewai.knowledge.knowledge import Knowledge
+    from crewai.llm import LLM
+    from crewai.llms.base_llm import BaseLLM
+    from crewai.process import Process
+    from crewai.task import Task
+    from crewai.tasks.llm_guardrail import LLMGuardrail
+    from crewai.tasks.task_output import TaskOutput
 
 
 def _suppress_pydantic_deprecation_warnings() -> None:
@@ -48,6 +58,10 @@ def _track_install() -> None:
     """Track package installation/first-use via Scarf analytics."""
     global _telemetry_submitted
 
+    import urllib.request
+
+    from crewai.telemetry.telemetry import Telemetry
+
     if _telemetry_submitted or Telemetry._is_telemetry_disabled():
         return
 
@@ -65,12 +79,53 @@ def _track_install() -> None:
 
 def _track_install_async() -> None:
     """Track installation in background thread to avoid blocking imports."""
+    from crewai.telemetry.telemetry import Telemetry
+
     if not Telemetry._is_telemetry_disabled():
         thread = threading.Thread(target=_track_install, daemon=True)
         thread.start()
 
 
-_track_install_async()
+_LAZY_IMPORTS: dict[str, str] = {
+    "Agent": "crewai.agent.core",
+    "BaseLLM": "crewai.llms.base_llm",
+    "Crew": "crewai.crew",
+    "CrewOutput": "crewai.crews.crew_output",
+    "Flow": "crewai.flow.flow",
+    "Knowledge": "crewai.knowledge.knowledge",
+    "LLM": "crewai.llm",
+    "LLMGuardrail": "crewai.tasks.llm_guardrail",
+    "Process": "crewai.process",
+    "Task": "crewai.task",
+    "TaskOutput": "crewai.tasks.task_output",
+}
+_install_tracked = False
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes on first access.
+
+    The first access also starts install tracking, which was previously done
+    at import time.
+    """
+    global _install_tracked
+
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    if not _install_tracked:
+        _install_tracked = True
+        _track_install_async()
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
+
 __all__ = [
     "LLM",
     "Agent",
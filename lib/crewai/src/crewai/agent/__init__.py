@@ -1,5 +1,26 @@
-from crewai.agent.core import Agent
-from crewai.utilities.training_handler import CrewTrainingHandler
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from crewai.agent.core import Agent
+    from crewai.utilities.training_handler import CrewTrainingHandler
 
 
 __all__ = ["Agent", "CrewTrainingHandler"]
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "Agent": "crewai.agent.core",
+    "CrewTrainingHandler": "crewai.utilities.training_handler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exports on first access, so that ``crewai.agent.internal``
+    modules can be imported without the agent implementation."""
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
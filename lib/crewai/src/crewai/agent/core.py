@@ -55,6 +55,7 @@ from crewai.mcp import (
     MCPServerSSE,
     MCPServerStdio,
 )
+from crewai.mcp.pool import get_mcp_session_pool, mcp_server_key
 from crewai.mcp.transports.http import HTTPTransport
 from crewai.mcp.transports.sse import SSETransport
 from crewai.mcp.transports.stdio import StdioTransport
@@ -73,7 +74,6 @@ from crewai.utilities.converter import Converter
 from crewai.utilities.guardrail_types import GuardrailType
 from crewai.utilities.llm_utils import create_llm
 from crewai.utilities.prompts import Prompts
-from crewai.utilities.token_counter_callback import TokenCalcHandler
 from crewai.utilities.training_handler import CrewTrainingHandler
 
 
@@ -115,6 +115,8 @@ class Agent(BaseAgent):
             function_calling_llm: The language model that will handle the tool calling for this agent, it overrides the crew function_calling_llm.
             max_iter: Maximum number of iterations for an agent to execute a task.
             max_rpm: Maximum number of requests per minute for the agent execution to be respected.
+            max_tpm: Maximum number of LLM tokens per minute for the agent execution to be respected.
+            rate_limit_scope: Key of a rate limit budget shared process-wide, e.g. '<provider>/<model>'.
             verbose: Whether the agent execution should be in verbose mode.
             allow_delegation: Whether the agent is allowed to delegate tasks to other agents.
             tools: Tools at agents disposal
@@ -126,7 +128,6 @@ class Agent(BaseAgent):
     """
 
     _times_executed: int = PrivateAttr(default=0)
-    _mcp_clients: list[Any] = PrivateAttr(default_factory=list)
     _last_messages: list[LLMMessage] = PrivateAttr(default_factory=list)
     max_execution_time: int | None = Field(
         default=None,
@@ -432,7 +433,6 @@ class Agent(BaseAgent):
         )
 
         save_last_messages(self)
-        self._cleanup_mcp_clients()
 
         return result
 
@@ -638,7 +638,6 @@ class Agent(BaseAgent):
         )
 
         save_last_messages(self)
-        self._cleanup_mcp_clients()
 
         return result
 
@@ -701,6 +700,10 @@ class Agent(BaseAgent):
         Returns:
             An instance of the CrewAgentExecutor class.
         """
+        # Deferred: the handler subclasses LiteLLM's CustomLogger, which
+        # imports all of LiteLLM.
+        from crewai.utilities.token_counter_callback import TokenCalcHandler
+
         raw_tools: list[BaseTool] = tools or self.tools or []
         parsed_tools = parse_tools(raw_tools)
 
@@ -772,39 +775,16 @@ class Agent(BaseAgent):
             List of BaseTool instances from MCP servers.
         """
         all_tools = []
-        clients = []
-
         for mcp_config in mcps:
             if isinstance(mcp_config, str):
                 tools = self._get_mcp_tools_from_string(mcp_config)
             else:
-                tools, client = self._get_native_mcp_tools(mcp_config)
-                if client:
-                    clients.append(client)
+                tools = self._get_native_mcp_tools(mcp_config)
 
             all_tools.extend(tools)
 
-        # Store clients for cleanup
-        self._mcp_clients.extend(clients)
         return all_tools
 
-    def _cleanup_mcp_clients(self) -> None:
-        """Cleanup MCP client connections after task execution."""
-        if not self._mcp_clients:
-            return
-
-        async def _disconnect_all() -> None:
-            for client in self._mcp_clients:
-                if client and hasattr(client, "connected") and client.connected:
-                    await client.disconnect()
-
-        try:
-            asyncio.run(_disconnect_all())
-        except Exception as e:
-            self._logger.log("error", f"Error during MCP client cleanup: {e}")
-        finally:
-            self._mcp_clients.clear()
-
     def _get_mcp_tools_from_string(self, mcp_ref: str) -> list[BaseTool]:
         """Get tools from legacy string-based MCP references.
 
@@ -881,20 +861,20 @@ class Agent(BaseAgent):
             )
             return []
 
-    def _get_native_mcp_tools(
-        self, mcp_config: MCPServerConfig
-    ) -> tuple[list[BaseTool], Any | None]:
+    def _get_native_mcp_tools(self, mcp_config: MCPServerConfig) -> list[BaseTool]:
         """Get tools from MCP server using structured configuration.
 
-        This method creates an MCP client based on the configuration type,
-        connects to the server, discovers tools, applies filtering, and
-        returns wrapped tools along with the client instance for cleanup.
+        This method registers an MCP client for the configuration in the
+        process-wide session pool, discovers tools over the pooled session,
+        applies filtering, and returns wrapped tools. The session stays open
+        for the tools' calls and is shared with other agents and crews using
+        the same server.
 
         Args:
             mcp_config: MCP server configuration (MCPServerStdio, MCPServerHTTP, or MCPServerSSE).
 
         Returns:
-            Tuple of (list of BaseTool instances, MCPClient instance for cleanup).
+            List of BaseTool instances.
         """
         from crewai.tools.base_tool import BaseTool
         from crewai.tools.mcp_native_tool import MCPNativeTool
@@ -923,63 +903,18 @@ class Agent(BaseAgent):
         else:
             raise ValueError(f"Unsupported MCP server config type: {type(mcp_config)}")
 
-        client = MCPClient(
-            transport=transport,
-            cache_tools_list=mcp_config.cache_tools_list,
+        pool = get_mcp_session_pool()
+        pool_key = mcp_server_key(mcp_config)
+        client = pool.register(
+            pool_key,
+            lambda: MCPClient(
+                transport=transport,
+                cache_tools_list=mcp_config.cache_tools_list,
+            ),
         )
 
-        async def _setup_client_and_list_tools() -> list[dict[str, Any]]:
-            """Async helper to connect and list tools in same event loop."""
-
-            try:
-                if not client.connected:
-                    await client.connect()
-
-                tools_list = await client.list_tools()
-
-                try:
-                    await client.disconnect()
-                    # Small delay to allow background tasks to finish cleanup
-                    # This helps prevent "cancel scope in different task" errors
-                    # when asyncio.run() closes the event loop
-                    await asyncio.sleep(0.1)
-                except Exception as e:
-                    self._logger.log("error", f"Error during disconnect: {e}")
-
-                return tools_list
-            except Exception as e:
-                if client.connected:
-                    await client.disconnect()
-                    await asyncio.sleep(0.1)
-                raise RuntimeError(
-                    f"Error during setup client and list tools: {e}"
-                ) from e
-
         try:
-            try:
-                asyncio.get_running_loop()
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run, _setup_client_and_list_tools()
-                    )
-                    tools_list = future.result()
-            except RuntimeError:
-                try:
-                    tools_list = asyncio.run(_setup_client_and_list_tools())
-                except RuntimeError as e:
-                    error_msg = str(e).lower()
-                    if "cancel scope" in error_msg or "task" in error_msg:
-                        raise ConnectionError(
-                            "MCP connection failed due to event loop cleanup issues. "
-                            "This may be due to authentication errors or server unavailability."
-                        ) from e
-                except asyncio.CancelledError as e:
-                    raise ConnectionError(
-                        "MCP connection was cancelled. This may indicate an authentication "
-                        "error or server unavailability."
-                    ) from e
+            tools_list = pool.list_tools(pool_key)
 
             if mcp_config.tool_filter:
                 filtered_tools = []
@@ -1027,17 +962,15 @@ class Agent(BaseAgent):
                         tool_name=tool_name,
                         tool_schema=tool_schema,
                         server_name=server_name,
+                        pool_key=pool_key,
                     )
                     tools.append(native_tool)
                 except Exception as e:
                     self._logger.log("error", f"Failed to create native MCP tool: {e}")
                     continue
 
-            return cast(list[BaseTool], tools), client
+            return cast(list[BaseTool], tools)
         except Exception as e:
-            if client.connected:
-                asyncio.run(client.disconnect())
-
             raise RuntimeError(f"Failed to get native MCP tools: {e}") from e
 
     def _get_amp_mcp_tools(self, amp_ref: str) -> list[BaseTool]:
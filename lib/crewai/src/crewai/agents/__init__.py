@@ -1,6 +1,13 @@
-from crewai.agents.cache.cache_handler import CacheHandler
-from crewai.agents.parser import AgentAction, AgentFinish, OutputParserError, parse
-from crewai.agents.tools_handler import ToolsHandler
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from crewai.agents.cache.cache_handler import CacheHandler
+    from crewai.agents.parser import AgentAction, AgentFinish, OutputParserError, parse
+    from crewai.agents.tools_handler import ToolsHandler
 
 
 __all__ = [
@@ -11,3 +18,21 @@ __all__ = [
     "ToolsHandler",
     "parse",
 ]
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "AgentAction": "crewai.agents.parser",
+    "AgentFinish": "crewai.agents.parser",
+    "CacheHandler": "crewai.agents.cache.cache_handler",
+    "OutputParserError": "crewai.agents.parser",
+    "ToolsHandler": "crewai.agents.tools_handler",
+    "parse": "crewai.agents.parser",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exports on first access, so that importing a submodule does not
+    import its siblings."""
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
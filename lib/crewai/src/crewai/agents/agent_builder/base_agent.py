@@ -70,6 +70,8 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
         config (dict[str, Any] | None): Configuration for the agent.
         verbose (bool): Verbose mode for the Agent Execution.
         max_rpm (int | None): Maximum number of requests per minute for the agent execution.
+        max_tpm (int | None): Maximum number of LLM tokens per minute for the agent execution.
+        rate_limit_scope (str | None): Key of a rate limit budget shared process-wide.
         allow_delegation (bool): Allow delegation of tasks to agents.
         tools (list[Any] | None): Tools at the agent's disposal.
         max_iter (int): Maximum iterations for an agent to execute a task.
@@ -133,6 +135,17 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
         default=None,
         description="Maximum number of requests per minute for the agent execution to be respected.",
     )
+    max_tpm: int | None = Field(
+        default=None,
+        description="Maximum number of LLM tokens per minute for the agent execution to be respected.",
+    )
+    rate_limit_scope: str | None = Field(
+        default=None,
+        description=(
+            "Key of a rate limit budget shared by every agent and crew in the "
+            "process that uses the same key, e.g. '<provider>/<model>'."
+        ),
+    )
     allow_delegation: bool = Field(
         default=False,
         description="Enable agent to delegate and ask questions among each other.",
@@ -296,9 +309,12 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
 
         # Set private attributes
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm,
+                max_tpm=self.max_tpm,
+                scope=self.rate_limit_scope,
+                logger=self._logger,
             )
         if not self._token_process:
             self._token_process = TokenProcess()
@@ -321,9 +337,12 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
     def set_private_attrs(self) -> Self:
         """Set private attributes."""
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm,
+                max_tpm=self.max_tpm,
+                scope=self.rate_limit_scope,
+                logger=self._logger,
             )
         if not self._token_process:
             self._token_process = TokenProcess()
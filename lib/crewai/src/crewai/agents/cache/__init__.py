@@ -1,5 +1,5 @@
+from crewai.agents.cache.cache_backend import CacheBackend, SQLiteCacheBackend
 from crewai.agents.cache.cache_handler import CacheHandler
 
 
-
-__all__ = ["CacheHandler"]
+__all__ = ["CacheBackend", "CacheHandler", "SQLiteCacheBackend"]
@@ -0,0 +1,147 @@
+"""Persistent backends for the tool result cache."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import time
+from typing import Any
+
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import get_sqlite_pool
+
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Abstract base class for second-level tool result caches.
+
+    A backend sits behind the in-memory cache of a ``CacheHandler`` and lets
+    results outlive the process or be shared between worker processes.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> tuple[Any, float | None] | None:
+        """Look up a key.
+
+        Args:
+            key: Canonical cache key.
+
+        Returns:
+            A ``(value, expires_at)`` tuple, or None if the key is missing or expired.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, expires_at: float | None) -> None:
+        """Store a value.
+
+        Args:
+            key: Canonical cache key.
+            value: Tool output to store.
+            expires_at: Unix timestamp after which the entry is stale, or None.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry from the backend."""
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """SQLite backend shared by every process pointing at the same file.
+
+    Values are stored as JSON, so outputs that cannot be serialized stay in
+    the in-memory layer only. The database runs in WAL mode so readers in
+    other processes are not blocked by writers.
+    """
+
+    def __init__(
+        self, db_path: str | None = None, max_entries: int | None = None
+    ) -> None:
+        """Initialize the SQLite cache backend.
+
+        Args:
+            db_path: Optional path to the database file.
+            max_entries: Optional cap on stored rows; the oldest rows are removed first.
+        """
+        if db_path is None:
+            db_path = str(Path(db_storage_path()) / "tool_cache.db")
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._pool = get_sqlite_pool(self.db_path)
+        self._writes = 0
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        with self._pool.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tool_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tool_cache_created_at ON tool_cache (created_at)"
+            )
+
+    def get(self, key: str) -> tuple[Any, float | None] | None:
+        try:
+            row = (
+                self._pool.connection()
+                .execute(
+                    "SELECT value, expires_at FROM tool_cache WHERE key = ?", (key,)
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Tool cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return json.loads(value), expires_at
+
+    def set(self, key: str, value: Any, expires_at: float | None) -> None:
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+        try:
+            with self._pool.transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO tool_cache (key, value, expires_at, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, serialized, expires_at, time.time()),
+                )
+            self._writes += 1
+            if self._writes % 100 == 0:
+                self.prune()
+        except sqlite3.Error as e:
+            logger.warning(f"Tool cache write failed: {e}")
+
+    def prune(self) -> None:
+        """Delete expired rows and trim the table to ``max_entries``."""
+        with self._pool.transaction() as conn:
+            conn.execute(
+                "DELETE FROM tool_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            if self.max_entries is not None:
+                conn.execute(
+                    "DELETE FROM tool_cache WHERE key IN ("
+                    "SELECT key FROM tool_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        with self._pool.transaction() as conn:
+            conn.execute("DELETE FROM tool_cache")
@@ -1,38 +1,111 @@
 """Cache handler for tool usage results."""
 
+from collections import OrderedDict
+import json
+import threading
+import time
 from typing import Any
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-from crewai.utilities.rw_lock import RWLock
+from crewai.agents.cache.cache_backend import CacheBackend
 
 
 class CacheHandler(BaseModel):
     """Handles caching of tool execution results.
 
-    Provides thread-safe in-memory caching for tool outputs based on tool name and input.
-    Uses a read-write lock to allow concurrent reads while ensuring exclusive write access.
+    Provides a thread-safe, bounded in-memory LRU cache for tool outputs based on
+    tool name and input, with optional expiry and an optional persistent backend
+    that is consulted on memory misses and shared across processes.
+
+    Keys are canonicalized: JSON inputs are re-serialized with sorted keys so the
+    order in which a model emits arguments does not cause misses.
+
+    Attributes:
+        max_size: Maximum number of in-memory entries; None means unbounded.
+        ttl: Default time-to-live in seconds; None means entries never expire.
+        tool_ttls: Per-tool TTL overrides in seconds, keyed by tool name.
+        backend: Optional persistent second-level cache.
 
     Notes:
         - TODO: Rename 'input' parameter to avoid shadowing builtin.
     """
 
-    _cache: dict[str, Any] = PrivateAttr(default_factory=dict)
-    _lock: RWLock = PrivateAttr(default_factory=RWLock)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    max_size: int | None = Field(
+        default=1000, description="Maximum number of in-memory entries."
+    )
+    ttl: float | None = Field(
+        default=None, description="Default time-to-live for entries in seconds."
+    )
+    tool_ttls: dict[str, float | None] = Field(
+        default_factory=dict, description="Per-tool time-to-live overrides."
+    )
+    backend: CacheBackend | None = Field(
+        default=None, description="Optional persistent cache backend."
+    )
+
+    _cache: OrderedDict[str, Any] = PrivateAttr(default_factory=OrderedDict)
+    _expires: dict[str, float] = PrivateAttr(default_factory=dict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+    _evictions: int = PrivateAttr(default=0)
+
+    @staticmethod
+    def _key(tool: str, input: str) -> str:
+        try:
+            parsed = json.loads(input)
+        except (TypeError, ValueError):
+            return f"{tool}-{input}"
+        if isinstance(parsed, (dict, list)):
+            input = json.dumps(parsed, sort_keys=True)
+        return f"{tool}-{input}"
+
+    def _ttl_for(self, tool: str, ttl: float | None) -> float | None:
+        if ttl is not None:
+            return ttl
+        if tool in self.tool_ttls:
+            return self.tool_ttls[tool]
+        return self.ttl
+
+    def _store(self, key: str, output: Any, expires_at: float | None) -> None:
+        # Caller holds self._lock
+        self._cache[key] = output
+        self._cache.move_to_end(key)
+        if expires_at is None:
+            self._expires.pop(key, None)
+        else:
+            self._expires[key] = expires_at
+        if self.max_size is not None:
+            while len(self._cache) > self.max_size:
+                evicted, _ = self._cache.popitem(last=False)
+                self._expires.pop(evicted, None)
+                self._evictions += 1
 
-    def add(self, tool: str, input: str, output: Any) -> None:
+    def add(self, tool: str, input: str, output: Any, ttl: float | None = None) -> None:
         """Add a tool result to the cache.
 
         Args:
             tool: Name of the tool.
             input: Input string used for the tool.
             output: Output result from tool execution.
+            ttl: Optional time-to-live in seconds for this entry, overriding
+                the per-tool and default TTLs.
 
         Notes:
             - TODO: Rename 'input' parameter to avoid shadowing builtin.
         """
-        with self._lock.w_locked():
-            self._cache[f"{tool}-{input}"] = output
+        key = self._key(tool, input)
+        ttl = self._ttl_for(tool, ttl)
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._store(key, output, expires_at)
+        if self.backend is not None:
+            self.backend.set(key, output, expires_at)
 
     def read(self, tool: str, input: str) -> Any | None:
         """Retrieve a cached tool result.
@@ -42,10 +115,53 @@ class CacheHandler(BaseModel):
             input: Input string used for the tool.
 
         Returns:
-            Cached result if found, None otherwise.
+            Cached result if found and not expired, None otherwise.
 
         Notes:
             - TODO: Rename 'input' parameter to avoid shadowing builtin.
         """
-        with self._lock.r_locked():
-            return self._cache.get(f"{tool}-{input}")
+        key = self._key(tool, input)
+        with self._lock:
+            if key in self._cache:
+                expires_at = self._expires.get(key)
+                if expires_at is None or expires_at > time.time():
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return self._cache[key]
+                del self._cache[key]
+                del self._expires[key]
+                self._evictions += 1
+
+        if self.backend is not None:
+            entry = self.backend.get(key)
+            if entry is not None:
+                output, expires_at = entry
+                with self._lock:
+                    self._store(key, output, expires_at)
+                    self._hits += 1
+                return output
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def stats(self) -> dict[str, int]:
+        """Return cache counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions and the current in-memory size.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._cache),
+            }
+
+    def clear(self) -> None:
+        """Remove every in-memory entry and reset counters; the backend is left intact."""
+        with self._lock:
+            self._cache.clear()
+            self._expires.clear()
+            self._hits = self._misses = self._evictions = 0
@@ -27,7 +27,9 @@ from crewai.hooks.llm_hooks import (
     get_after_llm_call_hooks,
     get_before_llm_call_hooks,
 )
+from crewai.llms.base_llm import count_call_tokens
 from crewai.utilities.agent_utils import (
+    aenforce_rpm_limit,
     aget_llm_response,
     enforce_rpm_limit,
     format_message_for_llm,
@@ -40,6 +42,7 @@ from crewai.utilities.agent_utils import (
     has_reached_max_iterations,
     is_context_length_exceeded,
     process_llm_response,
+    record_rpm_tokens,
 )
 from crewai.utilities.constants import TRAINING_DATA_FILE
 from crewai.utilities.i18n import I18N, get_i18n
@@ -230,16 +233,18 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
 
                 enforce_rpm_limit(self.request_within_rpm_limit)
 
-                answer = get_llm_response(
-                    llm=self.llm,
-                    messages=self.messages,
-                    callbacks=self.callbacks,
-                    printer=self._printer,
-                    from_task=self.task,
-                    from_agent=self.agent,
-                    response_model=self.response_model,
-                    executor_context=self,
-                )
+                with count_call_tokens() as usage:
+                    answer = get_llm_response(
+                        llm=self.llm,
+                        messages=self.messages,
+                        callbacks=self.callbacks,
+                        printer=self._printer,
+                        from_task=self.task,
+                        from_agent=self.agent,
+                        response_model=self.response_model,
+                        executor_context=self,
+                    )
+                record_rpm_tokens(self.request_within_rpm_limit, usage.total_tokens)
                 formatted_answer = process_llm_response(answer, self.use_stop_words)  # type: ignore[assignment]
 
                 if isinstance(formatted_answer, AgentAction):
@@ -382,18 +387,20 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     )
                     break
 
-                enforce_rpm_limit(self.request_within_rpm_limit)
+                await aenforce_rpm_limit(self.request_within_rpm_limit)
 
-                answer = await aget_llm_response(
-                    llm=self.llm,
-                    messages=self.messages,
-                    callbacks=self.callbacks,
-                    printer=self._printer,
-                    from_task=self.task,
-                    from_agent=self.agent,
-                    response_model=self.response_model,
-                    executor_context=self,
-                )
+                with count_call_tokens() as usage:
+                    answer = await aget_llm_response(
+                        llm=self.llm,
+                        messages=self.messages,
+                        callbacks=self.callbacks,
+                        printer=self._printer,
+                        from_task=self.task,
+                        from_agent=self.agent,
+                        response_model=self.response_model,
+                        executor_context=self,
+                    )
+                record_rpm_tokens(self.request_within_rpm_limit, usage.total_tokens)
                 formatted_answer = process_llm_response(answer, self.use_stop_words)  # type: ignore[assignment]
 
                 if isinstance(formatted_answer, AgentAction):
@@ -572,10 +579,11 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             return
 
         training_handler = CrewTrainingHandler(TRAINING_DATA_FILE)
-        training_data = training_handler.load() or {}
+        # Copied because loaded training data is shared across the process
+        training_data = dict(training_handler.load() or {})
 
         # Initialize or retrieve agent's training data
-        agent_training_data = training_data.get(agent_id, {})
+        agent_training_data = dict(training_data.get(agent_id, {}))
 
         if human_feedback is not None:
             # Save initial output and human feedback
@@ -586,7 +594,10 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         else:
             # Save improved output
             if train_iteration in agent_training_data:
-                agent_training_data[train_iteration]["improved_output"] = result.output
+                agent_training_data[train_iteration] = {
+                    **agent_training_data[train_iteration],
+                    "improved_output": result.output,
+                }
             else:
                 self._printer.print(
                     content=(
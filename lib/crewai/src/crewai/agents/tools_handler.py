@@ -38,6 +38,7 @@ class ToolsHandler:
         calling: ToolCalling | InstructorToolCalling,
         output: str,
         should_cache: bool = True,
+        ttl: float | None = None,
     ) -> None:
         """Run when tool ends running.
 
@@ -45,6 +46,7 @@ class ToolsHandler:
             calling: The tool calling instance.
             output: The output from the tool execution.
             should_cache: Whether to cache the tool output.
+            ttl: Optional time-to-live in seconds for the cached output.
         """
         self.last_used_tool = calling
         if self.cache and should_cache and calling.tool_name != CacheTools().name:
@@ -56,10 +58,14 @@ class ToolsHandler:
                 else:
                     input_str = str(calling.arguments)
 
+            # Only pass ttl when set so CacheHandler subclasses that override
+            # add() with the original signature keep working
+            extra: dict[str, Any] = {"ttl": ttl} if ttl is not None else {}
             self.cache.add(
                 tool=calling.tool_name,
                 input=input_str,
                 output=output,
+                **extra,
             )
 
     @classmethod
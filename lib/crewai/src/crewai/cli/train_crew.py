@@ -16,8 +16,8 @@ def train_crew(n_iterations: int, filename: str) -> None:
         if n_iterations <= 0:
             raise ValueError("The number of iterations must be a positive integer.")
 
-        if not filename.endswith(".pkl"):
-            raise ValueError("The filename must not end with .pkl")
+        if not filename.endswith((".pkl", ".json")):
+            raise ValueError("The filename must end with .pkl or .json")
 
         result = subprocess.run(command, capture_output=False, text=True, check=True)  # noqa: S603
 
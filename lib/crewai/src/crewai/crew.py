@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from concurrent.futures import Future
 from copy import copy as shallow_copy
 from hashlib import md5
@@ -36,9 +36,12 @@ from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.cache.cache_handler import CacheHandler
 from crewai.crews.crew_output import CrewOutput
 from crewai.crews.utils import (
+    CrewBatchResult,
     StreamingContext,
     check_conditional_skip,
+    copy_for_batch,
     enable_agent_streaming,
+    iter_for_each,
     prepare_kickoff,
     prepare_task_execution,
     run_for_each_async,
@@ -133,6 +136,10 @@ class Crew(FlowTrackable, BaseModel):
         config: Configuration settings for the crew.
         max_rpm: Maximum number of requests per minute for the crew execution to
             be respected.
+        max_tpm: Maximum number of LLM tokens per minute for the crew execution
+            to be respected.
+        rate_limit_scope: Key of a rate limit budget shared by every crew and
+            agent in the process that uses the same key.
         prompt_file: Path to the prompt json file to be used for the crew.
         id: A unique identifier for the crew instance.
         task_callback: Callback to be executed after each task for every agents
@@ -250,6 +257,20 @@ class Crew(FlowTrackable, BaseModel):
             "to be respected."
         ),
     )
+    max_tpm: int | None = Field(
+        default=None,
+        description=(
+            "Maximum number of LLM tokens per minute for the crew execution "
+            "to be respected."
+        ),
+    )
+    rate_limit_scope: str | None = Field(
+        default=None,
+        description=(
+            "Key of a rate limit budget shared by every crew and agent in the "
+            "process that uses the same key, e.g. '<provider>/<model>'."
+        ),
+    )
     prompt_file: str | None = Field(
         default=None,
         description="Path to the prompt json file to be used for the crew.",
@@ -346,7 +367,12 @@ class Crew(FlowTrackable, BaseModel):
         self._logger = Logger(verbose=self.verbose)
         if self.output_log_file:
             self._file_handler = FileHandler(self.output_log_file)
-        self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
+        self._rpm_controller = RPMController(
+            max_rpm=self.max_rpm,
+            max_tpm=self.max_tpm,
+            scope=self.rate_limit_scope,
+            logger=self._logger,
+        )
         if self.function_calling_llm and not isinstance(self.function_calling_llm, LLM):
             self.function_calling_llm = create_llm(self.function_calling_llm)
 
@@ -442,7 +468,7 @@ class Crew(FlowTrackable, BaseModel):
             for agent in self.agents:
                 if self.cache:
                     agent.set_cache_handler(self._cache_handler)
-                if self.max_rpm:
+                if self.max_rpm or self.max_tpm:
                     agent.set_rpm_controller(self._rpm_controller)
         return self
 
@@ -733,21 +759,48 @@ class Crew(FlowTrackable, BaseModel):
             raise
         finally:
             detach(token)
+            if self.output_log_file:
+                self._file_handler.flush()
 
     def kickoff_for_each(
-        self, inputs: list[dict[str, Any]]
+        self,
+        inputs: list[dict[str, Any]],
+        max_concurrency: int | None = None,
     ) -> list[CrewOutput | CrewStreamingOutput]:
         """Executes the Crew's workflow for each input and aggregates results.
 
         If stream=True, returns a list of CrewStreamingOutput objects that must
         each be iterated to get stream chunks and access results.
+
+        With ``max_concurrency`` set, up to that many copies run at once on a
+        thread pool. Every input still runs when another fails; the first
+        failure in input order is raised once the batch has finished. Use
+        ``iter_kickoff_for_each`` to receive failures alongside results.
+
+        Args:
+            inputs: List of input dictionaries for each execution.
+            max_concurrency: Maximum number of concurrent kickoffs. Runs the
+                inputs one after another if None or when streaming.
+
+        Returns:
+            The outputs, in input order.
         """
+        if max_concurrency is not None and not self.stream:
+            batch = sorted(
+                self.iter_kickoff_for_each(inputs, max_concurrency=max_concurrency),
+                key=lambda result: result.input_index,
+            )
+            for result in batch:
+                if result.error is not None:
+                    raise result.error
+            return [result.output for result in batch if result.output is not None]
+
         results: list[CrewOutput | CrewStreamingOutput] = []
 
         total_usage_metrics = UsageMetrics()
 
         for input_data in inputs:
-            crew = self.copy()
+            crew = copy_for_batch(self)
 
             output = crew.kickoff(inputs=input_data)
 
@@ -761,6 +814,28 @@ class Crew(FlowTrackable, BaseModel):
         self._task_output_handler.reset()
         return results
 
+    def iter_kickoff_for_each(
+        self,
+        inputs: list[dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> Iterator[CrewBatchResult]:
+        """Executes the Crew's workflow for each input concurrently.
+
+        Results are yielded as soon as each input finishes, so large batches
+        can be consumed incrementally. A failing input is reported through the
+        ``error`` of its result and does not stop the others. Copies share
+        this crew's tool cache and rate limits.
+
+        Args:
+            inputs: List of input dictionaries for each execution.
+            max_concurrency: Maximum number of concurrent kickoffs.
+
+        Returns:
+            An iterator of results in completion order; each carries the
+            ``input_index`` of its input.
+        """
+        return iter_for_each(self, inputs, max_concurrency=max_concurrency)
+
     async def kickoff_async(
         self, inputs: dict[str, Any] | None = None
     ) -> CrewOutput | CrewStreamingOutput:
@@ -800,13 +875,16 @@ class Crew(FlowTrackable, BaseModel):
         return await asyncio.to_thread(self.kickoff, inputs)
 
     async def kickoff_for_each_async(
-        self, inputs: list[dict[str, Any]]
+        self,
+        inputs: list[dict[str, Any]],
+        max_concurrency: int | None = None,
     ) -> list[CrewOutput | CrewStreamingOutput] | CrewStreamingOutput:
         """Executes the Crew's workflow for each input asynchronously.
 
         If stream=True, returns a single CrewStreamingOutput that yields chunks
         from all crews as they arrive. After iteration, access results via .results
-        (list of CrewOutput).
+        (list of CrewOutput). Otherwise at most ``max_concurrency`` crews run
+        at once, or all of them if None.
         """
 
         async def kickoff_fn(
@@ -814,7 +892,9 @@ class Crew(FlowTrackable, BaseModel):
         ) -> CrewOutput | CrewStreamingOutput:
             return await crew.kickoff_async(inputs=input_data)
 
-        return await run_for_each_async(self, inputs, kickoff_fn)
+        return await run_for_each_async(
+            self, inputs, kickoff_fn, max_concurrency=max_concurrency
+        )
 
     async def akickoff(
         self, inputs: dict[str, Any] | None = None
@@ -881,15 +961,20 @@ class Crew(FlowTrackable, BaseModel):
             raise
         finally:
             detach(token)
+            if self.output_log_file:
+                self._file_handler.flush()
 
     async def akickoff_for_each(
-        self, inputs: list[dict[str, Any]]
+        self,
+        inputs: list[dict[str, Any]],
+        max_concurrency: int | None = None,
     ) -> list[CrewOutput | CrewStreamingOutput] | CrewStreamingOutput:
         """Native async execution of the Crew's workflow for each input.
 
         Uses native async throughout rather than thread-based async.
         If stream=True, returns a single CrewStreamingOutput that yields chunks
-        from all crews as they arrive.
+        from all crews as they arrive. Otherwise at most ``max_concurrency``
+        crews run at once, or all of them if None.
         """
 
         async def kickoff_fn(
@@ -897,7 +982,9 @@ class Crew(FlowTrackable, BaseModel):
         ) -> CrewOutput | CrewStreamingOutput:
             return await crew.akickoff(inputs=input_data)
 
-        return await run_for_each_async(self, inputs, kickoff_fn)
+        return await run_for_each_async(
+            self, inputs, kickoff_fn, max_concurrency=max_concurrency
+        )
 
     async def _arun_sequential_process(self) -> CrewOutput:
         """Executes tasks sequentially using native async and returns the final output."""
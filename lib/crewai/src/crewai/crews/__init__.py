@@ -1,5 +1,5 @@
 from crewai.crews.crew_output import CrewOutput
+from crewai.crews.utils import CrewBatchResult
 
 
-
-__all__ = ["CrewOutput"]
+__all__ = ["CrewBatchResult", "CrewOutput"]
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import contextvars
+import os
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.crews.crew_output import CrewOutput
@@ -272,12 +275,128 @@ class ForEachStreamingContext:
         self.output_holder: list[CrewStreamingOutput | FlowStreamingOutput] = []
 
 
+class CrewBatchResult(NamedTuple):
+    """Outcome of one input of a batch kickoff.
+
+    Attributes:
+        input_index: Position of the input in the batch.
+        inputs: The inputs the crew copy was kicked off with.
+        output: The crew output, or None if the kickoff failed.
+        error: The exception raised by the kickoff, or None on success.
+    """
+
+    input_index: int
+    inputs: dict[str, Any]
+    output: CrewOutput | None
+    error: Exception | None
+
+
+def copy_for_batch(crew: Crew) -> Crew:
+    """Copy a crew for one input of a batch.
+
+    The copy shares the parent's tool cache and rate limiters, so cached tool
+    results are reused across inputs and ``max_rpm``/``max_tpm`` bound the whole
+    batch rather than each copy. LLM instances are shallow-copied by
+    ``Agent.copy`` and therefore already share their underlying clients.
+
+    Args:
+        crew: The crew to copy.
+
+    Returns:
+        The copy.
+    """
+    crew_copy = crew.copy()
+    crew_copy._cache_handler = crew._cache_handler
+    crew_copy._rpm_controller = crew._rpm_controller
+    for original, agent in zip(crew.agents, crew_copy.agents, strict=True):
+        if original._rpm_controller is not None:
+            agent._rpm_controller = original._rpm_controller
+        if crew.cache:
+            agent.set_cache_handler(crew._cache_handler)
+    return crew_copy
+
+
+def iter_for_each(
+    crew: Crew,
+    inputs: list[dict[str, Any]],
+    max_concurrency: int | None = None,
+) -> Iterator[CrewBatchResult]:
+    """Kick off a copy of the crew per input on a thread pool.
+
+    At most ``max_concurrency`` copies exist at a time; the next input is only
+    copied once a running one finishes. A failing input is reported in its
+    result instead of aborting the batch. Once the iterator is exhausted the
+    parent crew's ``usage_metrics`` hold the totals of the successful runs.
+
+    Args:
+        crew: The crew to run.
+        inputs: List of input dictionaries for each execution.
+        max_concurrency: Maximum number of concurrent kickoffs; defaults to
+            ``ThreadPoolExecutor``'s default worker count.
+
+    Yields:
+        One result per input, in completion order.
+
+    Raises:
+        ValueError: If the crew streams or ``max_concurrency`` is not positive.
+    """
+    from crewai.types.usage_metrics import UsageMetrics
+
+    if crew.stream:
+        raise ValueError("Concurrent batch kickoff does not support stream=True.")
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+
+    def run(index: int, crew_copy: Crew, input_data: dict[str, Any]) -> CrewBatchResult:
+        try:
+            output = cast(CrewOutput, crew_copy.kickoff(inputs=input_data))
+        except Exception as e:
+            return CrewBatchResult(index, input_data, None, e)
+        return CrewBatchResult(index, input_data, output, None)
+
+    workers = max_concurrency or min(32, (os.cpu_count() or 1) + 4)
+    total_usage_metrics = UsageMetrics()
+    pending: dict[Future[CrewBatchResult], Crew] = {}
+    queued = iter(enumerate(inputs))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="crewai-kickoff"
+    ) as executor:
+
+        def submit_next() -> None:
+            item = next(queued, None)
+            if item is None:
+                return
+            index, input_data = item
+            crew_copy = copy_for_batch(crew)
+            ctx = contextvars.copy_context()
+            future = executor.submit(ctx.run, run, index, crew_copy, input_data)
+            pending[future] = crew_copy
+
+        try:
+            for _ in range(workers):
+                submit_next()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    crew_copy = pending.pop(future)
+                    if crew_copy.usage_metrics:
+                        total_usage_metrics.add_usage_metrics(crew_copy.usage_metrics)
+                    submit_next()
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            crew.usage_metrics = total_usage_metrics
+            crew._task_output_handler.reset()
+
+
 async def run_for_each_async(
     crew: Crew,
     inputs: list[dict[str, Any]],
     kickoff_fn: Callable[
         [Crew, dict[str, Any]], Coroutine[Any, Any, CrewOutput | CrewStreamingOutput]
     ],
+    max_concurrency: int | None = None,
 ) -> list[CrewOutput | CrewStreamingOutput] | CrewStreamingOutput:
     """Execute crew workflow for each input asynchronously.
 
@@ -285,6 +404,8 @@ async def run_for_each_async(
         crew: The crew instance to execute.
         inputs: List of input dictionaries for each execution.
         kickoff_fn: Async function to call for each crew copy (kickoff_async or akickoff).
+        max_concurrency: Maximum number of crews running at once when not
+            streaming; unbounded if None.
 
     Returns:
         If streaming, a single CrewStreamingOutput that yields chunks from all crews.
@@ -297,16 +418,14 @@ async def run_for_each_async(
         signal_error,
     )
 
-    crew_copies = [crew.copy() for _ in inputs]
-
     if crew.stream:
         ctx = ForEachStreamingContext()
 
         async def run_all_crews() -> None:
             try:
                 streaming_outputs: list[CrewStreamingOutput] = []
-                for i, crew_copy in enumerate(crew_copies):
-                    streaming = await kickoff_fn(crew_copy, inputs[i])
+                for input_data in inputs:
+                    streaming = await kickoff_fn(copy_for_batch(crew), input_data)
                     if isinstance(streaming, CrewStreamingOutput):
                         streaming_outputs.append(streaming)
 
@@ -346,17 +465,30 @@ async def run_for_each_async(
 
         return streaming_output
 
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    total_usage_metrics = UsageMetrics()
+
+    async def run_copy(input_data: dict[str, Any]) -> CrewOutput | CrewStreamingOutput:
+        # Copies are made once a slot is free, so at most max_concurrency exist.
+        crew_copy = copy_for_batch(crew)
+        result = await kickoff_fn(crew_copy, input_data)
+        if crew_copy.usage_metrics:
+            total_usage_metrics.add_usage_metrics(crew_copy.usage_metrics)
+        return result
+
+    async def run_bounded(
+        input_data: dict[str, Any],
+    ) -> CrewOutput | CrewStreamingOutput:
+        if semaphore is None:
+            return await run_copy(input_data)
+        async with semaphore:
+            return await run_copy(input_data)
+
     async_tasks: list[asyncio.Task[CrewOutput | CrewStreamingOutput]] = [
-        asyncio.create_task(kickoff_fn(crew_copy, input_data))
-        for crew_copy, input_data in zip(crew_copies, inputs, strict=True)
+        asyncio.create_task(run_bounded(input_data)) for input_data in inputs
     ]
 
     results = await asyncio.gather(*async_tasks)
-
-    total_usage_metrics = UsageMetrics()
-    for crew_copy in crew_copies:
-        if crew_copy.usage_metrics:
-            total_usage_metrics.add_usage_metrics(crew_copy.usage_metrics)
     crew.usage_metrics = total_usage_metrics
 
     crew._task_output_handler.reset()
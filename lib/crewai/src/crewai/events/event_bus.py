@@ -11,8 +11,9 @@ from collections.abc import Callable, Generator
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 import contextvars
+from dataclasses import dataclass
 import threading
-from typing import Any, Final, ParamSpec, TypeVar
+from typing import Any, Final, Generic, ParamSpec, TypeVar
 
 from typing_extensions import Self
 
@@ -35,6 +36,84 @@ from crewai.utilities.rw_lock import RWLock
 
 P = ParamSpec("P")
 R = TypeVar("R")
+V = TypeVar("V")
+
+_INLINE_EVENT_TYPES: Final[tuple[type[BaseEvent], ...]] = (LLMStreamChunkEvent,)
+"""Event types whose sync handlers always run in the emitting thread, in order."""
+
+
+class _HandlerTable(dict[type[BaseEvent], V], Generic[V]):
+    """Handler registry that invalidates resolved dispatch entries on change."""
+
+    __slots__ = ("_on_change",)
+
+    def __init__(
+        self, on_change: Callable[[], None], *args: Any, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._on_change = on_change
+
+    def __setitem__(self, key: type[BaseEvent], value: V) -> None:
+        super().__setitem__(key, value)
+        self._on_change()
+
+    def __delitem__(self, key: type[BaseEvent]) -> None:
+        super().__delitem__(key)
+        self._on_change()
+
+    def clear(self) -> None:
+        super().clear()
+        self._on_change()
+
+    def pop(self, *args: Any) -> Any:
+        result = super().pop(*args)
+        self._on_change()
+        return result
+
+    def popitem(self) -> tuple[type[BaseEvent], V]:
+        result = super().popitem()
+        self._on_change()
+        return result
+
+    def setdefault(self, key: type[BaseEvent], default: V) -> V:
+        result = super().setdefault(key, default)
+        self._on_change()
+        return result
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._on_change()
+
+
+def _discard_handler(
+    table: dict[type[BaseEvent], frozenset[V]],
+    event_type: type[BaseEvent],
+    handler: Any,
+) -> None:
+    handlers = table.get(event_type)
+    if handlers is not None and handler in handlers:
+        table[event_type] = handlers - {handler}
+
+
+@dataclass(frozen=True, slots=True)
+class _DispatchEntry:
+    """Handlers resolved for one event type, including base-class subscriptions.
+
+    Attributes:
+        inline: Sync handlers called in the emitting thread.
+        pooled: Sync handlers called on the sync handler pool.
+        async_handlers: Async handlers scheduled on the event loop.
+        has_dependencies: Whether any handler was registered with dependencies.
+    """
+
+    inline: SyncHandlerSet
+    pooled: SyncHandlerSet
+    async_handlers: AsyncHandlerSet
+    has_dependencies: bool
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.inline or self.pooled or self.async_handlers)
 
 
 class CrewAIEventsBus:
@@ -45,8 +124,15 @@ class CrewAIEventsBus:
     in a dedicated background event loop.
 
     Synchronous handlers execute in a thread pool executor to ensure completion
-    before program exit. Asynchronous handlers execute in a dedicated event loop
-    running in a daemon thread, with graceful shutdown waiting for completion.
+    before program exit, unless registered with ``inline=True``, in which case
+    they run in the emitting thread. Asynchronous handlers execute in a
+    dedicated event loop running in a daemon thread, with graceful shutdown
+    waiting for completion.
+
+    A handler registered for an event class also receives its subclasses. The
+    handlers of each emitted type are resolved once into a dispatch entry and
+    read without locking; any change to the handler tables drops the resolved
+    entries.
 
     Attributes:
         _instance: Singleton instance of the event bus
@@ -54,6 +140,9 @@ class CrewAIEventsBus:
         _rwlock: Read-write lock for handler registration and access (instance-level)
         _sync_handlers: Mapping of event types to registered synchronous handlers
         _async_handlers: Mapping of event types to registered asynchronous handlers
+        _inline_handlers: Mapping of event types to sync handlers run in the
+            emitting thread
+        _dispatch_cache: Resolved dispatch entries by emitted event type
         _sync_executor: Thread pool executor for running synchronous handlers
         _loop: Dedicated asyncio event loop for async handler execution
         _loop_thread: Background daemon thread running the event loop
@@ -63,9 +152,11 @@ class CrewAIEventsBus:
     _instance: Self | None = None
     _instance_lock: threading.RLock = threading.RLock()
     _rwlock: RWLock
-    _sync_handlers: dict[type[BaseEvent], SyncHandlerSet]
-    _async_handlers: dict[type[BaseEvent], AsyncHandlerSet]
-    _handler_dependencies: dict[type[BaseEvent], dict[Handler, list[Depends[Any]]]]
+    _sync_table: _HandlerTable[SyncHandlerSet]
+    _async_table: _HandlerTable[AsyncHandlerSet]
+    _inline_table: _HandlerTable[SyncHandlerSet]
+    _dependency_table: _HandlerTable[dict[Handler, list[Depends[Any]]]]
+    _dispatch_cache: dict[type[BaseEvent], _DispatchEntry]
     _execution_plan_cache: dict[type[BaseEvent], ExecutionPlan]
     _console: ConsoleFormatter
     _shutting_down: bool
@@ -91,12 +182,12 @@ class CrewAIEventsBus:
         """
         self._shutting_down = False
         self._rwlock = RWLock()
-        self._sync_handlers: dict[type[BaseEvent], SyncHandlerSet] = {}
-        self._async_handlers: dict[type[BaseEvent], AsyncHandlerSet] = {}
-        self._handler_dependencies: dict[
-            type[BaseEvent], dict[Handler, list[Depends[Any]]]
-        ] = {}
-        self._execution_plan_cache: dict[type[BaseEvent], ExecutionPlan] = {}
+        self._dispatch_cache = {}
+        self._execution_plan_cache = {}
+        self._sync_handlers = {}
+        self._async_handlers = {}
+        self._inline_handlers = {}
+        self._handler_dependencies = {}
         self._sync_executor = ThreadPoolExecutor(
             max_workers=10,
             thread_name_prefix="CrewAISyncHandler",
@@ -111,6 +202,55 @@ class CrewAIEventsBus:
         )
         self._loop_thread.start()
 
+    @property
+    def _sync_handlers(self) -> dict[type[BaseEvent], SyncHandlerSet]:
+        return self._sync_table
+
+    @_sync_handlers.setter
+    def _sync_handlers(self, value: dict[type[BaseEvent], SyncHandlerSet]) -> None:
+        self._sync_table = _HandlerTable(self._invalidate, value)
+        self._invalidate()
+
+    @property
+    def _async_handlers(self) -> dict[type[BaseEvent], AsyncHandlerSet]:
+        return self._async_table
+
+    @_async_handlers.setter
+    def _async_handlers(self, value: dict[type[BaseEvent], AsyncHandlerSet]) -> None:
+        self._async_table = _HandlerTable(self._invalidate, value)
+        self._invalidate()
+
+    @property
+    def _inline_handlers(self) -> dict[type[BaseEvent], SyncHandlerSet]:
+        return self._inline_table
+
+    @_inline_handlers.setter
+    def _inline_handlers(self, value: dict[type[BaseEvent], SyncHandlerSet]) -> None:
+        self._inline_table = _HandlerTable(self._invalidate, value)
+        self._invalidate()
+
+    @property
+    def _handler_dependencies(
+        self,
+    ) -> dict[type[BaseEvent], dict[Handler, list[Depends[Any]]]]:
+        return self._dependency_table
+
+    @_handler_dependencies.setter
+    def _handler_dependencies(
+        self, value: dict[type[BaseEvent], dict[Handler, list[Depends[Any]]]]
+    ) -> None:
+        self._dependency_table = _HandlerTable(self._invalidate, value)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop resolved dispatch entries after a handler table changed.
+
+        The caches are replaced rather than cleared, so an emit that resolved
+        an entry from the previous tables stores it in a discarded cache.
+        """
+        self._dispatch_cache = {}
+        self._execution_plan_cache = {}
+
     def _run_loop(self) -> None:
         """Run the background async event loop."""
         asyncio.set_event_loop(self._loop)
@@ -121,6 +261,7 @@ class CrewAIEventsBus:
         event_type: type[BaseEvent],
         handler: Callable[..., Any],
         dependencies: list[Depends[Any]] | None = None,
+        inline: bool = False,
     ) -> None:
         """Register a handler for the given event type.
 
@@ -128,6 +269,7 @@ class CrewAIEventsBus:
             event_type: The event class to listen for
             handler: The handler function to register
             dependencies: Optional list of dependencies
+            inline: Run a sync handler in the emitting thread
         """
         with self._rwlock.w_locked():
             if is_async_handler(handler):
@@ -136,25 +278,32 @@ class CrewAIEventsBus:
             else:
                 existing_sync = self._sync_handlers.get(event_type, frozenset())
                 self._sync_handlers[event_type] = existing_sync | {handler}
+                if inline:
+                    existing_inline = self._inline_handlers.get(event_type, frozenset())
+                    self._inline_handlers[event_type] = existing_inline | {handler}
 
             if dependencies:
                 if event_type not in self._handler_dependencies:
                     self._handler_dependencies[event_type] = {}
                 self._handler_dependencies[event_type][handler] = dependencies
 
-            self._execution_plan_cache.pop(event_type, None)
-
     def on(
         self,
         event_type: type[BaseEvent],
         depends_on: Depends[Any] | list[Depends[Any]] | None = None,
+        inline: bool = False,
     ) -> Callable[[Callable[P, R]], Callable[P, R]]:
         """Decorator to register an event handler for a specific event type.
 
+        The handler also receives events of subclasses of ``event_type``.
+
         Args:
             event_type: The event class to listen for
             depends_on: Optional dependency or list of dependencies. Handlers with
                        dependencies will execute after their dependencies complete.
+            inline: Run a sync handler in the emitting thread instead of the
+                    handler pool. Meant for cheap, non-blocking handlers; the
+                    emitter waits for them.
 
         Returns:
             Decorator function that registers the handler
@@ -185,11 +334,86 @@ class CrewAIEventsBus:
             if depends_on is not None:
                 deps = [depends_on] if isinstance(depends_on, Depends) else depends_on
 
-            self._register_handler(event_type, handler, dependencies=deps)
+            self._register_handler(
+                event_type, handler, dependencies=deps, inline=inline
+            )
             return handler
 
         return decorator
 
+    def _collect_handlers(
+        self, event_type: type[BaseEvent]
+    ) -> tuple[SyncHandlerSet, AsyncHandlerSet, dict[Handler, list[Depends[Any]]]]:
+        """Gather the handlers registered for an event type and its bases.
+
+        Must be called with the read or write lock held.
+
+        Args:
+            event_type: The emitted event class
+
+        Returns:
+            Sync handlers, async handlers and their dependencies
+        """
+        sync_handlers: SyncHandlerSet = frozenset()
+        async_handlers: AsyncHandlerSet = frozenset()
+        dependencies: dict[Handler, list[Depends[Any]]] = {}
+        for base in event_type.__mro__:
+            sync_handlers |= self._sync_handlers.get(base, frozenset())
+            async_handlers |= self._async_handlers.get(base, frozenset())
+            for handler, deps in self._handler_dependencies.get(base, {}).items():
+                dependencies.setdefault(handler, deps)
+        return sync_handlers, async_handlers, dependencies
+
+    def _dispatch_entry(self, event_type: type[BaseEvent]) -> _DispatchEntry:
+        """Return the resolved handlers of an event type.
+
+        Args:
+            event_type: The emitted event class
+
+        Returns:
+            The cached dispatch entry, resolved on first use
+        """
+        cache = self._dispatch_cache
+        entry = cache.get(event_type)
+        if entry is not None:
+            return entry
+
+        with self._rwlock.r_locked():
+            sync_handlers, async_handlers, dependencies = self._collect_handlers(
+                event_type
+            )
+            if issubclass(event_type, _INLINE_EVENT_TYPES):
+                inline = sync_handlers
+            else:
+                inline = frozenset().union(
+                    *(
+                        self._inline_handlers.get(base, frozenset())
+                        for base in event_type.__mro__
+                    )
+                )
+        entry = _DispatchEntry(
+            inline=sync_handlers & inline,
+            pooled=sync_handlers - inline,
+            async_handlers=async_handlers,
+            has_dependencies=bool(dependencies),
+        )
+        cache[event_type] = entry
+        return entry
+
+    def is_enabled(self, event_type: type[BaseEvent]) -> bool:
+        """Check whether emitting an event type would reach any handler.
+
+        Emitters of costly events can skip building them when this is False.
+
+        Args:
+            event_type: The event class to check
+
+        Returns:
+            True if a handler is registered for the type or one of its bases
+            and the bus is not shutting down
+        """
+        return not self._shutting_down and self._dispatch_entry(event_type).enabled
+
     def _call_handlers(
         self,
         source: Any,
@@ -252,50 +476,37 @@ class CrewAIEventsBus:
             event: The event instance to emit
         """
         event_type = type(event)
+        if self._shutting_down:
+            return
 
-        with self._rwlock.r_locked():
-            if self._shutting_down:
-                return
-            cached_plan = self._execution_plan_cache.get(event_type)
-            if cached_plan is not None:
-                sync_handlers = self._sync_handlers.get(event_type, frozenset())
-                async_handlers = self._async_handlers.get(event_type, frozenset())
-
+        entry = self._dispatch_entry(event_type)
+        plans = self._execution_plan_cache
+        cached_plan = plans.get(event_type)
         if cached_plan is None:
-            with self._rwlock.w_locked():
-                if self._shutting_down:
-                    return
-                cached_plan = self._execution_plan_cache.get(event_type)
-                if cached_plan is None:
-                    sync_handlers = self._sync_handlers.get(event_type, frozenset())
-                    async_handlers = self._async_handlers.get(event_type, frozenset())
-                    dependencies = dict(self._handler_dependencies.get(event_type, {}))
-                    all_handlers = list(sync_handlers | async_handlers)
-
-                    if not all_handlers:
-                        return
-
-                    cached_plan = build_execution_plan(all_handlers, dependencies)
-                    self._execution_plan_cache[event_type] = cached_plan
-                else:
-                    sync_handlers = self._sync_handlers.get(event_type, frozenset())
-                    async_handlers = self._async_handlers.get(event_type, frozenset())
+            with self._rwlock.r_locked():
+                sync_handlers, async_handlers, dependencies = self._collect_handlers(
+                    event_type
+                )
+            all_handlers = list(sync_handlers | async_handlers)
+            if not all_handlers:
+                return
+            cached_plan = build_execution_plan(all_handlers, dependencies)
+            plans[event_type] = cached_plan
 
         for level in cached_plan:
-            level_sync = frozenset(h for h in level if h in sync_handlers)
-            level_async = frozenset(h for h in level if h in async_handlers)
-
-            if level_sync:
-                if event_type is LLMStreamChunkEvent:
-                    self._call_handlers(source, event, level_sync)
-                else:
-                    ctx = contextvars.copy_context()
-                    future = self._sync_executor.submit(
-                        ctx.run, self._call_handlers, source, event, level_sync
-                    )
-                    await asyncio.get_running_loop().run_in_executor(
-                        None, future.result
-                    )
+            level_inline = frozenset(h for h in level if h in entry.inline)
+            level_pooled = frozenset(h for h in level if h in entry.pooled)
+            level_async = frozenset(h for h in level if h in entry.async_handlers)
+
+            if level_inline:
+                self._call_handlers(source, event, level_inline)
+
+            if level_pooled:
+                ctx = contextvars.copy_context()
+                future = self._sync_executor.submit(
+                    ctx.run, self._call_handlers, source, event, level_pooled
+                )
+                await asyncio.get_running_loop().run_in_executor(None, future.result)
 
             if level_async:
                 await self._acall_handlers(source, event, level_async)
@@ -304,8 +515,9 @@ class CrewAIEventsBus:
         """Emit an event to all registered handlers.
 
         If handlers have dependencies (registered with depends_on), they execute
-        in dependency order. Otherwise, handlers execute as before (sync in thread
-        pool, async fire-and-forget).
+        in dependency order. Otherwise, inline handlers run in the calling
+        thread, other sync handlers in the thread pool and async handlers
+        fire-and-forget.
 
         Stream chunk events always execute synchronously to preserve ordering.
 
@@ -315,10 +527,10 @@ class CrewAIEventsBus:
 
         Returns:
             Future that completes when handlers finish. Returns:
-            - Future for sync-only handlers (ThreadPoolExecutor future)
+            - Future for pooled sync-only handlers (ThreadPoolExecutor future)
             - Future for async handlers or mixed handlers (asyncio future)
             - Future for dependency-managed handlers (asyncio future)
-            - None if no handlers or sync stream chunk events
+            - None if no handlers or only inline handlers
 
         Example:
             >>> future = crewai_event_bus.emit(source, event)
@@ -326,38 +538,34 @@ class CrewAIEventsBus:
             ...     await asyncio.wrap_future(future)  # In async test
             ...     # or future.result(timeout=5.0) in sync code
         """
-        event_type = type(event)
+        if self._shutting_down:
+            self._console.print(
+                "[CrewAIEventsBus] Warning: Attempted to emit event during shutdown. Ignoring."
+            )
+            return None
 
-        with self._rwlock.r_locked():
-            if self._shutting_down:
-                self._console.print(
-                    "[CrewAIEventsBus] Warning: Attempted to emit event during shutdown. Ignoring."
-                )
-                return None
-            has_dependencies = event_type in self._handler_dependencies
-            sync_handlers = self._sync_handlers.get(event_type, frozenset())
-            async_handlers = self._async_handlers.get(event_type, frozenset())
+        entry = self._dispatch_entry(type(event))
 
-        if has_dependencies:
+        if entry.has_dependencies:
             return asyncio.run_coroutine_threadsafe(
                 self._emit_with_dependencies(source, event),
                 self._loop,
             )
 
-        if sync_handlers:
-            if event_type is LLMStreamChunkEvent:
-                self._call_handlers(source, event, sync_handlers)
-            else:
-                ctx = contextvars.copy_context()
-                sync_future = self._sync_executor.submit(
-                    ctx.run, self._call_handlers, source, event, sync_handlers
-                )
-                if not async_handlers:
-                    return sync_future
+        if entry.inline:
+            self._call_handlers(source, event, entry.inline)
 
-        if async_handlers:
+        if entry.pooled:
+            ctx = contextvars.copy_context()
+            sync_future = self._sync_executor.submit(
+                ctx.run, self._call_handlers, source, event, entry.pooled
+            )
+            if not entry.async_handlers:
+                return sync_future
+
+        if entry.async_handlers:
             return asyncio.run_coroutine_threadsafe(
-                self._acall_handlers(source, event, async_handlers),
+                self._acall_handlers(source, event, entry.async_handlers),
                 self._loop,
             )
 
@@ -372,16 +580,13 @@ class CrewAIEventsBus:
             source: The object emitting the event
             event: The event instance to emit
         """
-        event_type = type(event)
-
-        with self._rwlock.r_locked():
-            if self._shutting_down:
-                self._console.print(
-                    "[CrewAIEventsBus] Warning: Attempted to emit event during shutdown. Ignoring."
-                )
-                return
-            async_handlers = self._async_handlers.get(event_type, frozenset())
+        if self._shutting_down:
+            self._console.print(
+                "[CrewAIEventsBus] Warning: Attempted to emit event during shutdown. Ignoring."
+            )
+            return
 
+        async_handlers = self._dispatch_entry(type(event)).async_handlers
         if async_handlers:
             await self._acall_handlers(source, event, async_handlers)
 
@@ -389,14 +594,36 @@ class CrewAIEventsBus:
         self,
         event_type: type[BaseEvent],
         handler: SyncHandler | AsyncHandler,
+        inline: bool = False,
     ) -> None:
         """Register an event handler for a specific event type.
 
         Args:
             event_type: The event class to listen for
             handler: The handler function to register
+            inline: Run a sync handler in the emitting thread
         """
-        self._register_handler(event_type, handler)
+        self._register_handler(event_type, handler, inline=inline)
+
+    def unregister_handler(
+        self,
+        event_type: type[BaseEvent],
+        handler: SyncHandler | AsyncHandler,
+    ) -> None:
+        """Remove a handler registered for a specific event type.
+
+        Args:
+            event_type: The event class the handler was registered for
+            handler: The handler function to remove
+        """
+        with self._rwlock.w_locked():
+            _discard_handler(self._sync_handlers, event_type, handler)
+            _discard_handler(self._async_handlers, event_type, handler)
+            _discard_handler(self._inline_handlers, event_type, handler)
+            dependencies = self._handler_dependencies.get(event_type)
+            if dependencies is not None and handler in dependencies:
+                del dependencies[handler]
+                self._invalidate()
 
     def validate_dependencies(self) -> None:
         """Validate all registered handler dependencies.
@@ -411,9 +638,9 @@ class CrewAIEventsBus:
         """
         with self._rwlock.r_locked():
             for event_type in self._handler_dependencies:
-                sync_handlers = self._sync_handlers.get(event_type, frozenset())
-                async_handlers = self._async_handlers.get(event_type, frozenset())
-                dependencies = dict(self._handler_dependencies.get(event_type, {}))
+                sync_handlers, async_handlers, dependencies = self._collect_handlers(
+                    event_type
+                )
                 all_handlers = list(sync_handlers | async_handlers)
 
                 if all_handlers and dependencies:
@@ -441,12 +668,12 @@ class CrewAIEventsBus:
         with self._rwlock.w_locked():
             prev_sync = self._sync_handlers
             prev_async = self._async_handlers
+            prev_inline = self._inline_handlers
             prev_deps = self._handler_dependencies
-            prev_cache = self._execution_plan_cache
             self._sync_handlers = {}
             self._async_handlers = {}
+            self._inline_handlers = {}
             self._handler_dependencies = {}
-            self._execution_plan_cache = {}
 
         try:
             yield
@@ -454,8 +681,8 @@ class CrewAIEventsBus:
             with self._rwlock.w_locked():
                 self._sync_handlers = prev_sync
                 self._async_handlers = prev_async
+                self._inline_handlers = prev_inline
                 self._handler_dependencies = prev_deps
-                self._execution_plan_cache = prev_cache
 
     def shutdown(self, wait: bool = True) -> None:
         """Gracefully shutdown the event loop and wait for all tasks to finish.
@@ -504,7 +731,7 @@ class CrewAIEventsBus:
         with self._rwlock.w_locked():
             self._sync_handlers.clear()
             self._async_handlers.clear()
-            self._execution_plan_cache.clear()
+            self._inline_handlers.clear()
 
 
 crewai_event_bus: Final[CrewAIEventsBus] = CrewAIEventsBus()
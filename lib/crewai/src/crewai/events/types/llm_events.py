@@ -50,13 +50,21 @@ class LLMCallStartedEvent(LLMEventBase):
 
 
 class LLMCallCompletedEvent(LLMEventBase):
-    """Event emitted when a LLM call completes"""
+    """Event emitted when a LLM call completes
+
+    Attributes:
+        cache_hit: Whether the response came from the LLM's response cache,
+            or None when the LLM has no cache.
+        cache_stats: Hit, miss, eviction and size counters of that cache.
+    """
 
     type: str = "llm_call_completed"
     messages: str | list[dict[str, Any]] | None = None
     response: Any
     call_type: LLMCallType
     model: str | None = None
+    cache_hit: bool | None = None
+    cache_stats: dict[str, int] | None = None
 
 
 class LLMCallFailedEvent(LLMEventBase):
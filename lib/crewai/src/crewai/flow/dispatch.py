@@ -0,0 +1,222 @@
+"""Precompiled listener dispatch for flows.
+
+The dispatch table is built once per flow class. It maps each trigger (a
+method name or router output) to the listeners, routers and start methods
+whose conditions mention it, and holds the conditions in a normalized form, so
+completing a method only evaluates the methods it can actually trigger.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from crewai.flow.constants import AND_CONDITION, OR_CONDITION
+from crewai.flow.flow_wrappers import FlowCondition, SimpleFlowCondition
+from crewai.flow.types import FlowMethodName, PendingListenerKey
+from crewai.flow.utils import (
+    _extract_all_methods,
+    _normalize_condition,
+    is_flow_condition_dict,
+    is_flow_method_name,
+    is_simple_flow_condition,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCondition:
+    """A normalized AND/OR condition node.
+
+    Attributes:
+        type: ``AND_CONDITION`` or ``OR_CONDITION``.
+        conditions: Method names and nested nodes, in declaration order.
+        methods: Method names that must all complete for an AND node.
+        key: Suffix of the node's pending-state key; empty for the top-level
+            condition of a ``(type, methods)`` listener, which is keyed by the
+            listener name alone.
+    """
+
+    type: str
+    conditions: tuple[FlowMethodName | CompiledCondition, ...]
+    methods: frozenset[FlowMethodName]
+    key: str
+
+    def pending_key(self, listener_name: FlowMethodName) -> PendingListenerKey:
+        """Return the key of this node's AND state for a listener."""
+        if not self.key:
+            return PendingListenerKey(listener_name)
+        return PendingListenerKey(f"{listener_name}:{self.key}")
+
+    def triggers(self) -> set[FlowMethodName]:
+        """Return every method name or router output in the condition tree."""
+        names: set[FlowMethodName] = set()
+        for condition in self.conditions:
+            if isinstance(condition, CompiledCondition):
+                names |= condition.triggers()
+            else:
+                names.add(condition)
+        return names
+
+
+def compile_condition(
+    condition: SimpleFlowCondition | FlowCondition, key: str = "0"
+) -> CompiledCondition:
+    """Compile a listener condition into a ``CompiledCondition`` tree.
+
+    Args:
+        condition: A ``(type, methods)`` tuple or a condition dictionary.
+        key: Key of the node within its listener.
+
+    Returns:
+        The compiled condition.
+    """
+    if is_simple_flow_condition(condition):
+        condition_type, methods = condition
+        return CompiledCondition(
+            type=condition_type,
+            conditions=tuple(methods),
+            methods=frozenset(methods),
+            key="",
+        )
+    normalized = _normalize_condition(condition)
+    conditions: list[FlowMethodName | CompiledCondition] = []
+    for idx, sub_condition in enumerate(normalized.get("conditions", [])):
+        if is_flow_condition_dict(sub_condition):
+            conditions.append(compile_condition(sub_condition, f"{key}.{idx}"))
+        elif is_flow_method_name(sub_condition):
+            conditions.append(sub_condition)
+    return CompiledCondition(
+        type=normalized.get("type", OR_CONDITION),
+        conditions=tuple(conditions),
+        methods=frozenset(_extract_all_methods(condition)),
+        key=key,
+    )
+
+
+@dataclass(slots=True)
+class DispatchTable:
+    """Trigger index of a flow class.
+
+    Attributes:
+        conditions: Compiled condition of every listener and router.
+        routers: Routers to evaluate per trigger, in declaration order.
+        listeners: Non-start listeners to evaluate per trigger, in declaration
+            order.
+        start_methods: Conditional start methods re-run when a router emits
+            the trigger.
+        accepts_result: Whether each method takes the triggering result,
+            filled in on first execution.
+    """
+
+    conditions: dict[FlowMethodName, CompiledCondition] = field(default_factory=dict)
+    routers: dict[FlowMethodName, tuple[FlowMethodName, ...]] = field(
+        default_factory=dict
+    )
+    listeners: dict[FlowMethodName, tuple[FlowMethodName, ...]] = field(
+        default_factory=dict
+    )
+    start_methods: dict[FlowMethodName, tuple[FlowMethodName, ...]] = field(
+        default_factory=dict
+    )
+    accepts_result: dict[FlowMethodName, bool] = field(default_factory=dict)
+
+
+def _index(
+    entries: Iterable[tuple[FlowMethodName, Iterable[FlowMethodName]]],
+) -> dict[FlowMethodName, tuple[FlowMethodName, ...]]:
+    index: dict[FlowMethodName, list[FlowMethodName]] = {}
+    for name, triggers in entries:
+        for trigger in dict.fromkeys(triggers):
+            index.setdefault(trigger, []).append(name)
+    return {trigger: tuple(names) for trigger, names in index.items()}
+
+
+def build_dispatch_table(
+    listeners: Mapping[FlowMethodName, SimpleFlowCondition | FlowCondition],
+    routers: set[FlowMethodName],
+    start_methods: list[FlowMethodName],
+) -> DispatchTable:
+    """Build the dispatch table of a flow class.
+
+    Args:
+        listeners: Condition of every listener and router, by method name.
+        routers: Names of the router methods.
+        start_methods: Names of the start methods.
+
+    Returns:
+        The dispatch table.
+    """
+    conditions = {
+        name: compile_condition(condition) for name, condition in listeners.items()
+    }
+    starts = set(start_methods)
+
+    start_triggers: list[tuple[FlowMethodName, Iterable[FlowMethodName]]] = []
+    for name in start_methods:
+        condition = listeners.get(name)
+        if is_simple_flow_condition(condition):
+            start_triggers.append((name, condition[1]))
+        elif isinstance(condition, dict):
+            start_triggers.append((name, _extract_all_methods(condition)))
+
+    return DispatchTable(
+        conditions=conditions,
+        routers=_index(
+            (name, compiled.triggers())
+            for name, compiled in conditions.items()
+            if name in routers
+        ),
+        listeners=_index(
+            (name, compiled.triggers())
+            for name, compiled in conditions.items()
+            if name not in routers and name not in starts
+        ),
+        start_methods=_index(start_triggers),
+    )
+
+
+def evaluate_condition(
+    condition: CompiledCondition,
+    trigger_method: FlowMethodName,
+    listener_name: FlowMethodName,
+    pending: dict[PendingListenerKey, set[FlowMethodName]],
+) -> bool:
+    """Advance a compiled condition with a completed trigger.
+
+    AND nodes track the methods still awaited in ``pending``; the entry is
+    removed once the node is satisfied so that cyclic flows start over.
+
+    Args:
+        condition: The compiled condition.
+        trigger_method: The method that just completed, or a router output.
+        listener_name: Name of the listener owning the condition.
+        pending: The flow's AND state.
+
+    Returns:
+        True if the condition is satisfied.
+    """
+    if condition.type == OR_CONDITION:
+        return any(
+            sub_condition == trigger_method
+            if not isinstance(sub_condition, CompiledCondition)
+            else evaluate_condition(
+                sub_condition, trigger_method, listener_name, pending
+            )
+            for sub_condition in condition.conditions
+        )
+
+    if condition.type == AND_CONDITION:
+        pending_key = condition.pending_key(listener_name)
+        awaited = pending.setdefault(pending_key, set(condition.methods))
+        awaited.discard(trigger_method)
+
+        nested_satisfied = all(
+            evaluate_condition(sub_condition, trigger_method, listener_name, pending)
+            for sub_condition in condition.conditions
+            if isinstance(sub_condition, CompiledCondition)
+        )
+        if not awaited and nested_satisfied:
+            pending.pop(pending_key, None)
+            return True
+
+    return False
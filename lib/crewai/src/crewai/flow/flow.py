@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
-from concurrent.futures import Future
+from concurrent.futures import Executor, Future
+import contextvars
 import copy
+import functools
 import inspect
 import logging
 from typing import (
@@ -48,6 +50,11 @@ from crewai.events.types.flow_events import (
     MethodExecutionStartedEvent,
 )
 from crewai.flow.constants import AND_CONDITION, OR_CONDITION
+from crewai.flow.dispatch import (
+    DispatchTable,
+    build_dispatch_table,
+    evaluate_condition,
+)
 from crewai.flow.flow_wrappers import (
     FlowCondition,
     FlowConditions,
@@ -61,13 +68,11 @@ from crewai.flow.persistence.base import FlowPersistence
 from crewai.flow.types import FlowExecutionData, FlowMethodName, PendingListenerKey
 from crewai.flow.utils import (
     _extract_all_methods,
-    _normalize_condition,
     get_possible_return_constants,
     is_flow_condition_dict,
     is_flow_method,
     is_flow_method_callable,
     is_flow_method_name,
-    is_simple_flow_condition,
 )
 from crewai.flow.visualization import build_flow_structure, render_interactive
 from crewai.types.streaming import CrewStreamingOutput, FlowStreamingOutput
@@ -85,6 +90,37 @@ from crewai.utilities.streaming import (
 logger = logging.getLogger(__name__)
 
 
+_MISSING: Any = object()
+
+
+def _share_unchanged(previous: Any, current: Any) -> Any:
+    """Returns ``previous`` if ``current`` equals it with the same types throughout.
+
+    Otherwise the unchanged items of changed dictionaries and lists in
+    ``current`` are replaced by those of ``previous``, so only the changed parts
+    of a snapshot are new objects. Values that compare equal across types, such
+    as ``1``, ``1.0`` and ``True``, are not shared.
+    """
+    if type(previous) is not type(current):
+        return current
+    if isinstance(current, dict):
+        unchanged = previous.keys() == current.keys()
+        for key, value in current.items():
+            old = previous.get(key, _MISSING)
+            if old is _MISSING:
+                continue
+            current[key] = _share_unchanged(old, value)
+            unchanged = unchanged and current[key] is old
+        return previous if unchanged else current
+    if isinstance(current, list):
+        unchanged = len(previous) == len(current)
+        for index, (old, value) in enumerate(zip(previous, current, strict=False)):
+            current[index] = _share_unchanged(old, value)
+            unchanged = unchanged and current[index] is old
+        return previous if unchanged else current
+    return previous if previous == current else current
+
+
 class FlowState(BaseModel):
     """Base model for all flow states, ensuring each state has a unique ID."""
 
@@ -447,6 +483,11 @@ class FlowMeta(type):
         cls._listeners = listeners  # type: ignore[attr-defined]
         cls._routers = routers  # type: ignore[attr-defined]
         cls._router_paths = router_paths  # type: ignore[attr-defined]
+        cls._dispatch = build_dispatch_table(  # type: ignore[attr-defined]
+            listeners,  # type: ignore[arg-type]
+            routers,  # type: ignore[arg-type]
+            start_methods,  # type: ignore[arg-type]
+        )
 
         return cls
 
@@ -454,7 +495,15 @@ class FlowMeta(type):
 class Flow(Generic[T], metaclass=FlowMeta):
     """Base class for all flows.
 
-    type parameter T must be either dict[str, Any] or a subclass of BaseModel."""
+    type parameter T must be either dict[str, Any] or a subclass of BaseModel.
+
+    Synchronous flow methods run on the event loop one at a time unless
+    ``method_executor`` is ``"thread"``, which dispatches them to the loop's
+    default thread pool so that parallel listeners (for example several
+    methods each kicking off a crew) overlap. An ``Executor`` instance is used
+    as given; it must run the methods in this process, since they share the
+    flow's state. ``max_method_concurrency`` caps how many synchronous methods
+    of one run are dispatched at once."""
 
     _printer: ClassVar[Printer] = Printer()
 
@@ -462,10 +511,13 @@ class Flow(Generic[T], metaclass=FlowMeta):
     _listeners: ClassVar[dict[FlowMethodName, SimpleFlowCondition | FlowCondition]] = {}
     _routers: ClassVar[set[FlowMethodName]] = set()
     _router_paths: ClassVar[dict[FlowMethodName, list[FlowMethodName]]] = {}
+    _dispatch: ClassVar[DispatchTable] = DispatchTable()
     initial_state: type[T] | T | None = None
     name: str | None = None
     tracing: bool | None = None
     stream: bool = False
+    method_executor: Literal["inline", "thread"] | Executor = "inline"
+    max_method_concurrency: int | None = None
 
     def __class_getitem__(cls: type[Flow[T]], item: type[T]) -> type[Flow[T]]:
         class _FlowGeneric(cls):  # type: ignore
@@ -498,6 +550,8 @@ class Flow(Generic[T], metaclass=FlowMeta):
         self._persistence: FlowPersistence | None = persistence
         self._is_execution_resuming: bool = False
         self._event_futures: list[Future[None]] = []
+        self._method_semaphore: asyncio.Semaphore | None = None
+        self._last_state_snapshot: dict[str, Any] | None = None
 
         # Initialize state with initial values
         self._state = self._create_initial_state()
@@ -935,6 +989,12 @@ class Flow(Generic[T], metaclass=FlowMeta):
         flow_token = attach(ctx)
 
         try:
+            self._method_semaphore = (
+                asyncio.Semaphore(self.max_method_concurrency)
+                if self.max_method_concurrency
+                else None
+            )
+
             # Reset flow state for fresh execution unless restoring from persistence
             is_restoring = inputs and "id" in inputs and self._persistence is not None
             if not is_restoring:
@@ -1002,17 +1062,18 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
             final_output = self._method_outputs[-1] if self._method_outputs else None
 
-            future = crewai_event_bus.emit(
-                self,
-                FlowFinishedEvent(
-                    type="flow_finished",
-                    flow_name=self.name or self.__class__.__name__,
-                    result=final_output,
-                    state=self._copy_and_serialize_state(),
-                ),
-            )
-            if future:
-                self._event_futures.append(future)
+            if crewai_event_bus.is_enabled(FlowFinishedEvent):
+                future = crewai_event_bus.emit(
+                    self,
+                    FlowFinishedEvent(
+                        type="flow_finished",
+                        flow_name=self.name or self.__class__.__name__,
+                        result=final_output,
+                        state=self._copy_and_serialize_state(),
+                    ),
+                )
+                if future:
+                    self._event_futures.append(future)
 
             if self._event_futures:
                 await asyncio.gather(
@@ -1121,28 +1182,24 @@ class Flow(Generic[T], metaclass=FlowMeta):
         **kwargs: Any,
     ) -> Any:
         try:
-            dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
-                kwargs or {}
-            )
-
-            future = crewai_event_bus.emit(
-                self,
-                MethodExecutionStartedEvent(
-                    type="method_execution_started",
-                    method_name=method_name,
-                    flow_name=self.name or self.__class__.__name__,
-                    params=dumped_params,
-                    state=self._copy_and_serialize_state(),
-                ),
-            )
-            if future:
-                self._event_futures.append(future)
+            if crewai_event_bus.is_enabled(MethodExecutionStartedEvent):
+                dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
+                    kwargs or {}
+                )
+                future = crewai_event_bus.emit(
+                    self,
+                    MethodExecutionStartedEvent(
+                        type="method_execution_started",
+                        method_name=method_name,
+                        flow_name=self.name or self.__class__.__name__,
+                        params=dumped_params,
+                        state=self._copy_and_serialize_state(),
+                    ),
+                )
+                if future:
+                    self._event_futures.append(future)
 
-            result = (
-                await method(*args, **kwargs)
-                if asyncio.iscoroutinefunction(method)
-                else method(*args, **kwargs)
-            )
+            result = await self._call_method(method, *args, **kwargs)
 
             self._method_outputs.append(result)
             self._method_execution_counts[method_name] = (
@@ -1151,18 +1208,19 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
             self._completed_methods.add(method_name)
 
-            future = crewai_event_bus.emit(
-                self,
-                MethodExecutionFinishedEvent(
-                    type="method_execution_finished",
-                    method_name=method_name,
-                    flow_name=self.name or self.__class__.__name__,
-                    state=self._copy_and_serialize_state(),
-                    result=result,
-                ),
-            )
-            if future:
-                self._event_futures.append(future)
+            if crewai_event_bus.is_enabled(MethodExecutionFinishedEvent):
+                future = crewai_event_bus.emit(
+                    self,
+                    MethodExecutionFinishedEvent(
+                        type="method_execution_finished",
+                        method_name=method_name,
+                        flow_name=self.name or self.__class__.__name__,
+                        state=self._copy_and_serialize_state(),
+                        result=result,
+                    ),
+                )
+                if future:
+                    self._event_futures.append(future)
 
             return result
         except Exception as e:
@@ -1179,15 +1237,50 @@ class Flow(Generic[T], metaclass=FlowMeta):
                 self._event_futures.append(future)
             raise e
 
+    async def _call_method(
+        self, method: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Calls a flow method, dispatching sync methods per ``method_executor``."""
+        if asyncio.iscoroutinefunction(method):
+            return await method(*args, **kwargs)
+        if self.method_executor == "inline":
+            return method(*args, **kwargs)
+        if self._method_semaphore is None:
+            return await self._dispatch_sync_method(method, *args, **kwargs)
+        async with self._method_semaphore:
+            return await self._dispatch_sync_method(method, *args, **kwargs)
+
+    async def _dispatch_sync_method(
+        self, method: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        if not isinstance(self.method_executor, Executor):
+            return await asyncio.to_thread(method, *args, **kwargs)
+        ctx = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self.method_executor, functools.partial(ctx.run, method, *args, **kwargs)
+        )
+
     def _copy_and_serialize_state(self) -> dict[str, Any]:
-        state_copy = self._copy_state()
-        if isinstance(state_copy, BaseModel):
+        """Returns a snapshot of the state for flow events.
+
+        Model states are dumped to JSON-compatible data directly, since the dump
+        already builds new containers. Values equal to those of the previous
+        snapshot are taken from it, so consecutive snapshots share unchanged
+        subtrees instead of each holding a full copy. Snapshots must therefore
+        be treated as read-only. Callers skip the snapshot when no handler
+        listens for the event it is built for.
+        """
+        if isinstance(self._state, BaseModel):
             try:
-                return state_copy.model_dump(mode="json")
+                snapshot = self._state.model_dump(mode="json")
             except Exception:
-                return state_copy.model_dump()
-        else:
-            return state_copy
+                return self._copy_state().model_dump()  # type: ignore[union-attr]
+            snapshot = cast(
+                dict[str, Any], _share_unchanged(self._last_state_snapshot, snapshot)
+            )
+            self._last_state_snapshot = snapshot
+            return snapshot
+        return self._copy_state()  # type: ignore[return-value]
 
     async def _execute_listeners(
         self, trigger_method: FlowMethodName, result: Any
@@ -1249,89 +1342,18 @@ class Flow(Generic[T], metaclass=FlowMeta):
                     await asyncio.gather(*tasks)
 
                 if current_trigger in router_results:
-                    # Find start methods triggered by this router result
-                    for method_name in self._start_methods:
-                        # Check if this start method is triggered by the current trigger
-                        if method_name in self._listeners:
-                            condition_data = self._listeners[method_name]
-                            should_trigger = False
-                            if is_simple_flow_condition(condition_data):
-                                _, trigger_methods = condition_data
-                                should_trigger = current_trigger in trigger_methods
-                            elif isinstance(condition_data, dict):
-                                all_methods = _extract_all_methods(condition_data)
-                                should_trigger = current_trigger in all_methods
-
-                            if should_trigger:
-                                # Only execute if this is a cycle (method was already completed)
-                                if method_name in self._completed_methods:
-                                    # For router-triggered start methods in cycles, temporarily clear resumption flag
-                                    # to allow cyclic execution
-                                    was_resuming = self._is_execution_resuming
-                                    self._is_execution_resuming = False
-                                    await self._execute_start_method(method_name)
-                                    self._is_execution_resuming = was_resuming
-
-    def _evaluate_condition(
-        self,
-        condition: FlowMethodName | FlowCondition,
-        trigger_method: FlowMethodName,
-        listener_name: FlowMethodName,
-    ) -> bool:
-        """Recursively evaluate a condition (simple or nested).
-
-        Args:
-            condition: Can be a string (method name) or dict (nested condition)
-            trigger_method: The method that just completed
-            listener_name: Name of the listener being evaluated
-
-        Returns:
-            True if the condition is satisfied, False otherwise
-        """
-        if is_flow_method_name(condition):
-            return condition == trigger_method
-
-        if is_flow_condition_dict(condition):
-            normalized = _normalize_condition(condition)
-            cond_type = normalized.get("type", OR_CONDITION)
-            sub_conditions = normalized.get("conditions", [])
-
-            if cond_type == OR_CONDITION:
-                return any(
-                    self._evaluate_condition(sub_cond, trigger_method, listener_name)
-                    for sub_cond in sub_conditions
-                )
-
-            if cond_type == AND_CONDITION:
-                pending_key = PendingListenerKey(f"{listener_name}:{id(condition)}")
-
-                if pending_key not in self._pending_and_listeners:
-                    all_methods = set(_extract_all_methods(condition))
-                    self._pending_and_listeners[pending_key] = all_methods
-
-                if trigger_method in self._pending_and_listeners[pending_key]:
-                    self._pending_and_listeners[pending_key].discard(trigger_method)
-
-                direct_methods_satisfied = not self._pending_and_listeners[pending_key]
-
-                nested_conditions_satisfied = all(
-                    (
-                        self._evaluate_condition(
-                            sub_cond, trigger_method, listener_name
-                        )
-                        if is_flow_condition_dict(sub_cond)
-                        else True
-                    )
-                    for sub_cond in sub_conditions
-                )
-
-                if direct_methods_satisfied and nested_conditions_satisfied:
-                    self._pending_and_listeners.pop(pending_key, None)
-                    return True
-
-                return False
-
-        return False
+                    # Start methods triggered by this router result
+                    for method_name in self._dispatch.start_methods.get(
+                        current_trigger, ()
+                    ):
+                        # Only execute if this is a cycle (method was already completed)
+                        if method_name in self._completed_methods:
+                            # For router-triggered start methods in cycles, temporarily clear resumption flag
+                            # to allow cyclic execution
+                            was_resuming = self._is_execution_resuming
+                            self._is_execution_resuming = False
+                            await self._execute_start_method(method_name)
+                            self._is_execution_resuming = was_resuming
 
     def _find_triggered_methods(
         self, trigger_method: FlowMethodName, router_only: bool
@@ -1340,6 +1362,8 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
         This internal method evaluates both OR and AND conditions to determine
         which methods should be executed next in the flow. Supports nested conditions.
+        Only methods whose condition mentions the trigger are evaluated, using
+        the class's precompiled dispatch table.
 
         Args:
             trigger_method: The name of the method that just completed execution.
@@ -1353,41 +1377,29 @@ class Flow(Generic[T], metaclass=FlowMeta):
             - Maintains state for AND conditions using _pending_and_listeners
             - Separates router and normal listener evaluation
         """
-        triggered: list[FlowMethodName] = []
-
-        for listener_name, condition_data in self._listeners.items():
-            is_router = listener_name in self._routers
-
-            if router_only != is_router:
-                continue
-
-            if not router_only and listener_name in self._start_methods:
-                continue
-
-            if is_simple_flow_condition(condition_data):
-                condition_type, methods = condition_data
-
-                if condition_type == OR_CONDITION:
-                    if trigger_method in methods:
-                        triggered.append(listener_name)
-                elif condition_type == AND_CONDITION:
-                    pending_key = PendingListenerKey(listener_name)
-                    if pending_key not in self._pending_and_listeners:
-                        self._pending_and_listeners[pending_key] = set(methods)
-                    if trigger_method in self._pending_and_listeners[pending_key]:
-                        self._pending_and_listeners[pending_key].discard(trigger_method)
-
-                    if not self._pending_and_listeners[pending_key]:
-                        triggered.append(listener_name)
-                        self._pending_and_listeners.pop(pending_key, None)
-
-            elif is_flow_condition_dict(condition_data):
-                if self._evaluate_condition(
-                    condition_data, trigger_method, listener_name
-                ):
-                    triggered.append(listener_name)
+        dispatch = self._dispatch
+        candidates = (dispatch.routers if router_only else dispatch.listeners).get(
+            trigger_method, ()
+        )
+        return [
+            listener_name
+            for listener_name in candidates
+            if evaluate_condition(
+                dispatch.conditions[listener_name],
+                trigger_method,
+                listener_name,
+                self._pending_and_listeners,
+            )
+        ]
 
-        return triggered
+    def _accepts_trigger_result(self, method_name: FlowMethodName) -> bool:
+        """Returns whether a method takes the result of the method that triggered it."""
+        accepts_result = self._dispatch.accepts_result.get(method_name)
+        if accepts_result is None:
+            params = inspect.signature(self._methods[method_name]).parameters
+            accepts_result = any(name != "self" for name in params)
+            self._dispatch.accepts_result[method_name] = accepts_result
+        return accepts_result
 
     async def _execute_single_listener(
         self, listener_name: FlowMethodName, result: Any
@@ -1421,11 +1433,7 @@ class Flow(Generic[T], metaclass=FlowMeta):
         try:
             method = self._methods[listener_name]
 
-            sig = inspect.signature(method)
-            params = list(sig.parameters.values())
-            method_params = [p for p in params if p.name != "self"]
-
-            if method_params:
+            if self._accepts_trigger_result(listener_name):
                 listener_result = await self._execute_method(
                     listener_name, method, result
                 )
@@ -2,16 +2,69 @@
 SQLite-based implementation of flow state persistence.
 """
 
+from __future__ import annotations
+
+import atexit
+import copy
 from datetime import datetime, timezone
 import json
+import logging
 from pathlib import Path
 import sqlite3
-from typing import Any
+import threading
+import time
+from typing import Any, Final, Literal, NamedTuple, cast
+import zlib
 
 from pydantic import BaseModel
 
 from crewai.flow.persistence.base import FlowPersistence
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import get_sqlite_pool
+
+
+logger = logging.getLogger(__name__)
+
+Compression = Literal["zlib", "zstd"]
+
+_FULL_STATE_INTERVAL: Final[int] = 20
+"""Maximum number of delta rows written between two full states of a flow."""
+
+
+class _PendingState(NamedTuple):
+    method_name: str
+    timestamp: str
+    state: dict[str, Any]
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """Whether two state values are equal and of the same types throughout.
+
+    Plain ``==`` treats ``1``, ``1.0`` and ``True`` as equal, but they encode
+    to different JSON.
+    """
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(
+            _same_value(value, new[key]) for key, value in old.items()
+        )
+    if isinstance(old, (list, tuple)):
+        return len(old) == len(new) and all(
+            _same_value(a, b) for a, b in zip(old, new, strict=True)
+        )
+    return bool(old == new)
+
+
+def _load_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd compression of flow states requires the 'zstandard' package. "
+            "Install it with: uv add zstandard"
+        ) from e
+    return zstandard
 
 
 class SQLiteFlowPersistence(FlowPersistence):
@@ -20,17 +73,47 @@ class SQLiteFlowPersistence(FlowPersistence):
     This class provides a simple, file-based persistence implementation using SQLite.
     It's suitable for development and testing, or for production use cases with
     moderate performance requirements.
+
+    States are written through a pooled WAL connection. Optionally, saves are
+    queued and written by a background thread, keeping only the latest pending
+    state of each flow; states are stored as deltas against the previous
+    checkpoint and/or compressed; and older checkpoints are pruned.
     """
 
-    def __init__(self, db_path: str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | None = None,
+        *,
+        write_behind: bool = False,
+        flush_interval: float = 0.05,
+        delta: bool = False,
+        compression: Compression | None = None,
+        max_checkpoints: int | None = None,
+    ) -> None:
         """Initialize SQLite persistence.
 
         Args:
             db_path: Path to the SQLite database file. If not provided, uses
                     db_storage_path() from utilities.paths.
+            write_behind: Queue saves and write them from a background thread.
+                    Saves of the same flow made before the queue is written
+                    are coalesced into the latest one. Call ``flush`` or
+                    ``close`` to wait for queued writes.
+            flush_interval: Seconds the background writer waits to collect
+                    more saves before writing a batch.
+            delta: Store only the top-level state fields that changed since
+                    the previous checkpoint of the flow, with a full state at
+                    least every 20 checkpoints. Assumes a single writer per
+                    flow uuid.
+            compression: Compress stored states with ``"zlib"`` or ``"zstd"``
+                    (requires the ``zstandard`` package).
+            max_checkpoints: Number of checkpoints kept per flow. Older ones
+                    are deleted after each write, except those a kept delta
+                    still depends on. None keeps every checkpoint.
 
         Raises:
-            ValueError: If db_path is invalid
+            ValueError: If db_path is invalid or max_checkpoints is below 1.
+            ImportError: If zstd compression is requested without zstandard.
         """
 
         # Get path from argument or default location
@@ -38,13 +121,37 @@ class SQLiteFlowPersistence(FlowPersistence):
 
         if not path:
             raise ValueError("Database path must be provided")
+        if max_checkpoints is not None and max_checkpoints < 1:
+            raise ValueError("max_checkpoints must be at least 1")
+        if compression == "zstd":
+            _load_zstandard()
 
         self.db_path = path  # Now mypy knows this is str
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.delta = delta
+        self.compression = compression
+        self.max_checkpoints = max_checkpoints
+        self._pool = get_sqlite_pool(self.db_path)
+
+        # Last state written per flow and deltas written since its last full
+        # state, used to encode deltas.
+        self._write_lock = threading.Lock()
+        self._last_states: dict[str, dict[str, Any]] = {}
+        self._chain_lengths: dict[str, int] = {}
+
+        self._cond = threading.Condition()
+        self._pending: dict[str, _PendingState] = {}
+        self._writing: dict[str, _PendingState] = {}
+        self._flush_requests = 0
+        self._closed = False
+        self._worker: threading.Thread | None = None
+
         self.init_db()
 
     def init_db(self) -> None:
         """Create the necessary tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.transaction() as conn:
             conn.execute(
                 """
             CREATE TABLE IF NOT EXISTS flow_states (
@@ -52,15 +159,29 @@ class SQLiteFlowPersistence(FlowPersistence):
                 flow_uuid TEXT NOT NULL,
                 method_name TEXT NOT NULL,
                 timestamp DATETIME NOT NULL,
-                state_json TEXT NOT NULL
+                state_json TEXT NOT NULL,
+                encoding TEXT NOT NULL DEFAULT 'json',
+                is_delta INTEGER NOT NULL DEFAULT 0
             )
             """
             )
-            # Add index for faster UUID lookups
+            # Databases created by earlier versions lack the encoding columns.
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(flow_states)")}
+            if "encoding" not in columns:
+                conn.execute(
+                    "ALTER TABLE flow_states ADD COLUMN encoding TEXT NOT NULL DEFAULT 'json'"
+                )
+            if "is_delta" not in columns:
+                conn.execute(
+                    "ALTER TABLE flow_states ADD COLUMN is_delta INTEGER NOT NULL DEFAULT 0"
+                )
+            # The latest checkpoints of a flow are read and pruned by walking
+            # this index backwards; it supersedes the single-column index.
+            conn.execute("DROP INDEX IF EXISTS idx_flow_states_uuid")
             conn.execute(
                 """
-            CREATE INDEX IF NOT EXISTS idx_flow_states_uuid
-            ON flow_states(flow_uuid)
+            CREATE INDEX IF NOT EXISTS idx_flow_states_uuid_id
+            ON flow_states(flow_uuid, id)
             """
             )
 
@@ -79,54 +200,277 @@ class SQLiteFlowPersistence(FlowPersistence):
         """
         # Convert state_data to dict, handling both Pydantic and dict cases
         if isinstance(state_data, BaseModel):
-            state_dict = state_data.model_dump()
+            state_dict = state_data.model_dump(mode="json")
         elif isinstance(state_data, dict):
-            state_dict = state_data
+            # A dict state is the flow's live state; snapshot it when it is
+            # kept beyond this call.
+            state_dict = (
+                copy.deepcopy(state_data)
+                if self.write_behind or self.delta
+                else state_data
+            )
         else:
             raise ValueError(
                 f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
             )
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-            INSERT INTO flow_states (
-                flow_uuid,
-                method_name,
-                timestamp,
-                state_json
-            ) VALUES (?, ?, ?, ?)
-            """,
-                (
-                    flow_uuid,
-                    method_name,
-                    datetime.now(timezone.utc).isoformat(),
-                    json.dumps(state_dict),
-                ),
-            )
+        entry = _PendingState(
+            method_name, datetime.now(timezone.utc).isoformat(), state_dict
+        )
+        if not self.write_behind:
+            self._write({flow_uuid: entry})
+            return
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot save state: persistence is closed")
+            self._pending[flow_uuid] = entry
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_writer,
+                    name="crewai-flow-persistence",
+                    daemon=True,
+                )
+                self._worker.start()
+                atexit.register(self.close)
+            self._cond.notify_all()
 
     def load_state(self, flow_uuid: str) -> dict[str, Any] | None:
         """Load the most recent state for a given flow UUID.
 
+        States still queued for writing are returned without waiting for them.
+
         Args:
             flow_uuid: Unique identifier for the flow instance
 
         Returns:
             The most recent state as a dictionary, or None if no state exists
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-            SELECT state_json
+        with self._cond:
+            entry = self._pending.get(flow_uuid) or self._writing.get(flow_uuid)
+            if entry is not None:
+                return copy.deepcopy(entry.state)
+
+        cursor = self._pool.connection().execute(
+            """
+            SELECT state_json, encoding, is_delta
             FROM flow_states
             WHERE flow_uuid = ?
             ORDER BY id DESC
-            LIMIT 1
             """,
-                (flow_uuid,),
+            (flow_uuid,),
+        )
+        deltas: list[dict[str, Any]] = []
+        for payload, encoding, is_delta in cursor:
+            decoded = self._decode(payload, encoding)
+            if not is_delta:
+                break
+            deltas.append(decoded)
+        else:
+            cursor.close()
+            # No state was saved, or the full state a delta is based on was
+            # deleted.
+            return None
+        cursor.close()
+
+        state: dict[str, Any] = decoded
+        for delta in reversed(deltas):
+            state.update(delta["set"])
+            for key in delta["unset"]:
+                state.pop(key, None)
+        return state
+
+    def flush(self) -> None:
+        """Wait until every queued state has been written."""
+        with self._cond:
+            if self._worker is None:
+                return
+            self._flush_requests += 1
+            self._cond.notify_all()
+            try:
+                while (self._pending or self._writing) and self._worker.is_alive():
+                    self._cond.wait()
+            finally:
+                self._flush_requests -= 1
+
+    def close(self) -> None:
+        """Write queued states and stop the background writer."""
+        with self._cond:
+            self._closed = True
+            worker = self._worker
+            self._cond.notify_all()
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+    def compact(self, flow_uuid: str | None = None) -> None:
+        """Replace the checkpoints of flows with their latest state.
+
+        Args:
+            flow_uuid: Flow to compact. If not provided, compacts every flow.
+        """
+        self.flush()
+        with self._write_lock:
+            if flow_uuid is None:
+                uuids = [
+                    row[0]
+                    for row in self._pool.connection().execute(
+                        "SELECT DISTINCT flow_uuid FROM flow_states"
+                    )
+                ]
+            else:
+                uuids = [flow_uuid]
+            for uuid in uuids:
+                state = self.load_state(uuid)
+                if state is None:
+                    continue
+                with self._pool.transaction(immediate=True) as conn:
+                    method_name, timestamp = conn.execute(
+                        "SELECT method_name, timestamp FROM flow_states "
+                        "WHERE flow_uuid = ? ORDER BY id DESC LIMIT 1",
+                        (uuid,),
+                    ).fetchone()
+                    conn.execute("DELETE FROM flow_states WHERE flow_uuid = ?", (uuid,))
+                    self._last_states.pop(uuid, None)
+                    entry = _PendingState(method_name, timestamp, state)
+                    chain_length = self._insert(conn, uuid, entry)
+                self._remember(uuid, entry, chain_length)
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                # Give further saves a chance to coalesce into this batch.
+                deadline = time.monotonic() + self.flush_interval
+                while not self._closed and not self._flush_requests:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if not self._pending and self._closed:
+                    return
+                self._writing, self._pending = self._pending, {}
+
+            try:
+                self._write(self._writing)
+            except Exception as e:
+                logger.error(f"Failed to write {len(self._writing)} flow state(s): {e}")
+            finally:
+                with self._cond:
+                    self._writing = {}
+                    self._cond.notify_all()
+
+    def _write(self, entries: dict[str, _PendingState]) -> None:
+        with self._write_lock:
+            try:
+                with self._pool.transaction(immediate=True) as conn:
+                    chain_lengths = {}
+                    for flow_uuid, entry in entries.items():
+                        chain_lengths[flow_uuid] = self._insert(conn, flow_uuid, entry)
+                        if self.max_checkpoints is not None:
+                            self._prune(conn, flow_uuid, self.max_checkpoints)
+            except BaseException:
+                # Deltas must build on stored states only; the next write of
+                # these flows stores a full state.
+                for flow_uuid in entries:
+                    self._last_states.pop(flow_uuid, None)
+                    self._chain_lengths.pop(flow_uuid, None)
+                raise
+            for flow_uuid, entry in entries.items():
+                self._remember(flow_uuid, entry, chain_lengths[flow_uuid])
+
+    def _remember(
+        self, flow_uuid: str, entry: _PendingState, chain_length: int | None
+    ) -> None:
+        """Record a committed state as the base of the flow's next delta."""
+        if chain_length is not None:
+            self._last_states[flow_uuid] = entry.state
+            self._chain_lengths[flow_uuid] = chain_length
+
+    def _insert(
+        self, conn: sqlite3.Connection, flow_uuid: str, entry: _PendingState
+    ) -> int | None:
+        """Insert a checkpoint.
+
+        Returns:
+            The number of deltas since the flow's last full state, including
+            this one, or None when deltas are disabled.
+        """
+        payload: dict[str, Any] = entry.state
+        is_delta = False
+        chain_length: int | None = None
+        if self.delta:
+            previous = self._last_states.get(flow_uuid)
+            chain_length = self._chain_lengths.get(flow_uuid, 0)
+            if previous is not None and chain_length < _FULL_STATE_INTERVAL:
+                payload = {
+                    "set": {
+                        key: value
+                        for key, value in entry.state.items()
+                        if key not in previous or not _same_value(previous[key], value)
+                    },
+                    "unset": [key for key in previous if key not in entry.state],
+                }
+                is_delta = True
+            chain_length = chain_length + 1 if is_delta else 0
+
+        conn.execute(
+            """
+            INSERT INTO flow_states (
+                flow_uuid,
+                method_name,
+                timestamp,
+                state_json,
+                encoding,
+                is_delta
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                flow_uuid,
+                entry.method_name,
+                entry.timestamp,
+                self._encode(payload),
+                self.compression or "json",
+                int(is_delta),
+            ),
+        )
+        return chain_length
+
+    @staticmethod
+    def _prune(conn: sqlite3.Connection, flow_uuid: str, keep: int) -> None:
+        # The oldest kept checkpoint may be a delta; keep the full state it
+        # builds on as well.
+        cutoff = None
+        for row_id, is_delta in conn.execute(
+            "SELECT id, is_delta FROM flow_states WHERE flow_uuid = ? "
+            "ORDER BY id DESC LIMIT -1 OFFSET ?",
+            (flow_uuid, keep - 1),
+        ):
+            if not is_delta:
+                cutoff = row_id
+                break
+        if cutoff is not None:
+            conn.execute(
+                "DELETE FROM flow_states WHERE flow_uuid = ? AND id < ?",
+                (flow_uuid, cutoff),
+            )
+
+    def _encode(self, payload: dict[str, Any]) -> str | bytes:
+        text = json.dumps(payload)
+        if self.compression == "zlib":
+            return zlib.compress(text.encode())
+        if self.compression == "zstd":
+            compressed: bytes = (
+                _load_zstandard().ZstdCompressor().compress(text.encode())
             )
-            row = cursor.fetchone()
+            return compressed
+        return text
 
-        if row:
-            return json.loads(row[0])
-        return None
+    @staticmethod
+    def _decode(payload: str | bytes, encoding: str) -> dict[str, Any]:
+        if encoding == "zlib":
+            payload = zlib.decompress(cast(bytes, payload))
+        elif encoding == "zstd":
+            payload = _load_zstandard().ZstdDecompressor().decompress(payload)
+        result: dict[str, Any] = json.loads(payload)
+        return result
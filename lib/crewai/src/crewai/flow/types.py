@@ -24,7 +24,7 @@ FlowMethodName = NewType("FlowMethodName", str)
 FlowRouteName = NewType("FlowRouteName", str)
 PendingListenerKey = NewType(
     "PendingListenerKey",
-    Annotated[str, "nested flow conditions use 'listener_name:object_id'"],
+    Annotated[str, "nested flow conditions use 'listener_name:node_path'"],
 )
 
 
@@ -1,7 +1,11 @@
 import os
+from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from crewai.knowledge.source.base_file_knowledge_source import (
+    BaseFileKnowledgeSource,
+)
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
 from crewai.rag.embeddings.types import EmbedderConfig
@@ -18,6 +22,10 @@ class Knowledge(BaseModel):
         sources: list[BaseKnowledgeSource] = Field(default_factory=list)
         storage: KnowledgeStorage | None = Field(default=None)
         embedder: EmbedderConfig | None = None
+        prune_removed_files: bool = False, whether adding sources deletes the
+            chunks of files that are no longer among them. Collections can be shared, e.g. every
+            crew uses the "crew" collection, so only enable this when no other
+            Knowledge adds files to the same collection.
     """
 
     sources: list[BaseKnowledgeSource] = Field(default_factory=list)
@@ -25,6 +33,7 @@ class Knowledge(BaseModel):
     storage: KnowledgeStorage | None = Field(default=None)
     embedder: EmbedderConfig | None = None
     collection_name: str | None = None
+    prune_removed_files: bool = False
 
     def __init__(
         self,
@@ -62,11 +71,27 @@ class Knowledge(BaseModel):
             score_threshold=score_threshold,
         )
 
+    def _source_files(self) -> list[Path]:
+        return [
+            path
+            for source in self.sources
+            if isinstance(source, BaseFileKnowledgeSource)
+            for path in source.safe_file_paths
+        ]
+
     def add_sources(self) -> None:
+        """Add all knowledge sources to storage.
+
+        Chunks already in the collection are not embedded again. With
+        ``prune_removed_files``, chunks of files that are no longer among the
+        sources are deleted.
+        """
         try:
             for source in self.sources:
                 source.storage = self.storage
                 source.add()
+            if self.storage and self.prune_removed_files:
+                self.storage.prune_files(self._source_files())
         except Exception as e:
             raise e
 
@@ -107,6 +132,8 @@ class Knowledge(BaseModel):
             for source in self.sources:
                 source.storage = self.storage
                 await source.aadd()
+            if self.storage and self.prune_removed_files:
+                await self.storage.aprune_files(self._source_files())
         except Exception as e:
             raise e
 
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
@@ -10,6 +13,9 @@ from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
 
 
+T = TypeVar("T")
+
+
 class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     """Base class for knowledge sources that load content from files."""
 
@@ -24,6 +30,32 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     content: dict[Path, str] = Field(init=False, default_factory=dict)
     storage: KnowledgeStorage | None = Field(default=None)
     safe_file_paths: list[Path] = Field(default_factory=list)
+    max_workers: int | None = Field(
+        default=None,
+        description="Maximum number of files parsed in parallel. Defaults to one worker per file, up to the CPU count.",
+    )
+    use_processes: bool = Field(
+        default=False,
+        description=(
+            "Parse files in worker processes instead of threads, for CPU-bound "
+            "formats such as PDF. Scripts must guard their entry point with "
+            "`if __name__ == '__main__':`."
+        ),
+    )
+    stream: bool = Field(
+        default=False,
+        description=(
+            "Parse files one at a time while adding them and save their chunks "
+            "in batches of `stream_batch_size`, instead of loading every file "
+            "into `content` up front. Bounds peak memory for large files."
+        ),
+    )
+    stream_batch_size: int = Field(
+        default=100,
+        gt=0,
+        description="Number of chunks embedded and saved at a time when streaming.",
+    )
+    _file_chunks: dict[Path, list[str]] = PrivateAttr(default_factory=dict)
 
     @field_validator("file_path", "file_paths", mode="before")
     @classmethod
@@ -46,12 +78,56 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
         """Post-initialization method to load content."""
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self.load_content()
+        if self.stream:
+            if type(self)._iter_text is BaseFileKnowledgeSource._iter_text:
+                raise ValueError(f"{type(self).__name__} does not support streaming")
+        else:
+            self.content = self.load_content()
+
+    def _load_files(self, loader: Callable[[Path], T]) -> dict[Path, T]:
+        """Parse every file with ``loader``, several files at a time.
+
+        Args:
+            loader: Parses one file. Must be a module-level function when
+                ``use_processes`` is set, so it can be sent to worker processes.
+
+        Returns:
+            Parsed content keyed by path, in the order of ``safe_file_paths``.
+        """
+        paths = [self.convert_to_path(path) for path in self.safe_file_paths]
+        workers = min(len(paths), self.max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            return {path: loader(path) for path in paths}
+        executor: Executor = (
+            ProcessPoolExecutor(max_workers=workers)
+            if self.use_processes
+            else ThreadPoolExecutor(max_workers=workers)
+        )
+        with executor:
+            return dict(zip(paths, executor.map(loader, paths), strict=True))
 
     @abstractmethod
     def load_content(self) -> dict[Path, str]:
         """Load and preprocess file content. Should be overridden by subclasses. Assume that the file path is relative to the project root in the knowledge directory."""
 
+    def _iter_text(self, path: Path) -> Iterable[str]:
+        """Yield the text of a file piece by piece, for sources that support streaming."""
+        raise NotImplementedError
+
+    def _stream_chunks(self, path: Path) -> Iterator[str]:
+        """Yield the chunks ``_chunk_text`` would produce for a file, reading it lazily."""
+        step = self.chunk_size - self.chunk_overlap
+        buffer = ""
+        for text in self._iter_text(path):
+            buffer += text
+            start = 0
+            while len(buffer) - start >= self.chunk_size:
+                yield buffer[start : start + self.chunk_size]
+                start += step
+            buffer = buffer[start:]
+        for start in range(0, len(buffer), step):
+            yield buffer[start : start + self.chunk_size]
+
     def validate_content(self) -> None:
         """Validate the paths."""
         for path in self.safe_file_paths:
@@ -69,17 +145,34 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
                     color="red",
                 )
 
+    def _chunks_by_file(self) -> Mapping[Path, Iterable[str]]:
+        """Return the chunks produced by each file.
+
+        Streaming sources return lazy chunk iterators. Sources that chunk files
+        individually record them in ``_file_chunks``; otherwise every file is
+        credited with all chunks, so a change to any file replaces the source's
+        chunks as a whole.
+        """
+        if self.stream:
+            return {path: self._stream_chunks(path) for path in self.safe_file_paths}
+        if self._file_chunks:
+            return self._file_chunks
+        return {path: self.chunks for path in self.safe_file_paths}
+
+    def _batch_size(self) -> int | None:
+        return self.stream_batch_size if self.stream else None
+
     def _save_documents(self) -> None:
         """Save the documents to the storage."""
         if self.storage:
-            self.storage.save(self.chunks)
+            self.storage.save_files(self._chunks_by_file(), self._batch_size())
         else:
             raise ValueError("No storage found to save documents.")
 
     async def _asave_documents(self) -> None:
         """Save the documents to the storage asynchronously."""
         if self.storage:
-            await self.storage.asave(self.chunks)
+            await self.storage.asave_files(self._chunks_by_file(), self._batch_size())
         else:
             raise ValueError("No storage found to save documents.")
 
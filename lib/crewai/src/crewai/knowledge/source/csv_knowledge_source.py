@@ -4,20 +4,17 @@ from pathlib import Path
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
 
+def _read_csv(path: Path) -> str:
+    with open(path, "r", encoding="utf-8") as csvfile:
+        return "".join(" ".join(row) + "\n" for row in csv.reader(csvfile))
+
+
 class CSVKnowledgeSource(BaseFileKnowledgeSource):
     """A knowledge source that stores and queries CSV file content using embeddings."""
 
     def load_content(self) -> dict[Path, str]:
         """Load and preprocess CSV file content."""
-        content_dict = {}
-        for file_path in self.safe_file_paths:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                content = ""
-                for row in reader:
-                    content += " ".join(row) + "\n"
-                content_dict[file_path] = content
-        return content_dict
+        return self._load_files(_read_csv)
 
     def add(self) -> None:
         """
@@ -39,10 +36,3 @@ class CSVKnowledgeSource(BaseFileKnowledgeSource):
         new_chunks = self._chunk_text(content_str)
         self.chunks.extend(new_chunks)
         await self._asave_documents()
-
-    def _chunk_text(self, text: str) -> list[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
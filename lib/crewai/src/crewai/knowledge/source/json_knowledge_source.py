@@ -5,32 +5,34 @@ from typing import Any
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
 
+def _json_to_text(data: Any, level: int = 0) -> str:
+    """Recursively convert JSON data to a text representation."""
+    indent = "  " * level
+    if isinstance(data, dict):
+        return "".join(
+            f"{indent}{key}: {_json_to_text(value, level + 1)}\n"
+            for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return "".join(f"{indent}- {_json_to_text(item, level + 1)}\n" for item in data)
+    return f"{data!s}"
+
+
+def _read_json(path: Path) -> str:
+    with open(path, "r", encoding="utf-8") as json_file:
+        return _json_to_text(json.load(json_file))
+
+
 class JSONKnowledgeSource(BaseFileKnowledgeSource):
     """A knowledge source that stores and queries JSON file content using embeddings."""
 
     def load_content(self) -> dict[Path, str]:
         """Load and preprocess JSON file content."""
-        content: dict[Path, str] = {}
-        for path in self.safe_file_paths:
-            path = self.convert_to_path(path)
-            with open(path, "r", encoding="utf-8") as json_file:
-                data = json.load(json_file)
-            content[path] = self._json_to_text(data)
-        return content
+        return self._load_files(_read_json)
 
     def _json_to_text(self, data: Any, level: int = 0) -> str:
         """Recursively convert JSON data to a text representation."""
-        text = ""
-        indent = "  " * level
-        if isinstance(data, dict):
-            for key, value in data.items():
-                text += f"{indent}{key}: {self._json_to_text(value, level + 1)}\n"
-        elif isinstance(data, list):
-            for item in data:
-                text += f"{indent}- {self._json_to_text(item, level + 1)}\n"
-        else:
-            text += f"{data!s}"
-        return text
+        return _json_to_text(data, level)
 
     def add(self) -> None:
         """
@@ -52,10 +54,3 @@ class JSONKnowledgeSource(BaseFileKnowledgeSource):
         new_chunks = self._chunk_text(content_str)
         self.chunks.extend(new_chunks)
         await self._asave_documents()
-
-    def _chunk_text(self, text: str) -> list[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
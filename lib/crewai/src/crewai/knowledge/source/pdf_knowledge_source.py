@@ -1,28 +1,38 @@
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from types import ModuleType
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
 
+def _iter_pdf_pages(path: Path) -> Iterator[str]:
+    """Yield the text of each page, releasing each page's layout once read."""
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            page.close()
+            if page_text:
+                yield page_text + "\n"
+
+
+def _read_pdf(path: Path) -> str:
+    return "".join(_iter_pdf_pages(path))
+
+
 class PDFKnowledgeSource(BaseFileKnowledgeSource):
     """A knowledge source that stores and queries PDF file content using embeddings."""
 
     def load_content(self) -> dict[Path, str]:
         """Load and preprocess PDF file content."""
-        pdfplumber = self._import_pdfplumber()
-
-        content = {}
+        self._import_pdfplumber()
+        return self._load_files(_read_pdf)
 
-        for path in self.safe_file_paths:
-            text = ""
-            path = self.convert_to_path(path)
-            with pdfplumber.open(path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            content[path] = text
-        return content
+    def _iter_text(self, path: Path) -> Iterable[str]:
+        """Yield the text of a PDF page by page."""
+        self._import_pdfplumber()
+        return _iter_pdf_pages(path)
 
     def _import_pdfplumber(self) -> ModuleType:
         """Dynamically import pdfplumber."""
@@ -40,21 +50,16 @@ class PDFKnowledgeSource(BaseFileKnowledgeSource):
         Add PDF file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        for text in self.content.values():
+        for path, text in self.content.items():
             new_chunks = self._chunk_text(text)
+            self._file_chunks[path] = new_chunks
             self.chunks.extend(new_chunks)
         self._save_documents()
 
     async def aadd(self) -> None:
         """Add PDF file content asynchronously."""
-        for text in self.content.values():
+        for path, text in self.content.items():
             new_chunks = self._chunk_text(text)
+            self._file_chunks[path] = new_chunks
             self.chunks.extend(new_chunks)
         await self._asave_documents()
-
-    def _chunk_text(self, text: str) -> list[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
@@ -1,40 +1,46 @@
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
 
+def _read_text(path: Path) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _iter_text_blocks(path: Path, size: int = 1 << 20) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        while block := f.read(size):
+            yield block
+
+
 class TextFileKnowledgeSource(BaseFileKnowledgeSource):
     """A knowledge source that stores and queries text file content using embeddings."""
 
     def load_content(self) -> dict[Path, str]:
         """Load and preprocess text file content."""
-        content = {}
-        for path in self.safe_file_paths:
-            path = self.convert_to_path(path)
-            with open(path, "r", encoding="utf-8") as f:
-                content[path] = f.read()
-        return content
+        return self._load_files(_read_text)
+
+    def _iter_text(self, path: Path) -> Iterable[str]:
+        """Yield the text of a file in fixed-size blocks."""
+        return _iter_text_blocks(path)
 
     def add(self) -> None:
         """
         Add text file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        for text in self.content.values():
+        for path, text in self.content.items():
             new_chunks = self._chunk_text(text)
+            self._file_chunks[path] = new_chunks
             self.chunks.extend(new_chunks)
         self._save_documents()
 
     async def aadd(self) -> None:
         """Add text file content asynchronously."""
-        for text in self.content.values():
+        for path, text in self.content.items():
             new_chunks = self._chunk_text(text)
+            self._file_chunks[path] = new_chunks
             self.chunks.extend(new_chunks)
         await self._asave_documents()
-
-    def _chunk_text(self, text: str) -> list[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
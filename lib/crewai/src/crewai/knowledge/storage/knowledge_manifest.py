@@ -0,0 +1,104 @@
+"""Manifest of the files ingested into a knowledge collection."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from crewai.utilities.paths import db_storage_path
+
+
+logger = logging.getLogger(__name__)
+
+
+def chunk_id(content: str) -> str:
+    """Return the document ID used for a chunk.
+
+    Matches the content hash ChromaDB records receive when no ``doc_id`` or
+    metadata is given, so collections ingested before the manifest existed are
+    recognised without re-embedding.
+    """
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class KnowledgeManifest:
+    """Maps each ingested file to the IDs of its chunks.
+
+    One manifest is kept per collection as a JSON file next to the vector
+    store. It lets ingestion tell which chunks are already stored, and which
+    stored chunks belong to files that changed or disappeared.
+    """
+
+    def __init__(self, collection_name: str, path: Path | None = None) -> None:
+        """Load the manifest for a collection.
+
+        Args:
+            collection_name: Name of the vector store collection.
+            path: Optional manifest location; defaults to the storage directory.
+        """
+        self.path = path or (
+            Path(db_storage_path()) / "knowledge_manifests" / f"{collection_name}.json"
+        )
+        self.files: dict[str, dict[str, Any]] = self._load()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable knowledge manifest {self.path}: {e}")
+            return {}
+        return data.get("files", {}) if isinstance(data, dict) else {}
+
+    @staticmethod
+    def key(path: Path | str) -> str:
+        """Return the manifest key for a file path."""
+        return str(Path(path).resolve())
+
+    def record(self, path: Path | str, ids: list[str]) -> None:
+        """Record the chunks stored for a file.
+
+        Args:
+            path: The ingested file.
+            ids: IDs of the chunks stored for the file.
+        """
+        self.files[self.key(path)] = {"chunk_ids": ids}
+
+    def chunk_ids(self, exclude: set[str] | None = None) -> set[str]:
+        """Return every chunk ID referenced by the manifest.
+
+        Args:
+            exclude: Manifest keys to leave out.
+        """
+        return {
+            id_
+            for key, entry in self.files.items()
+            if not exclude or key not in exclude
+            for id_ in entry.get("chunk_ids", [])
+        }
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "files": self.files}, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def delete(self) -> None:
+        """Remove the manifest file."""
+        self.files = {}
+        self.path.unlink(missing_ok=True)
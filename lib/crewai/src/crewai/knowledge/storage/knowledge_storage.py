@@ -1,9 +1,14 @@
+import asyncio
+from collections.abc import Iterable, Iterator, Mapping
 import logging
+from pathlib import Path
 import traceback
-from typing import Any, cast
+from typing import Any, NoReturn, cast
 import warnings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.knowledge_manifest import KnowledgeManifest, chunk_id
+from crewai.rag.chromadb.client import ChromaDBClient
 from crewai.rag.chromadb.config import ChromaDBConfig
 from crewai.rag.chromadb.types import ChromaEmbeddingFunctionWrapper
 from crewai.rag.config.utils import get_rag_client
@@ -20,6 +25,11 @@ class KnowledgeStorage(BaseKnowledgeStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    With a ChromaDB client, ingestion is incremental: chunks whose content
+    hash is already stored are not embedded again, and a per-collection
+    ``KnowledgeManifest`` tracks which chunks belong to which file so chunks
+    of changed or removed files can be deleted.
     """
 
     def __init__(
@@ -52,6 +62,83 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         """Get the appropriate client - instance-specific or global."""
         return self._client if self._client else get_rag_client()
 
+    def _collection_name(self) -> str:
+        return (
+            f"knowledge_{self.collection_name}" if self.collection_name else "knowledge"
+        )
+
+    def _manifest(self) -> KnowledgeManifest:
+        return KnowledgeManifest(self._collection_name())
+
+    @staticmethod
+    def _raise_save_error(e: Exception) -> NoReturn:
+        if "dimension mismatch" in str(e).lower():
+            Logger(verbose=True).log(
+                "error",
+                "Embedding dimension mismatch. This usually happens when mixing different embedding models. Try resetting the collection using `crewai reset-memories -a`",
+                "red",
+            )
+            raise ValueError(
+                "Embedding dimension mismatch. Make sure you're using the same embedding model "
+                "across all operations with this collection."
+                "Try resetting the collection using `crewai reset-memories -a`"
+            ) from e
+        Logger(verbose=True).log("error", f"Failed to upsert documents: {e}", "red")
+        raise e
+
+    @staticmethod
+    def _batches(
+        files: Mapping[Path, Iterable[str]],
+        ids: dict[Path, list[str]],
+        batch_size: int | None,
+    ) -> Iterator[list[tuple[str, str]]]:
+        """Yield ``(chunk ID, chunk)`` pairs of ``files``, ``batch_size`` at a time.
+
+        The chunk IDs of each file are collected into ``ids`` as the chunks are
+        read, so lazily produced chunks only have to be held one batch at a time.
+        """
+        batch: list[tuple[str, str]] = []
+        for path, chunks in files.items():
+            file_ids = ids.setdefault(path, [])
+            for chunk in chunks:
+                id_ = chunk_id(chunk)
+                file_ids.append(id_)
+                batch.append((id_, chunk))
+                if batch_size and len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _plan_stale(
+        manifest: KnowledgeManifest, ids: Mapping[Path, list[str]]
+    ) -> set[str]:
+        """Record the chunk IDs of each file and return IDs no file references any more.
+
+        The manifest is only used to find stale chunks: it is kept on disk
+        and can outlive the vector store, so every current chunk is still
+        checked against the collection.
+        """
+        replaced: set[str] = set()
+        for path, file_ids in ids.items():
+            previous = manifest.files.get(manifest.key(path))
+            if previous is not None and previous.get("chunk_ids") != file_ids:
+                replaced.update(previous.get("chunk_ids", []))
+            manifest.record(path, file_ids)
+        return replaced - manifest.chunk_ids()
+
+    @staticmethod
+    def _plan_prune(manifest: KnowledgeManifest, keep: Iterable[Path]) -> set[str]:
+        """Drop files not in ``keep`` from the manifest and return their orphaned chunk IDs."""
+        removed = set(manifest.files) - {manifest.key(path) for path in keep}
+        if not removed:
+            return set()
+        orphaned = manifest.chunk_ids() - manifest.chunk_ids(exclude=removed)
+        for key in removed:
+            del manifest.files[key]
+        return orphaned
+
     def search(
         self,
         query: list[str],
@@ -93,6 +180,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 else "knowledge"
             )
             client.delete_collection(collection_name=collection_name)
+            self._manifest().delete()
         except Exception as e:
             logging.error(
                 f"Error during knowledge reset: {e!s}\n{traceback.format_exc()}"
@@ -109,24 +197,91 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             client.get_or_create_collection(collection_name=collection_name)
 
             rag_documents: list[BaseRecord] = [{"content": doc} for doc in documents]
+            if isinstance(client, ChromaDBClient):
+                by_id = {chunk_id(doc): doc for doc in documents}
+                existing = client.get_existing_ids(
+                    collection_name=collection_name, ids=list(by_id)
+                )
+                rag_documents = [
+                    {"doc_id": id_, "content": doc}
+                    for id_, doc in by_id.items()
+                    if id_ not in existing
+                ]
+                if not rag_documents:
+                    return
 
             client.add_documents(
                 collection_name=collection_name, documents=rag_documents
             )
         except Exception as e:
-            if "dimension mismatch" in str(e).lower():
-                Logger(verbose=True).log(
-                    "error",
-                    "Embedding dimension mismatch. This usually happens when mixing different embedding models. Try resetting the collection using `crewai reset-memories -a`",
-                    "red",
+            self._raise_save_error(e)
+
+    def save_files(
+        self, files: Mapping[Path, Iterable[str]], batch_size: int | None = None
+    ) -> None:
+        """Save the chunks of each file, embedding only what changed.
+
+        Every chunk ID is checked against the collection in batches and only
+        missing chunks are embedded. Chunks a changed file no longer produces,
+        according to the manifest, are deleted. Clients without ID lookups
+        fall back to ``save``.
+
+        Args:
+            files: Chunks keyed by the file they were extracted from. The chunks
+                may be produced lazily; they are read once, in order.
+            batch_size: Maximum number of chunks read and written at a time.
+                Defaults to all chunks at once.
+        """
+        client = self._get_client()
+        ids: dict[Path, list[str]] = {}
+        if not isinstance(client, ChromaDBClient):
+            for batch in self._batches(files, ids, batch_size):
+                self.save([chunk for _, chunk in batch])
+            return
+
+        collection_name = self._collection_name()
+        manifest = self._manifest()
+        try:
+            client.get_or_create_collection(collection_name=collection_name)
+            for batch in self._batches(files, ids, batch_size):
+                documents = dict(batch)
+                existing = client.get_existing_ids(
+                    collection_name=collection_name, ids=list(documents)
+                )
+                rag_documents: list[BaseRecord] = [
+                    {"doc_id": id_, "content": doc}
+                    for id_, doc in documents.items()
+                    if id_ not in existing
+                ]
+                if rag_documents:
+                    client.add_documents(
+                        collection_name=collection_name, documents=rag_documents
+                    )
+            stale = self._plan_stale(manifest, ids)
+            if stale:
+                client.delete_documents(
+                    collection_name=collection_name, ids=sorted(stale)
                 )
-                raise ValueError(
-                    "Embedding dimension mismatch. Make sure you're using the same embedding model "
-                    "across all operations with this collection."
-                    "Try resetting the collection using `crewai reset-memories -a`"
-                ) from e
-            Logger(verbose=True).log("error", f"Failed to upsert documents: {e}", "red")
-            raise
+        except Exception as e:
+            self._raise_save_error(e)
+        manifest.save()
+
+    def prune_files(self, keep: Iterable[Path]) -> None:
+        """Delete the chunks of files that are no longer knowledge sources.
+
+        Args:
+            keep: Files of the current knowledge sources.
+        """
+        client = self._get_client()
+        if not isinstance(client, ChromaDBClient):
+            return
+        manifest = self._manifest()
+        orphaned = self._plan_prune(manifest, keep)
+        if orphaned:
+            client.delete_documents(
+                collection_name=self._collection_name(), ids=sorted(orphaned)
+            )
+        manifest.save()
 
     async def asearch(
         self,
@@ -187,24 +342,89 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             await client.aget_or_create_collection(collection_name=collection_name)
 
             rag_documents: list[BaseRecord] = [{"content": doc} for doc in documents]
+            if isinstance(client, ChromaDBClient):
+                by_id = {chunk_id(doc): doc for doc in documents}
+                existing = await client.aget_existing_ids(
+                    collection_name=collection_name, ids=list(by_id)
+                )
+                rag_documents = [
+                    {"doc_id": id_, "content": doc}
+                    for id_, doc in by_id.items()
+                    if id_ not in existing
+                ]
+                if not rag_documents:
+                    return
 
             await client.aadd_documents(
                 collection_name=collection_name, documents=rag_documents
             )
         except Exception as e:
-            if "dimension mismatch" in str(e).lower():
-                Logger(verbose=True).log(
-                    "error",
-                    "Embedding dimension mismatch. This usually happens when mixing different embedding models. Try resetting the collection using `crewai reset-memories -a`",
-                    "red",
+            self._raise_save_error(e)
+
+    async def asave_files(
+        self, files: Mapping[Path, Iterable[str]], batch_size: int | None = None
+    ) -> None:
+        """Save the chunks of each file asynchronously, embedding only what changed.
+
+        Chunks are read in a worker thread, so lazily parsed files do not block
+        the event loop.
+
+        Args:
+            files: Chunks keyed by the file they were extracted from.
+            batch_size: Maximum number of chunks read and written at a time.
+                Defaults to all chunks at once.
+        """
+        client = self._get_client()
+        ids: dict[Path, list[str]] = {}
+        batches = self._batches(files, ids, batch_size)
+        if not isinstance(client, ChromaDBClient):
+            while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                await self.asave([chunk for _, chunk in batch])
+            return
+
+        collection_name = self._collection_name()
+        manifest = self._manifest()
+        try:
+            await client.aget_or_create_collection(collection_name=collection_name)
+            while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                documents = dict(batch)
+                existing = await client.aget_existing_ids(
+                    collection_name=collection_name, ids=list(documents)
+                )
+                rag_documents: list[BaseRecord] = [
+                    {"doc_id": id_, "content": doc}
+                    for id_, doc in documents.items()
+                    if id_ not in existing
+                ]
+                if rag_documents:
+                    await client.aadd_documents(
+                        collection_name=collection_name, documents=rag_documents
+                    )
+            stale = self._plan_stale(manifest, ids)
+            if stale:
+                await client.adelete_documents(
+                    collection_name=collection_name, ids=sorted(stale)
                 )
-                raise ValueError(
-                    "Embedding dimension mismatch. Make sure you're using the same embedding model "
-                    "across all operations with this collection."
-                    "Try resetting the collection using `crewai reset-memories -a`"
-                ) from e
-            Logger(verbose=True).log("error", f"Failed to upsert documents: {e}", "red")
-            raise
+        except Exception as e:
+            self._raise_save_error(e)
+        manifest.save()
+
+    async def aprune_files(self, keep: Iterable[Path]) -> None:
+        """Delete the chunks of files that are no longer knowledge sources asynchronously.
+
+        Args:
+            keep: Files of the current knowledge sources.
+        """
+        client = self._get_client()
+        if not isinstance(client, ChromaDBClient):
+            return
+        manifest = self._manifest()
+        orphaned = self._plan_prune(manifest, keep)
+        if orphaned:
+            await client.adelete_documents(
+                collection_name=self._collection_name(), ids=sorted(orphaned)
+            )
+        manifest.save()
 
     async def areset(self) -> None:
         """Reset the knowledge base asynchronously."""
@@ -216,6 +436,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 else "knowledge"
             )
             await client.adelete_collection(collection_name=collection_name)
+            self._manifest().delete()
         except Exception as e:
             logging.error(
                 f"Error during knowledge reset: {e!s}\n{traceback.format_exc()}"
@@ -42,7 +42,7 @@ from crewai.hooks.llm_hooks import get_after_llm_call_hooks, get_before_llm_call
 from crewai.hooks.types import AfterLLMCallHookType, BeforeLLMCallHookType
 from crewai.lite_agent_output import LiteAgentOutput
 from crewai.llm import LLM
-from crewai.llms.base_llm import BaseLLM
+from crewai.llms.base_llm import BaseLLM, count_call_tokens
 from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.utilities.agent_utils import (
@@ -59,6 +59,7 @@ from crewai.utilities.agent_utils import (
     is_context_length_exceeded,
     parse_tools,
     process_llm_response,
+    record_rpm_tokens,
     render_text_description_and_args,
 )
 from crewai.utilities.converter import (
@@ -548,14 +549,16 @@ class LiteAgent(FlowTrackable, BaseModel):
                 enforce_rpm_limit(self.request_within_rpm_limit)
 
                 try:
-                    answer = get_llm_response(
-                        llm=cast(LLM, self.llm),
-                        messages=self._messages,
-                        callbacks=self._callbacks,
-                        printer=self._printer,
-                        from_agent=self,
-                        executor_context=self,
-                    )
+                    with count_call_tokens() as usage:
+                        answer = get_llm_response(
+                            llm=cast(LLM, self.llm),
+                            messages=self._messages,
+                            callbacks=self._callbacks,
+                            printer=self._printer,
+                            from_agent=self,
+                            executor_context=self,
+                        )
+                    record_rpm_tokens(self.request_within_rpm_limit, usage.total_tokens)
 
                 except Exception as e:
                     raise e
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable
 from datetime import datetime
+import importlib.util
 import io
 import json
 import logging
@@ -38,6 +39,7 @@ from crewai.events.types.tool_usage_events import (
     ToolUsageStartedEvent,
 )
 from crewai.llms.base_llm import BaseLLM
+from crewai.llms.cache import cache_event_fields
 from crewai.llms.constants import (
     ANTHROPIC_MODELS,
     AZURE_MODELS,
@@ -53,7 +55,9 @@ from crewai.utilities.logger_utils import suppress_warnings
 
 
 if TYPE_CHECKING:
+    import litellm
     from litellm.exceptions import ContextWindowExceededError
+    from litellm.integrations.custom_logger import CustomLogger
     from litellm.litellm_core_utils.get_supported_openai_params import (
         get_supported_openai_params,
     )
@@ -72,7 +76,30 @@ if TYPE_CHECKING:
     from crewai.tools.base_tool import BaseTool
     from crewai.utilities.types import LLMMessage
 
-try:
+LITELLM_AVAILABLE: Final[bool] = importlib.util.find_spec("litellm") is not None
+
+_LITELLM_NAMES: Final[frozenset[str]] = frozenset(
+    {
+        "litellm",
+        "ChatCompletionDeltaToolCall",
+        "Choices",
+        "ContextWindowExceededError",
+        "CustomLogger",
+        "Function",
+        "ModelResponse",
+        "get_supported_openai_params",
+        "supports_response_schema",
+    }
+)
+
+
+def _load_litellm() -> None:
+    """Import LiteLLM and bind the names this module uses from it.
+
+    LiteLLM takes seconds to import, so it is loaded when an LLM first falls
+    back to it rather than when this module is imported. Names that are
+    already bound, e.g. by ``unittest.mock.patch``, are kept.
+    """
     import litellm
     from litellm.exceptions import ContextWindowExceededError
     from litellm.integrations.custom_logger import CustomLogger
@@ -87,24 +114,34 @@ try:
     )
     from litellm.utils import supports_response_schema
 
-    LITELLM_AVAILABLE = True
-except ImportError:
-    LITELLM_AVAILABLE = False
-    litellm = None  # type: ignore
-    Choices = None  # type: ignore
-    ContextWindowExceededError = Exception  # type: ignore
-    get_supported_openai_params = None  # type: ignore
-    ChatCompletionDeltaToolCall = None  # type: ignore
-    Function = None  # type: ignore
-    ModelResponse = None  # type: ignore
-    supports_response_schema = None  # type: ignore
-    CustomLogger = None  # type: ignore
+    litellm.suppress_debug_info = True
+    names: dict[str, Any] = {
+        "litellm": litellm,
+        "ChatCompletionDeltaToolCall": ChatCompletionDeltaToolCall,
+        "Choices": Choices,
+        "ContextWindowExceededError": ContextWindowExceededError,
+        "CustomLogger": CustomLogger,
+        "Function": Function,
+        "ModelResponse": ModelResponse,
+        "get_supported_openai_params": get_supported_openai_params,
+        "supports_response_schema": supports_response_schema,
+    }
+    module_globals = globals()
+    for name, value in names.items():
+        module_globals.setdefault(name, value)
+
+
+def __getattr__(name: str) -> Any:
+    """Load LiteLLM on first access to one of its names from outside."""
+    if name in _LITELLM_NAMES and LITELLM_AVAILABLE:
+        _load_litellm()
+        return globals()[name]
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 load_dotenv()
 logger = logging.getLogger(__name__)
-if LITELLM_AVAILABLE:
-    litellm.suppress_debug_info = True
 
 
 class FilteredStream(io.TextIOBase):
@@ -412,6 +449,7 @@ class LLM(BaseLLM):
         if not LITELLM_AVAILABLE:
             logger.error("LiteLLM is not available, falling back to LiteLLM")
             raise ImportError("Fallback to LiteLLM is not available") from None
+        _load_litellm()
 
         instance = object.__new__(cls)
         super(LLM, instance).__init__(model=model, is_litellm=True, **kwargs)
@@ -624,7 +662,9 @@ class LLM(BaseLLM):
         self.context_window_size = 0
         self.reasoning_effort = reasoning_effort
         self.additional_params = {
-            k: v for k, v in kwargs.items() if k not in ("is_litellm", "provider")
+            k: v
+            for k, v in kwargs.items()
+            if k not in ("is_litellm", "provider", "response_cache")
         }
         self.is_anthropic = self._is_anthropic_model(model)
         self.stream = stream
@@ -1173,11 +1213,13 @@ class LLM(BaseLLM):
             0
         ].message
         text_response = response_message.content or ""
+        usage_info = getattr(response, "usage", None)
+        if usage_info:
+            self._count_call_usage(usage_info)
         # --- 3) Handle callbacks with usage info
         if callbacks and len(callbacks) > 0:
             for callback in callbacks:
                 if hasattr(callback, "log_success_event"):
-                    usage_info = getattr(response, "usage", None)
                     if usage_info:
                         callback.log_success_event(
                             kwargs=params,
@@ -1292,11 +1334,13 @@ class LLM(BaseLLM):
             0
         ].message
         text_response = response_message.content or ""
+        usage_info = getattr(response, "usage", None)
+        if usage_info:
+            self._count_call_usage(usage_info)
 
         if callbacks and len(callbacks) > 0:
             for callback in callbacks:
                 if hasattr(callback, "log_success_event"):
-                    usage_info = getattr(response, "usage", None)
                     if usage_info:
                         callback.log_success_event(
                             kwargs=params,
@@ -1434,6 +1478,8 @@ class LLM(BaseLLM):
                         ),
                     )
 
+            if usage_info:
+                self._count_call_usage(usage_info)
             if callbacks and len(callbacks) > 0 and usage_info:
                 for callback in callbacks:
                     if hasattr(callback, "log_success_event"):
@@ -1870,6 +1916,7 @@ class LLM(BaseLLM):
                 from_task=from_task,
                 from_agent=from_agent,
                 model=self.model,
+                **cache_event_fields(),
             ),
         )
 
@@ -2127,6 +2174,7 @@ class LLM(BaseLLM):
             reasoning_effort=self.reasoning_effort,
             stream=self.stream,
             stop=self.stop,
+            response_cache=self.response_cache,
             **filtered_params,
         )
 
@@ -2195,5 +2243,7 @@ class LLM(BaseLLM):
             reasoning_effort=self.reasoning_effort,
             stream=self.stream,
             stop=copy.deepcopy(self.stop, memo) if self.stop else None,
+            # Copies share the cache, like copies of native provider LLMs.
+            response_cache=self.response_cache,
             **filtered_params,
         )
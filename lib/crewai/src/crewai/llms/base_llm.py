@@ -7,6 +7,12 @@ in CrewAI, including common functionality for native SDK implementations.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import contextvars
+from dataclasses import dataclass
 from datetime import datetime
 import json
 import logging
@@ -28,6 +34,12 @@ from crewai.events.types.tool_usage_events import (
     ToolUsageFinishedEvent,
     ToolUsageStartedEvent,
 )
+from crewai.llms.cache import (
+    LLMResponseCache,
+    cache_event_fields,
+    cached_acall,
+    cached_call,
+)
 from crewai.types.usage_metrics import UsageMetrics
 
 
@@ -40,9 +52,41 @@ if TYPE_CHECKING:
 
 DEFAULT_CONTEXT_WINDOW_SIZE: Final[int] = 4096
 DEFAULT_SUPPORTS_STOP_WORDS: Final[bool] = True
+MAX_PARALLEL_TOOL_CALLS: Final[int] = 8
 _JSON_EXTRACTION_PATTERN: Final[re.Pattern[str]] = re.compile(r"\{.*}", re.DOTALL)
 
 
+@dataclass
+class CallTokenUsage:
+    """Tokens reported by the LLM calls made within ``count_call_tokens``."""
+
+    total_tokens: int = 0
+
+
+_call_token_usage: contextvars.ContextVar[CallTokenUsage | None] = (
+    contextvars.ContextVar("_call_token_usage", default=None)
+)
+
+
+@contextmanager
+def count_call_tokens() -> Iterator[CallTokenUsage]:
+    """Count the tokens reported by the LLM calls made within the block.
+
+    Usage is taken from each call's own response, so it is not mixed up with
+    concurrent calls on the same LLM instance, including ones made by agent
+    copies sharing it.
+
+    Yields:
+        The usage, updated as responses arrive.
+    """
+    usage = CallTokenUsage()
+    token = _call_token_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _call_token_usage.reset(token)
+
+
 class BaseLLM(ABC):
     """Abstract base class for LLM implementations.
 
@@ -60,9 +104,19 @@ class BaseLLM(ABC):
         temperature: Optional temperature setting for response generation.
         stop: A list of stop sequences that the LLM should use to stop generation.
         additional_params: Additional provider-specific parameters.
+        response_cache: Optional cache that serves and records responses.
     """
 
     is_litellm: bool = False
+    response_cache: LLMResponseCache | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Route ``call`` and ``acall`` overrides through the response cache."""
+        super().__init_subclass__(**kwargs)
+        if "call" in cls.__dict__:
+            cls.call = cached_call(cls.__dict__["call"])  # type: ignore[method-assign]
+        if "acall" in cls.__dict__:
+            cls.acall = cached_acall(cls.__dict__["acall"])  # type: ignore[method-assign]
 
     def __init__(
         self,
@@ -79,6 +133,7 @@ class BaseLLM(ABC):
             model: The model identifier/name.
             temperature: Optional temperature setting for response generation.
             stop: Optional list of stop sequences for generation.
+            response_cache: Optional ``LLMResponseCache`` for this instance.
             **kwargs: Additional provider-specific parameters.
         """
         if not model:
@@ -91,6 +146,7 @@ class BaseLLM(ABC):
         # Store additional parameters for provider-specific use
         self.additional_params = kwargs
         self._provider = provider or "openai"
+        self.response_cache = kwargs.pop("response_cache", None)
 
         stop = kwargs.pop("stop", None)
         if stop is None:
@@ -315,6 +371,7 @@ class BaseLLM(ABC):
         from_task: Task | None = None,
         from_agent: Agent | None = None,
         messages: str | list[LLMMessage] | None = None,
+        cache_hit: bool = False,
     ) -> None:
         """Emit LLM call completed event."""
         crewai_event_bus.emit(
@@ -326,6 +383,7 @@ class BaseLLM(ABC):
                 from_task=from_task,
                 from_agent=from_agent,
                 model=self.model,
+                **cache_event_fields(cache_hit),
             ),
         )
 
@@ -358,6 +416,8 @@ class BaseLLM(ABC):
         """Emit stream chunk event."""
         if not hasattr(crewai_event_bus, "emit"):
             raise ValueError("crewai_event_bus does not have an emit method") from None
+        if not crewai_event_bus.is_enabled(LLMStreamChunkEvent):
+            return
 
         crewai_event_bus.emit(
             self,
@@ -467,6 +527,105 @@ class BaseLLM(ABC):
 
             return None
 
+    def _execute_tool_calls(
+        self,
+        tool_calls: Sequence[tuple[str, dict[str, Any]]],
+        available_functions: dict[str, Any],
+        from_task: Task | None = None,
+        from_agent: Agent | None = None,
+    ) -> list[str | None]:
+        """Execute the tool calls requested in one LLM turn.
+
+        Independent calls run concurrently on a bounded thread pool, so the
+        turn costs the slowest call rather than the sum of all of them. Calls
+        to functions marked as not thread-safe run one after another in the
+        calling thread once the others have finished.
+
+        Args:
+            tool_calls: ``(function_name, function_args)`` pairs in the order
+                the provider returned them.
+            available_functions: Dict of available functions
+            from_task: Optional task object
+            from_agent: Optional agent object
+
+        Returns:
+            Results of ``_handle_tool_execution``, in the order of ``tool_calls``.
+        """
+        results: list[str | None] = [None] * len(tool_calls)
+        parallel, serial = _partition_tool_calls(tool_calls, available_functions)
+
+        def run(index: int) -> str | None:
+            function_name, function_args = tool_calls[index]
+            return self._handle_tool_execution(
+                function_name=function_name,
+                function_args=function_args,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
+
+        if len(parallel) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(len(parallel), MAX_PARALLEL_TOOL_CALLS),
+                thread_name_prefix="crewai-tool-call",
+            ) as executor:
+                futures = {
+                    index: executor.submit(contextvars.copy_context().run, run, index)
+                    for index in parallel
+                }
+                for index, future in futures.items():
+                    results[index] = future.result()
+        else:
+            serial = sorted(parallel + serial)
+
+        for index in serial:
+            results[index] = run(index)
+        return results
+
+    async def _aexecute_tool_calls(
+        self,
+        tool_calls: Sequence[tuple[str, dict[str, Any]]],
+        available_functions: dict[str, Any],
+        from_task: Task | None = None,
+        from_agent: Agent | None = None,
+    ) -> list[str | None]:
+        """Execute the tool calls requested in one LLM turn without blocking.
+
+        Async counterpart of ``_execute_tool_calls``: independent calls are
+        gathered on worker threads, at most ``MAX_PARALLEL_TOOL_CALLS`` at a
+        time, and calls that are not thread-safe are awaited one at a time.
+
+        Args:
+            tool_calls: ``(function_name, function_args)`` pairs in the order
+                the provider returned them.
+            available_functions: Dict of available functions
+            from_task: Optional task object
+            from_agent: Optional agent object
+
+        Returns:
+            Results of ``_handle_tool_execution``, in the order of ``tool_calls``.
+        """
+        results: list[str | None] = [None] * len(tool_calls)
+        parallel, serial = _partition_tool_calls(tool_calls, available_functions)
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TOOL_CALLS)
+
+        async def run(index: int) -> None:
+            function_name, function_args = tool_calls[index]
+            async with semaphore:
+                results[index] = await asyncio.to_thread(
+                    self._handle_tool_execution,
+                    function_name=function_name,
+                    function_args=function_args,
+                    available_functions=available_functions,
+                    from_task=from_task,
+                    from_agent=from_agent,
+                )
+
+        await asyncio.gather(*(run(index) for index in parallel))
+        for index in serial:
+            await run(index)
+        return results
+
     def _format_messages(self, messages: str | list[LLMMessage]) -> list[LLMMessage]:
         """Convert messages to standard format.
 
@@ -546,13 +705,16 @@ class BaseLLM(ABC):
             return model.partition("/")[0]
         return "openai"  # Default provider
 
-    def _track_token_usage_internal(self, usage_data: dict[str, Any]) -> None:
-        """Track token usage internally in the LLM instance.
+    @staticmethod
+    def _usage_token_counts(usage_data: dict[str, Any]) -> tuple[int, int, int]:
+        """Extract prompt, completion and cached tokens in a provider-agnostic way.
 
         Args:
             usage_data: Token usage data from the API response
+
+        Returns:
+            The prompt, completion and cached prompt token counts
         """
-        # Extract tokens in a provider-agnostic way
         prompt_tokens = (
             usage_data.get("prompt_tokens")
             or usage_data.get("prompt_token_count")
@@ -572,12 +734,35 @@ class BaseLLM(ABC):
             or usage_data.get("cached_prompt_tokens")
             or 0
         )
+        return prompt_tokens, completion_tokens, cached_tokens
+
+    def _count_call_usage(self, usage_data: dict[str, Any]) -> None:
+        """Add the usage of a response to the active ``count_call_tokens`` block.
+
+        Args:
+            usage_data: Token usage data from the API response
+        """
+        usage = _call_token_usage.get()
+        if usage is not None:
+            prompt_tokens, completion_tokens, _ = self._usage_token_counts(usage_data)
+            usage.total_tokens += prompt_tokens + completion_tokens
+
+    def _track_token_usage_internal(self, usage_data: dict[str, Any]) -> None:
+        """Track token usage internally in the LLM instance.
+
+        Args:
+            usage_data: Token usage data from the API response
+        """
+        prompt_tokens, completion_tokens, cached_tokens = self._usage_token_counts(
+            usage_data
+        )
 
         self._token_usage["prompt_tokens"] += prompt_tokens
         self._token_usage["completion_tokens"] += completion_tokens
         self._token_usage["total_tokens"] += prompt_tokens + completion_tokens
         self._token_usage["successful_requests"] += 1
         self._token_usage["cached_prompt_tokens"] += cached_tokens
+        self._count_call_usage(usage_data)
 
     def get_token_usage_summary(self) -> UsageMetrics:
         """Get summary of token usage for this LLM instance.
@@ -717,3 +902,27 @@ class BaseLLM(ABC):
             )
 
         return modified_response
+
+
+def _is_thread_safe(fn: Callable[..., Any]) -> bool:
+    """Read the ``thread_safe`` opt-out from a function or its bound tool."""
+    marker = getattr(fn, "thread_safe", None)
+    if marker is None:
+        marker = getattr(getattr(fn, "__self__", None), "thread_safe", True)
+    return marker is not False
+
+
+def _partition_tool_calls(
+    tool_calls: Sequence[tuple[str, dict[str, Any]]],
+    available_functions: dict[str, Any],
+) -> tuple[list[int], list[int]]:
+    """Split tool call indices into those that may run concurrently and the rest."""
+    parallel: list[int] = []
+    serial: list[int] = []
+    for index, (function_name, _) in enumerate(tool_calls):
+        fn = available_functions.get(function_name)
+        if fn is not None and not _is_thread_safe(fn):
+            serial.append(index)
+        else:
+            parallel.append(index)
+    return parallel, serial
@@ -0,0 +1,420 @@
+"""Response cache for LLM calls with record and replay modes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import functools
+import hashlib
+import inspect
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+
+from pydantic import BaseModel
+
+from crewai.agents.cache.cache_backend import SQLiteCacheBackend
+from crewai.agents.cache.cache_handler import CacheHandler
+from crewai.utilities.paths import db_storage_path
+
+
+if TYPE_CHECKING:
+    from crewai.llms.base_llm import BaseLLM
+
+
+LLMCacheMode = Literal["read_write", "record", "replay"]
+"""How a cache treats calls.
+
+``read_write`` serves hits and stores misses, ``record`` always calls the
+model and overwrites the stored response, and ``replay`` never calls the
+model and raises ``LLMCacheMissError`` when a response was not recorded.
+"""
+
+_CACHE_TOOL_NAME = "llm_response"
+
+# LLM attributes, across providers, that change what the model returns or
+# which deployment serves it. Credentials and transport settings are left out.
+_OUTPUT_PARAMS: tuple[str, ...] = (
+    "max_tokens",
+    "max_completion_tokens",
+    "max_output_tokens",
+    "top_p",
+    "top_k",
+    "n",
+    "seed",
+    "presence_penalty",
+    "frequency_penalty",
+    "logit_bias",
+    "logprobs",
+    "top_logprobs",
+    "reasoning_effort",
+    "thinking",
+    "safety_settings",
+    "guardrail_config",
+    "additional_model_request_fields",
+    "additional_params",
+    "base_url",
+    "api_base",
+    "api_version",
+    "endpoint",
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class LLMCacheMissError(Exception):
+    """Raised in replay mode when a call has no recorded response."""
+
+    def __init__(self, model: str, key: str) -> None:
+        """Initialize the error.
+
+        Args:
+            model: Model the call was made with.
+            key: Cache key of the call.
+        """
+        self.model = model
+        self.key = key
+        super().__init__(
+            f"No recorded response for model '{model}' (cache key {key[:12]}) "
+            "and the LLM cache is in replay mode."
+        )
+
+
+def _canonical_default(value: Any) -> Any:
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return value.model_json_schema()
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    # Falls back to an identity-bearing repr: unknown objects cause misses,
+    # never false hits.
+    return repr(value)
+
+
+def make_cache_key(
+    model: str,
+    messages: str | list[Any],
+    tools: list[Any] | None = None,
+    temperature: float | None = None,
+    response_format: Any = None,
+    stop: list[str] | None = None,
+    available_functions: list[str] | None = None,
+    params: dict[str, Any] | None = None,
+) -> str:
+    """Build the canonical cache key for an LLM call.
+
+    Arguments are serialized as JSON with sorted keys, so dict ordering does
+    not cause misses, and Pydantic models are reduced to their JSON schema.
+
+    Args:
+        model: Model identifier.
+        messages: Prompt string or chat messages.
+        tools: Tool schemas offered to the model.
+        temperature: Sampling temperature.
+        response_format: Structured output model or schema.
+        stop: Stop sequences, which change the returned text.
+        available_functions: Names of functions the call may execute itself
+            instead of returning tool calls.
+        params: Other parameters that change the response, such as
+            ``max_tokens``, ``top_p``, ``seed`` or the endpoint; None values
+            are ignored.
+
+    Returns:
+        A SHA-256 hex digest.
+    """
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "tools": tools,
+            "temperature": temperature,
+            "response_format": response_format,
+            "stop": stop or None,
+            "available_functions": sorted(available_functions or ()) or None,
+            "params": {
+                name: value
+                for name, value in (params or {}).items()
+                if value is not None and value != {}
+            },
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=_canonical_default,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """Opt-in cache for LLM responses.
+
+    Responses live in an in-memory LRU and, when a path is given or
+    ``persist`` is set, in a SQLite file that outlives the process and can be
+    shared between workers. Text, JSON and Pydantic responses are cached;
+    anything else (for example provider tool-call objects) is returned
+    uncached, or raises ``LLMCacheMissError`` in replay mode on the next run.
+
+    Example:
+        >>> cache = LLMResponseCache(path="llm_cache.db", mode="record")
+        >>> llm = LLM(model="gpt-4o", response_cache=cache)
+        >>> # Later, offline and deterministic:
+        >>> llm = LLM(
+        ...     model="gpt-4o",
+        ...     response_cache=LLMResponseCache(path="llm_cache.db", mode="replay"),
+        ... )
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        mode: LLMCacheMode = "read_write",
+        max_size: int | None = 1000,
+        ttl: float | None = None,
+        persist: bool = False,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file for the persistent layer.
+            mode: How calls are served; see ``LLMCacheMode``.
+            max_size: Maximum number of in-memory entries; None means unbounded.
+            ttl: Time-to-live of entries in seconds; None means no expiry.
+            persist: Use the default ``llm_cache.db`` in the crewAI storage
+                directory when no path is given.
+        """
+        if mode not in ("read_write", "record", "replay"):
+            raise ValueError(f"Unsupported LLM cache mode: {mode!r}")
+        if path is None and persist:
+            path = Path(db_storage_path()) / "llm_cache.db"
+        self.mode: LLMCacheMode = mode
+        self.path = str(path) if path is not None else None
+        self._handler = CacheHandler(
+            max_size=max_size,
+            ttl=ttl,
+            backend=SQLiteCacheBackend(self.path) if self.path else None,
+        )
+
+    def get(self, key: str, response_model: type[BaseModel] | None = None) -> Any:
+        """Look up a response.
+
+        Args:
+            key: Key from ``make_cache_key``.
+            response_model: Model to rebuild structured responses with.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        entry = self._handler.read(_CACHE_TOOL_NAME, key)
+        if entry is None:
+            return None
+        kind, value = json.loads(entry)
+        if kind == "model":
+            if response_model is None:
+                return None
+            return response_model.model_validate(value)
+        return value
+
+    def set(self, key: str, response: Any) -> bool:
+        """Store a response.
+
+        Args:
+            key: Key from ``make_cache_key``.
+            response: Response returned by the model.
+
+        Returns:
+            True if the response could be serialized and was stored.
+        """
+        if response is None:
+            return False
+        if isinstance(response, BaseModel):
+            entry: list[Any] = ["model", response.model_dump(mode="json")]
+        else:
+            entry = ["value", response]
+        try:
+            encoded = json.dumps(entry)
+        except (TypeError, ValueError):
+            return False
+        self._handler.add(_CACHE_TOOL_NAME, key, encoded)
+        return True
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss, eviction and size counters."""
+        return self._handler.stats()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        stats = self.stats()
+        lookups = stats["hits"] + stats["misses"]
+        return stats["hits"] / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Drop every entry, including the persistent layer, and reset counters."""
+        self._handler.clear()
+        if self._handler.backend is not None:
+            self._handler.backend.clear()
+
+
+_default_cache: LLMResponseCache | None = None
+
+# Set while a cached call runs, so nested ``call`` overrides (``super().call``,
+# retries) are not looked up twice and completion events can report stats.
+_active_cache: ContextVar[LLMResponseCache | None] = ContextVar(
+    "_active_llm_cache", default=None
+)
+
+
+def set_default_llm_cache(cache: LLMResponseCache | None) -> None:
+    """Set the cache used by LLMs that were not given their own.
+
+    Args:
+        cache: Cache shared by every LLM, or None to disable it.
+    """
+    global _default_cache
+    _default_cache = cache
+
+
+def get_default_llm_cache() -> LLMResponseCache | None:
+    """Return the cache used by LLMs that were not given their own."""
+    return _default_cache
+
+
+def cache_event_fields(hit: bool = False) -> dict[str, Any]:
+    """Return the cache fields of an ``LLMCallCompletedEvent``.
+
+    Args:
+        hit: Whether the response was served from the cache.
+
+    Returns:
+        ``cache_hit`` and ``cache_stats`` for the active cache, or an empty
+        dict when the call is not cached.
+    """
+    cache = _active_cache.get()
+    if cache is None:
+        return {}
+    return {"cache_hit": hit, "cache_stats": cache.stats()}
+
+
+@contextmanager
+def _activate(cache: LLMResponseCache) -> Iterator[None]:
+    token = _active_cache.set(cache)
+    try:
+        yield
+    finally:
+        _active_cache.reset(token)
+
+
+def _cache_for(llm: BaseLLM) -> LLMResponseCache | None:
+    if _active_cache.get() is not None:
+        return None
+    return llm.response_cache or _default_cache
+
+
+def _key_for(llm: BaseLLM, arguments: dict[str, Any]) -> str:
+    response_model = arguments.get("response_model")
+    return make_cache_key(
+        model=llm.model,
+        messages=arguments.get("messages") or [],
+        tools=arguments.get("tools"),
+        temperature=llm.temperature,
+        response_format=response_model or getattr(llm, "response_format", None),
+        stop=llm.stop,
+        available_functions=list(arguments.get("available_functions") or ()),
+        params={name: getattr(llm, name, None) for name in _OUTPUT_PARAMS},
+    )
+
+
+def _emit_hit(llm: BaseLLM, response: Any, arguments: dict[str, Any]) -> None:
+    from crewai.events.types.llm_events import LLMCallType
+
+    llm._emit_call_started_event(
+        messages=arguments.get("messages") or [],
+        from_task=arguments.get("from_task"),
+        from_agent=arguments.get("from_agent"),
+    )
+    llm._emit_call_completed_event(
+        response=response,
+        call_type=LLMCallType.LLM_CALL,
+        from_task=arguments.get("from_task"),
+        from_agent=arguments.get("from_agent"),
+        messages=arguments.get("messages"),
+        cache_hit=True,
+    )
+
+
+def cached_call(call: F) -> F:
+    """Route a ``BaseLLM.call`` implementation through the response cache.
+
+    Args:
+        call: The ``call`` method of a ``BaseLLM`` subclass.
+
+    Returns:
+        A wrapper that serves cached responses and stores new ones.
+    """
+
+    signature = inspect.signature(call)
+
+    @functools.wraps(call)
+    def wrapper(self: BaseLLM, *args: Any, **kwargs: Any) -> Any:
+        cache = _cache_for(self)
+        if cache is None:
+            return call(self, *args, **kwargs)
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        key = _key_for(self, arguments)
+        with _activate(cache):
+            if cache.mode != "record":
+                response = cache.get(key, arguments.get("response_model"))
+                if response is not None:
+                    _emit_hit(self, response, arguments)
+                    return response
+                if cache.mode == "replay":
+                    raise LLMCacheMissError(self.model, key)
+            response = call(self, *args, **kwargs)
+        cache.set(key, response)
+        return response
+
+    return cast(F, wrapper)
+
+
+def cached_acall(acall: F) -> F:
+    """Route a ``BaseLLM.acall`` implementation through the response cache.
+
+    Cache lookups and writes run in a worker thread so the SQLite layer does
+    not block the event loop.
+
+    Args:
+        acall: The ``acall`` method of a ``BaseLLM`` subclass.
+
+    Returns:
+        A wrapper that serves cached responses and stores new ones.
+    """
+
+    signature = inspect.signature(acall)
+    call = cast(Callable[..., Awaitable[Any]], acall)
+
+    @functools.wraps(acall)
+    async def wrapper(self: BaseLLM, *args: Any, **kwargs: Any) -> Any:
+        cache = _cache_for(self)
+        if cache is None:
+            return await call(self, *args, **kwargs)
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        key = _key_for(self, arguments)
+        with _activate(cache):
+            if cache.mode != "record":
+                response = await asyncio.to_thread(
+                    cache.get, key, arguments.get("response_model")
+                )
+                if response is not None:
+                    _emit_hit(self, response, arguments)
+                    return response
+                if cache.mode == "replay":
+                    raise LLMCacheMissError(self.model, key)
+            response = await call(self, *args, **kwargs)
+        await asyncio.to_thread(cache.set, key, response)
+        return response
+
+    return cast(F, wrapper)
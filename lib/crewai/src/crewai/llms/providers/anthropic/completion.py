@@ -697,30 +697,61 @@ class AnthropicCompletion(BaseLLM):
         Returns:
             List of tool result dictionaries in Anthropic format
         """
-        tool_results = []
+        results = self._execute_tool_calls(
+            [
+                (tool_use.name, cast(dict[str, Any], tool_use.input))
+                for tool_use in tool_uses
+            ],
+            available_functions,
+            from_task,
+            from_agent,
+        )
+        return self._format_tool_results(tool_uses, results)
 
-        for tool_use in tool_uses:
-            function_name = tool_use.name
-            function_args = tool_use.input
+    async def _aexecute_tools_and_collect_results(
+        self,
+        tool_uses: list[ToolUseBlock],
+        available_functions: dict[str, Any],
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute tools without blocking and collect results in Anthropic format.
 
-            result = self._handle_tool_execution(
-                function_name=function_name,
-                function_args=cast(dict[str, Any], function_args),
-                available_functions=available_functions,
-                from_task=from_task,
-                from_agent=from_agent,
-            )
+        Args:
+            tool_uses: List of tool use blocks from Claude's response
+            available_functions: Available functions for tool calling
+            from_task: Task that initiated the call
+            from_agent: Agent that initiated the call
 
-            tool_result = {
+        Returns:
+            List of tool result dictionaries in Anthropic format
+        """
+        results = await self._aexecute_tool_calls(
+            [
+                (tool_use.name, cast(dict[str, Any], tool_use.input))
+                for tool_use in tool_uses
+            ],
+            available_functions,
+            from_task,
+            from_agent,
+        )
+        return self._format_tool_results(tool_uses, results)
+
+    @staticmethod
+    def _format_tool_results(
+        tool_uses: list[ToolUseBlock], results: list[str | None]
+    ) -> list[dict[str, Any]]:
+        """Pair tool results with the ``tool_use_id`` of the block that requested them."""
+        return [
+            {
                 "type": "tool_result",
                 "tool_use_id": tool_use.id,
                 "content": str(result)
                 if result is not None
                 else "Tool execution completed",
             }
-            tool_results.append(tool_result)
-
-        return tool_results
+            for tool_use, result in zip(tool_uses, results, strict=True)
+        ]
 
     def _handle_tool_use_conversation(
         self,
@@ -1023,7 +1054,7 @@ class AnthropicCompletion(BaseLLM):
         3. We send tool results back to Claude
         4. Claude processes results and generates final response
         """
-        tool_results = self._execute_tools_and_collect_results(
+        tool_results = await self._aexecute_tools_and_collect_results(
             tool_uses, available_functions, from_task, from_agent
         )
 
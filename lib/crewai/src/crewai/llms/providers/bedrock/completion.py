@@ -1336,6 +1336,9 @@ class BedrockCompletion(BaseLLM):
         self._token_usage["completion_tokens"] += output_tokens
         self._token_usage["total_tokens"] += total_tokens
         self._token_usage["successful_requests"] += 1
+        self._count_call_usage(
+            {"input_tokens": input_tokens, "output_tokens": output_tokens}
+        )
 
     def supports_function_calling(self) -> bool:
         """Check if the model supports function calling."""
@@ -18,6 +18,7 @@ from crewai.mcp.filters import (
     create_dynamic_tool_filter,
     create_static_tool_filter,
 )
+from crewai.mcp.pool import MCPSessionPool, get_mcp_session_pool, mcp_server_key
 from crewai.mcp.transports.base import BaseTransport, TransportType
 
 
@@ -28,10 +29,13 @@ __all__ = [
     "MCPServerHTTP",
     "MCPServerSSE",
     "MCPServerStdio",
+    "MCPSessionPool",
     "StaticToolFilter",
     "ToolFilter",
     "ToolFilterContext",
     "TransportType",
     "create_dynamic_tool_filter",
     "create_static_tool_filter",
+    "get_mcp_session_pool",
+    "mcp_server_key",
 ]
@@ -0,0 +1,359 @@
+"""Process-wide pool of long-lived MCP sessions.
+
+MCP transports (stdio, streamable HTTP, SSE) open anyio task groups that must
+be entered and exited by the same task on the same event loop. Running every
+call through ``asyncio.run`` therefore forces a new subprocess or handshake
+per tool call. The pool instead keeps one session per server on a background
+event-loop thread, where a dedicated owner task holds the connection open, and
+bridges synchronous callers with ``asyncio.run_coroutine_threadsafe``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+from collections.abc import AsyncIterator, Callable, Coroutine
+import concurrent.futures
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any, Final, TypeVar
+
+from crewai.mcp.client import MCPClient
+from crewai.mcp.config import MCPServerConfig
+
+
+T = TypeVar("T")
+
+# Sessions unused for this long are disconnected; they reconnect on next use.
+MCP_POOL_IDLE_TIMEOUT: Final[float] = 300.0
+# Sessions idle for longer than this are pinged before being reused.
+MCP_POOL_HEALTH_CHECK_INTERVAL: Final[float] = 60.0
+MCP_POOL_MAX_CONCURRENT_CALLS: Final[int] = 4
+MCP_POOL_PING_TIMEOUT: Final[float] = 5.0
+MCP_POOL_CLOSE_TIMEOUT: Final[float] = 10.0
+
+
+def mcp_server_key(config: MCPServerConfig) -> str:
+    """Return the pool key of a server configuration.
+
+    Tool filters and tool-list caching do not affect the connection, so
+    configurations that only differ in those share a session.
+
+    Args:
+        config: MCP server configuration.
+
+    Returns:
+        A key identifying the server connection.
+    """
+    connection = config.model_dump_json(exclude={"tool_filter", "cache_tools_list"})
+    return f"{type(config).__name__}:{connection}"
+
+
+def _is_connection_error(error: Exception) -> bool:
+    error_str = str(error).lower()
+    return any(
+        marker in error_str for marker in ("not connected", "connection", "send")
+    )
+
+
+@dataclass
+class _PooledSession:
+    client: MCPClient
+    semaphore: asyncio.Semaphore
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    owner: asyncio.Task[None] | None = None
+    stop: asyncio.Event | None = None
+    last_used: float = field(default_factory=time.monotonic)
+    in_flight: int = 0
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self.owner is not None
+            and not self.owner.done()
+            and bool(self.client.connected)
+        )
+
+
+class MCPSessionPool:
+    """Long-lived MCP client sessions shared across agents and crews.
+
+    Servers are registered once under a key (see ``mcp_server_key``) and
+    connected lazily on first use. Sessions are health-checked with a ping
+    after being idle, disconnected after ``idle_timeout`` without use, and
+    limited to ``max_concurrent_calls`` in-flight requests per server.
+
+    Example:
+        >>> pool = get_mcp_session_pool()
+        >>> key = mcp_server_key(config)
+        >>> pool.register(key, lambda: MCPClient(transport))
+        >>> tools = pool.list_tools(key)
+        >>> result = pool.call_tool(key, "search", {"query": "crewai"})
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = MCP_POOL_IDLE_TIMEOUT,
+        health_check_interval: float = MCP_POOL_HEALTH_CHECK_INTERVAL,
+        max_concurrent_calls: int = MCP_POOL_MAX_CONCURRENT_CALLS,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            idle_timeout: Seconds without use after which a session is closed.
+            health_check_interval: Seconds of idleness after which a session
+                is pinged before reuse.
+            max_concurrent_calls: Maximum in-flight requests per server.
+        """
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.max_concurrent_calls = max_concurrent_calls
+        self._sessions: dict[str, _PooledSession] = {}
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._evictor: concurrent.futures.Future[None] | None = None
+
+    def register(self, key: str, factory: Callable[[], MCPClient]) -> MCPClient:
+        """Register a server, creating its client if the key is new.
+
+        Args:
+            key: Pool key of the server.
+            factory: Builds the client; only called for new keys.
+
+        Returns:
+            The pooled client for the key.
+        """
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                entry = _PooledSession(
+                    client=factory(),
+                    semaphore=asyncio.Semaphore(self.max_concurrent_calls),
+                )
+                self._sessions[key] = entry
+            return entry.client
+
+    def list_tools(self, key: str) -> list[dict[str, Any]]:
+        """List the tools of a registered server.
+
+        Args:
+            key: Pool key of the server.
+
+        Returns:
+            Tool definitions with name, description, and inputSchema.
+        """
+        return self.run(self.alist_tools(key))
+
+    def call_tool(
+        self, key: str, tool_name: str, arguments: dict[str, Any] | None = None
+    ) -> Any:
+        """Call a tool on a registered server.
+
+        Args:
+            key: Pool key of the server.
+            tool_name: Name of the tool on the server.
+            arguments: Tool arguments.
+
+        Returns:
+            Tool execution result.
+        """
+        return self.run(self.acall_tool(key, tool_name, arguments))
+
+    async def alist_tools(self, key: str) -> list[dict[str, Any]]:
+        """List the tools of a registered server on the pool's loop."""
+        async with self._checkout(key) as entry:
+            return await entry.client.list_tools()
+
+    async def acall_tool(
+        self, key: str, tool_name: str, arguments: dict[str, Any] | None = None
+    ) -> Any:
+        """Call a tool on a registered server on the pool's loop."""
+        async with self._checkout(key) as entry:
+            try:
+                return await entry.client.call_tool(tool_name, arguments)
+            except Exception as e:
+                if not _is_connection_error(e):
+                    raise
+            async with entry.lock:
+                await self._disconnect(entry)
+                await self._connect(entry)
+            return await entry.client.call_tool(tool_name, arguments)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the pool's event loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            The coroutine's result.
+
+        Raises:
+            RuntimeError: If called from the pool's own loop thread, where
+                blocking would deadlock.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "MCPSessionPool.run cannot be called from the pool's event loop; "
+                "await the coroutine instead."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self) -> None:
+        """Disconnect every session and stop the loop thread.
+
+        Registrations are dropped; the pool can be used again afterwards.
+        """
+        with self._lock:
+            loop, thread, evictor = self._loop, self._thread, self._evictor
+            self._loop = self._thread = self._evictor = None
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        if loop is None or thread is None:
+            return
+        if evictor is not None:
+            evictor.cancel()
+
+        async def _disconnect_all() -> None:
+            await asyncio.gather(
+                *(self._disconnect(entry) for entry in sessions),
+                return_exceptions=True,
+            )
+
+        with suppress(Exception):
+            asyncio.run_coroutine_threadsafe(_disconnect_all(), loop).result(
+                timeout=MCP_POOL_CLOSE_TIMEOUT
+            )
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join(timeout=MCP_POOL_CLOSE_TIMEOUT)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop,),
+                    name="crewai-mcp-session-pool",
+                    daemon=True,
+                )
+                self._thread.start()
+                self._loop = loop
+                self._evictor = asyncio.run_coroutine_threadsafe(
+                    self._evict_idle(), loop
+                )
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    @asynccontextmanager
+    async def _checkout(self, key: str) -> AsyncIterator[_PooledSession]:
+        entry = self._sessions.get(key)
+        if entry is None:
+            raise KeyError(f"No MCP server registered under {key!r}")
+        entry.in_flight += 1
+        try:
+            async with entry.lock:
+                idle = time.monotonic() - entry.last_used
+                if (
+                    entry.alive
+                    and idle > self.health_check_interval
+                    and not await self._healthy(entry)
+                ):
+                    await self._disconnect(entry)
+                if not entry.alive:
+                    await self._disconnect(entry)
+                    await self._connect(entry)
+            async with entry.semaphore:
+                yield entry
+        finally:
+            entry.in_flight -= 1
+            entry.last_used = time.monotonic()
+
+    async def _connect(self, entry: _PooledSession) -> None:
+        ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        entry.stop = stop
+        entry.owner = asyncio.create_task(self._own(entry.client, ready, stop))
+        await ready
+
+    @staticmethod
+    async def _own(
+        client: MCPClient, ready: asyncio.Future[None], stop: asyncio.Event
+    ) -> None:
+        """Hold a connection open; transports must be exited by this task."""
+        try:
+            await client.connect()
+        except Exception as e:
+            ready.set_exception(e)
+            return
+        except BaseException:
+            ready.cancel()
+            raise
+        ready.set_result(None)
+        try:
+            await stop.wait()
+        finally:
+            # Best effort: the session is being discarded either way.
+            with suppress(Exception):
+                await client.disconnect()
+
+    @staticmethod
+    async def _disconnect(entry: _PooledSession) -> None:
+        owner, stop = entry.owner, entry.stop
+        entry.owner = entry.stop = None
+        if owner is None or stop is None:
+            return
+        stop.set()
+        await asyncio.gather(owner, return_exceptions=True)
+
+    @staticmethod
+    async def _healthy(entry: _PooledSession) -> bool:
+        try:
+            await asyncio.wait_for(
+                entry.client.session.send_ping(), timeout=MCP_POOL_PING_TIMEOUT
+            )
+        except Exception:
+            return False
+        return True
+
+    async def _evict_idle(self) -> None:
+        interval = min(self.idle_timeout, self.health_check_interval)
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for entry in list(self._sessions.values()):
+                if entry.owner is None or entry.in_flight:
+                    continue
+                if now - entry.last_used < self.idle_timeout:
+                    continue
+                async with entry.lock:
+                    if not entry.in_flight:
+                        await self._disconnect(entry)
+
+
+_default_pool: MCPSessionPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """Return the process-wide MCP session pool, creating it on first use."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = MCPSessionPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
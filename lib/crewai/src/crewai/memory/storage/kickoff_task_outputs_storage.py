@@ -9,6 +9,7 @@ from crewai.utilities import Printer
 from crewai.utilities.crew_json_encoder import CrewJSONEncoder
 from crewai.utilities.errors import DatabaseError, DatabaseOperationError
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import get_sqlite_pool
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,7 @@ class KickoffTaskOutputsSQLiteStorage:
             db_path = str(Path(db_storage_path()) / "latest_kickoff_task_outputs.db")
         self.db_path = db_path
         self._printer: Printer = Printer()
+        self._pool = get_sqlite_pool(self.db_path)
         self._initialize_db()
 
     def _initialize_db(self) -> None:
@@ -38,9 +40,8 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If database initialization fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._pool.transaction() as conn:
+                conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS latest_kickoff_task_outputs (
                         task_id TEXT PRIMARY KEY,
@@ -53,8 +54,12 @@ class KickoffTaskOutputsSQLiteStorage:
                     )
                 """
                 )
-
-                conn.commit()
+                conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_latest_kickoff_task_outputs_task_index
+                    ON latest_kickoff_task_outputs (task_index)
+                """
+                )
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
             logger.error(error_msg)
@@ -82,10 +87,8 @@ class KickoffTaskOutputsSQLiteStorage:
         """
         inputs = inputs or {}
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._pool.transaction() as conn:
+                conn.execute(
                     """
                 INSERT OR REPLACE INTO latest_kickoff_task_outputs
                 (task_id, expected_output, output, task_index, inputs, was_replayed)
@@ -100,7 +103,6 @@ class KickoffTaskOutputsSQLiteStorage:
                         was_replayed,
                     ),
                 )
-                conn.commit()
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
             logger.error(error_msg)
@@ -125,10 +127,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If updating the task output fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
-                cursor = conn.cursor()
-
+            with self._pool.transaction() as conn:
                 fields = []
                 values = []
                 for key, value in kwargs.items():
@@ -142,8 +141,7 @@ class KickoffTaskOutputsSQLiteStorage:
                 query = f"UPDATE latest_kickoff_task_outputs SET {', '.join(fields)} WHERE task_index = ?"  # nosec # noqa: S608
                 values.append(task_index)
 
-                cursor.execute(query, tuple(values))
-                conn.commit()
+                cursor = conn.execute(query, tuple(values))
 
                 if cursor.rowcount == 0:
                     logger.warning(
@@ -166,29 +164,26 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If loading task outputs fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
+            conn = self._pool.connection()
+            rows = conn.execute("""
                 SELECT *
                 FROM latest_kickoff_task_outputs
                 ORDER BY task_index
-                """)
-
-                rows = cursor.fetchall()
-                results = []
-                for row in rows:
-                    result = {
-                        "task_id": row[0],
-                        "expected_output": row[1],
-                        "output": json.loads(row[2]),
-                        "task_index": row[3],
-                        "inputs": json.loads(row[4]),
-                        "was_replayed": row[5],
-                        "timestamp": row[6],
-                    }
-                    results.append(result)
-
-                return results
+                """).fetchall()
+            results = []
+            for row in rows:
+                result = {
+                    "task_id": row[0],
+                    "expected_output": row[1],
+                    "output": json.loads(row[2]),
+                    "task_index": row[3],
+                    "inputs": json.loads(row[4]),
+                    "was_replayed": row[5],
+                    "timestamp": row[6],
+                }
+                results.append(result)
+
+            return results
 
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
@@ -205,11 +200,8 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If deleting task outputs fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM latest_kickoff_task_outputs")
-                conn.commit()
+            with self._pool.transaction() as conn:
+                conn.execute("DELETE FROM latest_kickoff_task_outputs")
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
             logger.error(error_msg)
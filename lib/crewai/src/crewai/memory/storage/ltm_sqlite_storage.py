@@ -3,10 +3,9 @@ from pathlib import Path
 import sqlite3
 from typing import Any
 
-import aiosqlite
-
 from crewai.utilities import Printer
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import get_sqlite_pool
 
 
 class LTMSQLiteStorage:
@@ -22,15 +21,14 @@ class LTMSQLiteStorage:
             db_path = str(Path(db_storage_path()) / "long_term_memory_storage.db")
         self.db_path = db_path
         self._printer: Printer = Printer()
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_sqlite_pool(self.db_path)
         self._initialize_db()
 
     def _initialize_db(self) -> None:
         """Initialize the SQLite database and create LTM table."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._pool.transaction() as conn:
+                conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS long_term_memories (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -41,14 +39,53 @@ class LTMSQLiteStorage:
                     )
                 """
                 )
-
-                conn.commit()
+                conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_long_term_memories_task_datetime
+                    ON long_term_memories (task_description, datetime DESC, score)
+                """
+                )
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred during database initialization: {e}",
                 color="red",
             )
 
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, rows: list[tuple[Any, ...]]) -> None:
+        conn.executemany(
+            """
+            INSERT INTO long_term_memories (task_description, metadata, datetime, score)
+            VALUES (?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+    @staticmethod
+    def _select(
+        conn: sqlite3.Connection, task_description: str, latest_n: int
+    ) -> list[dict[str, Any]] | None:
+        rows = conn.execute(
+            """
+            SELECT metadata, datetime, score
+            FROM long_term_memories
+            WHERE task_description = ?
+            ORDER BY datetime DESC, score ASC
+            LIMIT ?
+            """,
+            (task_description, latest_n),
+        ).fetchall()
+        if not rows:
+            return None
+        return [
+            {
+                "metadata": json.loads(row[0]),
+                "datetime": row[1],
+                "score": row[2],
+            }
+            for row in rows
+        ]
+
     def save(
         self,
         task_description: str,
@@ -57,17 +94,22 @@ class LTMSQLiteStorage:
         score: int | float,
     ) -> None:
         """Saves data to the LTM table with error handling."""
+        self.save_many([(task_description, metadata, datetime, score)])
+
+    def save_many(
+        self, entries: list[tuple[str, dict[str, Any], str, int | float]]
+    ) -> None:
+        """Saves several memories in a single transaction.
+
+        Args:
+            entries: Tuples of task description, metadata, datetime and score.
+        """
+        rows = [
+            (task_description, json.dumps(metadata), datetime, score)
+            for task_description, metadata, datetime, score in entries
+        ]
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                INSERT INTO long_term_memories (task_description, metadata, datetime, score)
-                VALUES (?, ?, ?, ?)
-            """,
-                    (task_description, json.dumps(metadata), datetime, score),
-                )
-                conn.commit()
+            self._pool.run(lambda conn: self._insert(conn, rows))
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while saving to LTM: {e}",
@@ -77,29 +119,7 @@ class LTMSQLiteStorage:
     def load(self, task_description: str, latest_n: int) -> list[dict[str, Any]] | None:
         """Queries the LTM table by task description with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    f"""
-                    SELECT metadata, datetime, score
-                    FROM long_term_memories
-                    WHERE task_description = ?
-                    ORDER BY datetime DESC, score ASC
-                    LIMIT {latest_n}
-                """,  # nosec # noqa: S608
-                    (task_description,),
-                )
-                rows = cursor.fetchall()
-                if rows:
-                    return [
-                        {
-                            "metadata": json.loads(row[0]),
-                            "datetime": row[1],
-                            "score": row[2],
-                        }
-                        for row in rows
-                    ]
-
+            return self._select(self._pool.connection(), task_description, latest_n)
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while querying LTM: {e}",
@@ -110,11 +130,7 @@ class LTMSQLiteStorage:
     def reset(self) -> None:
         """Resets the LTM table with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM long_term_memories")
-                conn.commit()
-
+            self._pool.run(lambda conn: conn.execute("DELETE FROM long_term_memories"))
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while deleting all rows in LTM: {e}",
@@ -136,17 +152,10 @@ class LTMSQLiteStorage:
             datetime: Timestamp of the memory.
             score: Quality score of the memory.
         """
+        rows = [(task_description, json.dumps(metadata), datetime, score)]
         try:
-            async with aiosqlite.connect(self.db_path) as conn:
-                await conn.execute(
-                    """
-                    INSERT INTO long_term_memories (task_description, metadata, datetime, score)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (task_description, json.dumps(metadata), datetime, score),
-                )
-                await conn.commit()
-        except aiosqlite.Error as e:
+            await self._pool.arun(lambda conn: self._insert(conn, rows))
+        except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while saving to LTM: {e}",
                 color="red",
@@ -165,28 +174,10 @@ class LTMSQLiteStorage:
             List of matching memory entries or None if error occurs.
         """
         try:
-            async with aiosqlite.connect(self.db_path) as conn:
-                cursor = await conn.execute(
-                    f"""
-                    SELECT metadata, datetime, score
-                    FROM long_term_memories
-                    WHERE task_description = ?
-                    ORDER BY datetime DESC, score ASC
-                    LIMIT {latest_n}
-                    """,  # nosec # noqa: S608
-                    (task_description,),
-                )
-                rows = await cursor.fetchall()
-                if rows:
-                    return [
-                        {
-                            "metadata": json.loads(row[0]),
-                            "datetime": row[1],
-                            "score": row[2],
-                        }
-                        for row in rows
-                    ]
-        except aiosqlite.Error as e:
+            return await self._pool.arun(
+                lambda conn: self._select(conn, task_description, latest_n)
+            )
+        except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while querying LTM: {e}",
                 color="red",
@@ -196,10 +187,10 @@ class LTMSQLiteStorage:
     async def areset(self) -> None:
         """Reset the LTM table asynchronously."""
         try:
-            async with aiosqlite.connect(self.db_path) as conn:
-                await conn.execute("DELETE FROM long_term_memories")
-                await conn.commit()
-        except aiosqlite.Error as e:
+            await self._pool.arun(
+                lambda conn: conn.execute("DELETE FROM long_term_memories")
+            )
+        except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while deleting all rows in LTM: {e}",
                 color="red",
@@ -12,7 +12,8 @@ from crewai.agents.cache.cache_handler import CacheHandler
 
 P = ParamSpec("P")
 R = TypeVar("R")
-cache = CacheHandler()
+# Memoized agents/tasks must keep their identity, so this cache is never evicted
+cache = CacheHandler(max_size=None)
 
 
 def _make_hashable(arg: Any) -> Any:
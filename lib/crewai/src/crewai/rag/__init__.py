@@ -1,12 +1,15 @@
 """RAG (Retrieval-Augmented Generation) infrastructure for CrewAI."""
 
+from __future__ import annotations
+
 import importlib
 import sys
 from types import ModuleType
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
 
-from crewai.rag.config.types import RagConfigType
-from crewai.rag.config.utils import set_rag_config
+if TYPE_CHECKING:
+    from crewai.rag.config.types import RagConfigType
 
 
 _module_path = __path__
@@ -27,14 +30,22 @@ class _RagModule(ModuleType):
         """
         super().__init__(module_name)
 
-    def __setattr__(self, name: str, value: RagConfigType) -> None:
+    def __setattr__(self, name: str, value: RagConfigType | ModuleType) -> None:
         """Set module attributes.
 
         Args:
             name: Attribute name.
             value: Attribute value.
         """
+        if isinstance(value, ModuleType):
+            # The import system binds submodules such as ``crewai.rag.config``
+            # on their parent package when they are first imported.
+            return super().__setattr__(name, value)
         if name == "config":
+            # Imported here so that importing ``crewai.rag`` submodules does
+            # not load every vector store client.
+            from crewai.rag.config.utils import set_rag_config
+
             return set_rag_config(value)
         raise AttributeError(f"Setting attribute '{name}' is not allowed.")
 
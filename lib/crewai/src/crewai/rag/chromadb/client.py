@@ -12,6 +12,7 @@ from typing_extensions import Unpack
 from crewai.rag.chromadb.types import (
     ChromaDBClientType,
     ChromaDBCollectionCreateParams,
+    ChromaDBCollectionIdsParams,
     ChromaDBCollectionSearchParams,
 )
 from crewai.rag.chromadb.utils import (
@@ -380,6 +381,140 @@ class ChromaDBClient(BaseClient):
                 metadatas=batch_metadatas,  # type: ignore[arg-type]
             )
 
+    def get_existing_ids(
+        self, **kwargs: Unpack[ChromaDBCollectionIdsParams]
+    ) -> set[str]:
+        """Return which of the given document IDs are already stored.
+
+        Only IDs are fetched, so no embeddings are computed or transferred.
+
+        Keyword Args:
+            collection_name: The name of the collection to check.
+            ids: Document IDs to look up.
+            batch_size: Optional number of IDs per request (default: 100)
+
+        Raises:
+            TypeError: If AsyncClientAPI is used instead of ClientAPI for sync operations.
+            ConnectionError: If unable to connect to ChromaDB server.
+        """
+        if not _is_sync_client(self.client):
+            raise TypeError(
+                "Synchronous method get_existing_ids() requires a ClientAPI. "
+                "Use aget_existing_ids() for AsyncClientAPI."
+            )
+
+        ids = kwargs["ids"]
+        batch_size = kwargs.get("batch_size", self.default_batch_size)
+        if not ids:
+            return set()
+
+        collection = self.client.get_or_create_collection(
+            name=_sanitize_collection_name(kwargs["collection_name"]),
+            embedding_function=self.embedding_function,
+        )
+        existing: set[str] = set()
+        for i in range(0, len(ids), batch_size):
+            result = collection.get(ids=ids[i : i + batch_size], include=[])
+            existing.update(result["ids"])
+        return existing
+
+    async def aget_existing_ids(
+        self, **kwargs: Unpack[ChromaDBCollectionIdsParams]
+    ) -> set[str]:
+        """Return which of the given document IDs are already stored asynchronously.
+
+        Keyword Args:
+            collection_name: The name of the collection to check.
+            ids: Document IDs to look up.
+            batch_size: Optional number of IDs per request (default: 100)
+
+        Raises:
+            TypeError: If ClientAPI is used instead of AsyncClientAPI for async operations.
+            ConnectionError: If unable to connect to ChromaDB server.
+        """
+        if not _is_async_client(self.client):
+            raise TypeError(
+                "Asynchronous method aget_existing_ids() requires an AsyncClientAPI. "
+                "Use get_existing_ids() for ClientAPI."
+            )
+
+        ids = kwargs["ids"]
+        batch_size = kwargs.get("batch_size", self.default_batch_size)
+        if not ids:
+            return set()
+
+        collection = await self.client.get_or_create_collection(
+            name=_sanitize_collection_name(kwargs["collection_name"]),
+            embedding_function=self.embedding_function,
+        )
+        existing: set[str] = set()
+        for i in range(0, len(ids), batch_size):
+            result = await collection.get(ids=ids[i : i + batch_size], include=[])
+            existing.update(result["ids"])
+        return existing
+
+    def delete_documents(self, **kwargs: Unpack[ChromaDBCollectionIdsParams]) -> None:
+        """Delete documents from a collection by ID.
+
+        Keyword Args:
+            collection_name: The name of the collection to delete from.
+            ids: Document IDs to delete; unknown IDs are ignored.
+            batch_size: Optional number of IDs per request (default: 100)
+
+        Raises:
+            TypeError: If AsyncClientAPI is used instead of ClientAPI for sync operations.
+            ConnectionError: If unable to connect to ChromaDB server.
+        """
+        if not _is_sync_client(self.client):
+            raise TypeError(
+                "Synchronous method delete_documents() requires a ClientAPI. "
+                "Use adelete_documents() for AsyncClientAPI."
+            )
+
+        ids = kwargs["ids"]
+        batch_size = kwargs.get("batch_size", self.default_batch_size)
+        if not ids:
+            return
+
+        collection = self.client.get_or_create_collection(
+            name=_sanitize_collection_name(kwargs["collection_name"]),
+            embedding_function=self.embedding_function,
+        )
+        for i in range(0, len(ids), batch_size):
+            collection.delete(ids=ids[i : i + batch_size])
+
+    async def adelete_documents(
+        self, **kwargs: Unpack[ChromaDBCollectionIdsParams]
+    ) -> None:
+        """Delete documents from a collection by ID asynchronously.
+
+        Keyword Args:
+            collection_name: The name of the collection to delete from.
+            ids: Document IDs to delete; unknown IDs are ignored.
+            batch_size: Optional number of IDs per request (default: 100)
+
+        Raises:
+            TypeError: If ClientAPI is used instead of AsyncClientAPI for async operations.
+            ConnectionError: If unable to connect to ChromaDB server.
+        """
+        if not _is_async_client(self.client):
+            raise TypeError(
+                "Asynchronous method adelete_documents() requires an AsyncClientAPI. "
+                "Use delete_documents() for ClientAPI."
+            )
+
+        ids = kwargs["ids"]
+        batch_size = kwargs.get("batch_size", self.default_batch_size)
+        if not ids:
+            return
+
+        collection = await self.client.get_or_create_collection(
+            name=_sanitize_collection_name(kwargs["collection_name"]),
+            embedding_function=self.embedding_function,
+        )
+        for i in range(0, len(ids), batch_size):
+            await collection.delete(ids=ids[i : i + batch_size])
+
     def search(
         self, **kwargs: Unpack[ChromaDBCollectionSearchParams]
     ) -> list[SearchResult]:
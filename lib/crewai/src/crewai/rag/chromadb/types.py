@@ -16,6 +16,7 @@ from chromadb.api.types import (
 )
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
+from typing_extensions import Required
 
 from crewai.rag.core.base_client import BaseCollectionParams, BaseCollectionSearchParams
 
@@ -100,3 +101,15 @@ class ChromaDBCollectionSearchParams(BaseCollectionSearchParams, total=False):
     where: Where
     where_document: WhereDocument
     include: Include
+
+
+class ChromaDBCollectionIdsParams(BaseCollectionParams, total=False):
+    """Parameters for operations on documents of a ChromaDB collection by ID.
+
+    Attributes:
+        ids: Document IDs to operate on.
+        batch_size: Optional number of IDs sent per request.
+    """
+
+    ids: Required[list[str]]
+    batch_size: int
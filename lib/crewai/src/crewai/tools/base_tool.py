@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import asyncio
 from collections.abc import Awaitable, Callable
+from datetime import timedelta
 from inspect import Parameter, signature
 import json
 from typing import (
@@ -77,14 +78,22 @@ class BaseTool(BaseModel, ABC):
         default=False, description="Flag to check if the description has been updated."
     )
 
-    cache_function: Callable[..., bool] = Field(
+    cache_function: Callable[..., bool | float | timedelta] = Field(
         default=lambda _args=None, _result=None: True,
-        description="Function that will be used to determine if the tool should be cached, should return a boolean. If None, the tool will be cached.",
+        description="Function that will be used to determine if the tool should be cached, should return a boolean, or a time-to-live as a float number of seconds or a timedelta. If None, the tool will be cached.",
+    )
+    cache_ttl: float | None = Field(
+        default=None,
+        description="Seconds a cached result of this tool stays valid. None uses the cache handler's default.",
     )
     result_as_answer: bool = Field(
         default=False,
         description="Flag to check if the tool should be the final agent answer.",
     )
+    thread_safe: bool = Field(
+        default=True,
+        description="Whether calls to this tool may run concurrently with other tool calls requested in the same LLM turn.",
+    )
     max_usage_count: int | None = Field(
         default=None,
         description="Maximum number of times this tool can be used. None means unlimited usage.",
@@ -4,9 +4,9 @@ This module provides a tool wrapper that reuses existing MCP client sessions
 for better performance and connection management.
 """
 
-import asyncio
 from typing import Any
 
+from crewai.mcp.pool import get_mcp_session_pool
 from crewai.tools import BaseTool
 
 
@@ -17,8 +17,9 @@ class MCPNativeTool(BaseTool):
     structured configurations. It reuses existing client sessions for
     better performance and proper connection lifecycle management.
 
-    Unlike MCPToolWrapper which connects on-demand, this tool uses
-    a shared MCP client instance that maintains a persistent connection.
+    Unlike MCPToolWrapper which connects on-demand, this tool runs through
+    the process-wide MCP session pool, which keeps the client connected
+    between calls.
     """
 
     def __init__(
@@ -27,6 +28,7 @@ class MCPNativeTool(BaseTool):
         tool_name: str,
         tool_schema: dict[str, Any],
         server_name: str,
+        pool_key: str | None = None,
     ) -> None:
         """Initialize native MCP tool.
 
@@ -35,6 +37,8 @@ class MCPNativeTool(BaseTool):
             tool_name: Original name of the tool on the MCP server.
             tool_schema: Schema information for the tool.
             server_name: Name of the MCP server for prefixing.
+            pool_key: Key of the client in the MCP session pool. Defaults to
+                a key derived from the client's transport.
         """
         # Create tool name with server prefix to avoid conflicts
         prefixed_name = f"{server_name}_{tool_name}"
@@ -59,7 +63,7 @@ class MCPNativeTool(BaseTool):
         self._mcp_client = mcp_client
         self._original_tool_name = tool_name
         self._server_name = server_name
-        # self._logger = logging.getLogger(__name__)
+        self._pool_key = pool_key or mcp_client._get_cache_key("session")
 
     @property
     def mcp_client(self) -> Any:
@@ -76,8 +80,8 @@ class MCPNativeTool(BaseTool):
         """Get the server name."""
         return self._server_name
 
-    def _run(self, **kwargs) -> str:
-        """Execute tool using the MCP client session.
+    def _run(self, **kwargs: Any) -> str:
+        """Execute tool using the pooled MCP client session.
 
         Args:
             **kwargs: Arguments to pass to the MCP tool.
@@ -85,67 +89,17 @@ class MCPNativeTool(BaseTool):
         Returns:
             Result from the MCP tool execution.
         """
+        pool = get_mcp_session_pool()
+        # Re-registering is a no-op while the session is pooled and restores
+        # it if the pool was closed in between.
+        pool.register(self._pool_key, lambda: self._mcp_client)
         try:
-            try:
-                asyncio.get_running_loop()
-
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    coro = self._run_async(**kwargs)
-                    future = executor.submit(asyncio.run, coro)
-                    return future.result()
-            except RuntimeError:
-                return asyncio.run(self._run_async(**kwargs))
-
+            result = pool.call_tool(self._pool_key, self.original_tool_name, kwargs)
         except Exception as e:
             raise RuntimeError(
                 f"Error executing MCP tool {self.original_tool_name}: {e!s}"
             ) from e
 
-    async def _run_async(self, **kwargs) -> str:
-        """Async implementation of tool execution.
-
-        Args:
-            **kwargs: Arguments to pass to the MCP tool.
-
-        Returns:
-            Result from the MCP tool execution.
-        """
-        # Note: Since we use asyncio.run() which creates a new event loop each time,
-        # Always reconnect on-demand because asyncio.run() creates new event loops per call
-        # All MCP transport context managers (stdio, streamablehttp_client, sse_client)
-        # use anyio.create_task_group() which can't span different event loops
-        if self._mcp_client.connected:
-            await self._mcp_client.disconnect()
-
-        await self._mcp_client.connect()
-
-        try:
-            result = await self._mcp_client.call_tool(self.original_tool_name, kwargs)
-
-        except Exception as e:
-            error_str = str(e).lower()
-            if (
-                "not connected" in error_str
-                or "connection" in error_str
-                or "send" in error_str
-            ):
-                await self._mcp_client.disconnect()
-                await self._mcp_client.connect()
-                # Retry the call
-                result = await self._mcp_client.call_tool(
-                    self.original_tool_name, kwargs
-                )
-            else:
-                raise
-
-        finally:
-            # Always disconnect after tool call to ensure clean context manager lifecycle
-            # This prevents "exit cancel scope in different task" errors
-            # All transport context managers must be exited in the same event loop they were entered
-            await self._mcp_client.disconnect()
-
         # Extract result content
         if isinstance(result, str):
             return result
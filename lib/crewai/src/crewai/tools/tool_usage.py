@@ -241,7 +241,7 @@ class ToolUsage:
                 if self.task:
                     self.task.increment_tools_errors()
 
-        if self.agent:
+        if self.agent and crewai_event_bus.is_enabled(ToolUsageStartedEvent):
             event_data = {
                 "agent_key": self.agent.key,
                 "agent_role": self.agent.role,
@@ -349,17 +349,14 @@ class ToolUsage:
                 return await self.ause(calling=calling, tool_string=tool_string)
 
             if self.tools_handler:
-                should_cache = True
-                if (
-                    hasattr(available_tool, "cache_function")
-                    and available_tool.cache_function
-                ):
-                    should_cache = available_tool.cache_function(
-                        calling.arguments, result
-                    )
-
+                should_cache, cache_ttl = self._resolve_cache_policy(
+                    available_tool, calling, result
+                )
                 self.tools_handler.on_tool_use(
-                    calling=calling, output=result, should_cache=should_cache
+                    calling=calling,
+                    output=result,
+                    should_cache=should_cache,
+                    ttl=cache_ttl,
                 )
 
         self._telemetry.tool_usage(
@@ -427,7 +424,7 @@ class ToolUsage:
                 if self.task:
                     self.task.increment_tools_errors()
 
-        if self.agent:
+        if self.agent and crewai_event_bus.is_enabled(ToolUsageStartedEvent):
             event_data = {
                 "agent_key": self.agent.key,
                 "agent_role": self.agent.role,
@@ -541,17 +538,14 @@ class ToolUsage:
                 return self.use(calling=calling, tool_string=tool_string)
 
             if self.tools_handler:
-                should_cache = True
-                if (
-                    hasattr(available_tool, "cache_function")
-                    and available_tool.cache_function
-                ):
-                    should_cache = available_tool.cache_function(
-                        calling.arguments, result
-                    )
-
+                should_cache, cache_ttl = self._resolve_cache_policy(
+                    available_tool, calling, result
+                )
                 self.tools_handler.on_tool_use(
-                    calling=calling, output=result, should_cache=should_cache
+                    calling=calling,
+                    output=result,
+                    should_cache=should_cache,
+                    ttl=cache_ttl,
                 )
         self._telemetry.tool_usage(
             llm=self.function_calling_llm,
@@ -645,6 +639,39 @@ class ToolUsage:
             return f"Tool '{tool_name}' has reached its usage limit of {tool.max_usage_count} times and cannot be used anymore."
         return None
 
+    @staticmethod
+    def _resolve_cache_policy(
+        tool: Any, calling: ToolCalling | InstructorToolCalling, result: Any
+    ) -> tuple[bool, float | None]:
+        """Decide whether a tool result is cached and for how long.
+
+        Structured tools defer to the ``BaseTool`` they were built from, whose
+        ``cache_function`` may return whether to cache or a TTL, and whose
+        ``cache_ttl`` sets the default TTL for its results. Only floats and
+        ``timedelta`` values are TTLs; booleans and integers are on/off flags,
+        since ``cache_function`` used to be read for its truthiness and
+        ``return 1`` must not become a one-second TTL.
+
+        Args:
+            tool: The tool that produced the result
+            calling: The tool calling with the arguments used
+            result: The tool output
+
+        Returns:
+            Tuple of (should_cache, ttl); a None ttl defers to the cache handler.
+        """
+        source = getattr(tool, "_original_tool", None) or tool
+        ttl = getattr(source, "cache_ttl", None)
+        cache_function = getattr(source, "cache_function", None)
+        if not cache_function:
+            return True, ttl
+        decision = cache_function(calling.arguments, result)
+        if isinstance(decision, datetime.timedelta):
+            decision = decision.total_seconds()
+        if isinstance(decision, float):
+            return decision > 0, decision
+        return bool(decision), ttl
+
     def _select_tool(self, tool_name: str) -> Any:
         order_tools = sorted(
             self.tools,
@@ -877,6 +904,8 @@ class ToolUsage:
         started_at: float,
         result: Any,
     ) -> None:
+        if not crewai_event_bus.is_enabled(ToolUsageFinishedEvent):
+            return
         finished_at = time.time()
         event_data = self._prepare_event_data(tool, tool_calling)
         event_data.update(
@@ -1,14 +1,21 @@
-from crewai.utilities.converter import Converter, ConverterError
-from crewai.utilities.exceptions.context_window_exceeding_exception import (
-    LLMContextLengthExceededError,
-)
-from crewai.utilities.file_handler import FileHandler
-from crewai.utilities.i18n import I18N
-from crewai.utilities.internal_instructor import InternalInstructor
-from crewai.utilities.logger import Logger
-from crewai.utilities.printer import Printer
-from crewai.utilities.prompts import Prompts
-from crewai.utilities.rpm_controller import RPMController
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from crewai.utilities.converter import Converter, ConverterError
+    from crewai.utilities.exceptions.context_window_exceeding_exception import (
+        LLMContextLengthExceededError,
+    )
+    from crewai.utilities.file_handler import FileHandler
+    from crewai.utilities.i18n import I18N
+    from crewai.utilities.internal_instructor import InternalInstructor
+    from crewai.utilities.logger import Logger
+    from crewai.utilities.printer import Printer
+    from crewai.utilities.prompts import Prompts
+    from crewai.utilities.rpm_controller import RPMController
 
 
 __all__ = [
@@ -23,3 +30,27 @@ __all__ = [
     "Prompts",
     "RPMController",
 ]
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "I18N": "crewai.utilities.i18n",
+    "Converter": "crewai.utilities.converter",
+    "ConverterError": "crewai.utilities.converter",
+    "FileHandler": "crewai.utilities.file_handler",
+    "InternalInstructor": "crewai.utilities.internal_instructor",
+    "LLMContextLengthExceededError": (
+        "crewai.utilities.exceptions.context_window_exceeding_exception"
+    ),
+    "Logger": "crewai.utilities.logger",
+    "Printer": "crewai.utilities.printer",
+    "Prompts": "crewai.utilities.prompts",
+    "RPMController": "crewai.utilities.rpm_controller",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exports on first access, so that importing one utility module
+    does not import the converter, instructor and prompt stacks."""
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Sequence
 import json
 import re
@@ -21,13 +22,18 @@ from crewai.tools import BaseTool as CrewAITool
 from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_types import ToolResult
+from crewai.utilities.context_compaction import (
+    DEFAULT_KEEP_RECENT,
+    DEFAULT_MAX_WORKERS,
+    compact_messages,
+)
 from crewai.utilities.errors import AgentRepositoryError
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededError,
 )
 from crewai.utilities.i18n import I18N
 from crewai.utilities.printer import ColoredText, Printer
-from crewai.utilities.token_counter_callback import TokenCalcHandler
+from crewai.utilities.rpm_controller import RPMController
 from crewai.utilities.types import LLMMessage
 
 
@@ -37,6 +43,7 @@ if TYPE_CHECKING:
     from crewai.lite_agent import LiteAgent
     from crewai.llm import LLM
     from crewai.task import Task
+    from crewai.utilities.token_counter_callback import TokenCalcHandler
 
 
 class SummaryContent(TypedDict):
@@ -229,6 +236,43 @@ def enforce_rpm_limit(
         request_within_rpm_limit()
 
 
+async def aenforce_rpm_limit(
+    request_within_rpm_limit: Callable[[], bool] | None = None,
+) -> None:
+    """Enforce the requests per minute (RPM) limit without blocking the event loop.
+
+    Args:
+        request_within_rpm_limit: Function to enforce RPM limit.
+    """
+    controller = _rpm_controller_of(request_within_rpm_limit)
+    if controller is not None:
+        await controller.acquire()
+    elif request_within_rpm_limit:
+        await asyncio.to_thread(request_within_rpm_limit)
+
+
+def _rpm_controller_of(
+    request_within_rpm_limit: Callable[[], bool] | None,
+) -> RPMController | None:
+    controller = getattr(request_within_rpm_limit, "__self__", None)
+    return controller if isinstance(controller, RPMController) else None
+
+
+def record_rpm_tokens(
+    request_within_rpm_limit: Callable[[], bool] | None, tokens: int
+) -> None:
+    """Debit the tokens used by an LLM call from the tokens-per-minute budget.
+
+    Args:
+        request_within_rpm_limit: Function used to enforce the RPM limit.
+        tokens: Tokens the call's responses reported, as counted by
+            ``count_call_tokens``.
+    """
+    controller = _rpm_controller_of(request_within_rpm_limit)
+    if controller is not None:
+        controller.record_tokens(tokens)
+
+
 def get_llm_response(
     llm: LLM | BaseLLM,
     messages: list[LLMMessage],
@@ -517,54 +561,59 @@ def summarize_messages(
     llm: LLM | BaseLLM,
     callbacks: list[TokenCalcHandler],
     i18n: I18N,
+    keep_recent: int = DEFAULT_KEEP_RECENT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> None:
     """Summarize messages to fit within context window.
 
+    Leading system messages and the most recent messages are kept verbatim.
+    The rest is split into token-bounded groups that are summarized
+    concurrently; summaries of groups seen before are reused from a cache.
+
     Args:
         messages: List of messages to summarize
         llm: LLM instance for summarization
         callbacks: List of callbacks for LLM
         i18n: I18N instance for messages
+        keep_recent: Number of trailing messages to keep verbatim
+        max_workers: Maximum number of concurrent summarization calls
     """
-    messages_string = " ".join([message["content"] for message in messages])  # type: ignore[misc]
-    cut_size = llm.get_context_window_size()
-
-    messages_groups = [
-        {"content": messages_string[i : i + cut_size]}
-        for i in range(0, len(messages_string), cut_size)
-    ]
-
-    summarized_contents: list[SummaryContent] = []
+    printer = Printer()
 
-    total_groups = len(messages_groups)
-    for idx, group in enumerate(messages_groups, 1):
-        Printer().print(
-            content=f"Summarizing {idx}/{total_groups}...",
-            color="yellow",
-        )
-
-        messages = [
-            format_message_for_llm(
-                i18n.slice("summarizer_system_message"), role="system"
-            ),
-            format_message_for_llm(
-                i18n.slice("summarize_instruction").format(group=group["content"]),
-            ),
-        ]
+    def summarize(group: str) -> str:
         summary = llm.call(
-            messages,
+            [
+                format_message_for_llm(
+                    i18n.slice("summarizer_system_message"), role="system"
+                ),
+                format_message_for_llm(
+                    i18n.slice("summarize_instruction").format(group=group),
+                ),
+            ],
             callbacks=callbacks,
         )
-        summarized_contents.append({"content": str(summary)})
+        return str(summary)
 
-    merged_summary = " ".join(content["content"] for content in summarized_contents)
+    def report(done: int, total: int) -> None:
+        printer.print(content=f"Summarizing {done}/{total}...", color="yellow")
+
+    system, recent, summaries = compact_messages(
+        messages,
+        llm,
+        summarize,
+        keep_recent=keep_recent,
+        max_workers=max_workers,
+        on_progress=report,
+    )
+    merged_summary = " ".join(summaries)
 
-    messages.clear()
-    messages.append(
+    messages[:] = [
+        *system,
         format_message_for_llm(
             i18n.slice("summary").format(merged_summary=merged_summary)
-        )
-    )
+        ),
+        *recent,
+    ]
 
 
 def show_agent_logs(
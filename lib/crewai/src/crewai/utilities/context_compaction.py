@@ -0,0 +1,275 @@
+"""Token-aware compaction of agent message histories."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextvars
+from functools import lru_cache
+import hashlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Final
+
+from crewai.utilities.types import LLMMessage
+
+
+if TYPE_CHECKING:
+    from tiktoken import Encoding
+
+    from crewai.llms.base_llm import BaseLLM
+
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN: Final[int] = 4
+"""Estimate used when no tokenizer is available."""
+
+GROUP_WINDOW_RATIO: Final[float] = 0.5
+"""Share of the context window one summarization request may fill."""
+
+RECENT_WINDOW_RATIO: Final[float] = 0.25
+"""Share of the context window kept verbatim from the end of the history."""
+
+DEFAULT_MAX_WORKERS: Final[int] = 4
+DEFAULT_KEEP_RECENT: Final[int] = 2
+SUMMARY_CACHE_SIZE: Final[int] = 256
+
+
+@lru_cache(maxsize=None)
+def _get_encoding() -> Encoding | None:
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.debug(f"Falling back to estimated token counts: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count the tokens in a text.
+
+    Uses the ``cl100k_base`` tokenizer, or an estimate of four characters per
+    token when it cannot be loaded.
+
+    Args:
+        text: The text to measure.
+
+    Returns:
+        The number of tokens.
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def split_by_tokens(text: str, max_tokens: int) -> list[str]:
+    """Split a text into pieces of at most ``max_tokens`` tokens.
+
+    Args:
+        text: The text to split.
+        max_tokens: Token budget of each piece.
+
+    Returns:
+        The pieces, in order.
+    """
+    max_tokens = max(1, max_tokens)
+    encoding = _get_encoding()
+    if encoding is None:
+        size = max_tokens * CHARS_PER_TOKEN
+        return [text[i : i + size] for i in range(0, len(text), size)]
+    tokens = encoding.encode(text, disallowed_special=())
+    return [
+        encoding.decode(tokens[i : i + max_tokens])
+        for i in range(0, len(tokens), max_tokens)
+    ]
+
+
+def message_text(message: LLMMessage) -> str:
+    """Return the text of a message, flattening multimodal content."""
+    content = message.get("content")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            str(part.get("text", "")) for part in content if isinstance(part, dict)
+        )
+    return "" if content is None else str(content)
+
+
+def group_messages(messages: list[LLMMessage], max_tokens: int) -> list[str]:
+    """Pack consecutive messages into texts of at most ``max_tokens`` tokens.
+
+    Groups break on message boundaries, so a history that only grew at the end
+    yields the same leading groups as before. Messages larger than the budget
+    are split on token boundaries.
+
+    Args:
+        messages: The messages to pack.
+        max_tokens: Token budget of each group.
+
+    Returns:
+        The group texts, in order.
+    """
+    groups: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    for message in messages:
+        text = message_text(message)
+        if not text:
+            continue
+        tokens = count_tokens(text)
+        if current and current_tokens + tokens > max_tokens:
+            groups.append(" ".join(current))
+            current, current_tokens = [], 0
+        if tokens > max_tokens:
+            groups.extend(split_by_tokens(text, max_tokens))
+            continue
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        groups.append(" ".join(current))
+    return groups
+
+
+class SummaryCache:
+    """Bounded, thread-safe LRU cache of group summaries.
+
+    Keys combine the model and a hash of the group text, so a prefix that was
+    already summarized is not sent to the LLM again on the next overflow.
+    """
+
+    def __init__(self, maxsize: int = SUMMARY_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of summaries kept.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        """Return the cache key of a group summarized by a model."""
+        return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return a cached summary, marking it as recently used."""
+        with self._lock:
+            summary = self._entries.get(key)
+            if summary is not None:
+                self._entries.move_to_end(key)
+            return summary
+
+    def set(self, key: str, summary: str) -> None:
+        """Store a summary, evicting the least recently used one when full."""
+        with self._lock:
+            self._entries[key] = summary
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached summary."""
+        with self._lock:
+            self._entries.clear()
+
+
+summary_cache = SummaryCache()
+
+
+def _split_history(
+    messages: list[LLMMessage], keep_recent: int, recent_budget: int
+) -> tuple[list[LLMMessage], list[LLMMessage], list[LLMMessage]]:
+    """Split messages into leading system messages, older and recent messages."""
+    start = 0
+    while start < len(messages) and messages[start].get("role") == "system":
+        start += 1
+    system, rest = messages[:start], messages[start:]
+
+    split = len(rest)
+    used = 0
+    while split > 0 and len(rest) - split < keep_recent:
+        tokens = count_tokens(message_text(rest[split - 1]))
+        if used + tokens > recent_budget:
+            break
+        used += tokens
+        split -= 1
+    # Tool results must stay next to the assistant message that requested them.
+    while split < len(rest) and str(rest[split].get("role")) == "tool":
+        split += 1
+    if split == 0:
+        # Nothing left to summarize otherwise, so the overflow would repeat.
+        split = len(rest)
+    return system, rest[:split], rest[split:]
+
+
+def compact_messages(
+    messages: list[LLMMessage],
+    llm: BaseLLM,
+    summarize: Callable[[str], str],
+    keep_recent: int = DEFAULT_KEEP_RECENT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_progress: Callable[[int, int], None] | None = None,
+    cache: SummaryCache | None = summary_cache,
+) -> tuple[list[LLMMessage], list[LLMMessage], list[str]]:
+    """Summarize the older part of a history concurrently.
+
+    Leading system messages and up to ``keep_recent`` trailing messages are kept
+    verbatim. The remaining messages are packed into token-bounded groups which
+    are summarized on a thread pool of ``max_workers`` threads; summaries found
+    in ``cache`` are reused.
+
+    Args:
+        messages: The history to compact.
+        llm: The LLM whose context window bounds the groups.
+        summarize: Summarizes one group text.
+        keep_recent: Number of trailing messages to keep verbatim.
+        max_workers: Maximum number of concurrent summarization calls.
+        on_progress: Called with the number of finished and total groups.
+        cache: Summary cache, or None to disable caching.
+
+    Returns:
+        The system messages, the recent messages and the group summaries in
+        history order.
+    """
+    window = llm.get_context_window_size()
+    system, older, recent = _split_history(
+        messages, keep_recent, int(window * RECENT_WINDOW_RATIO)
+    )
+    groups = group_messages(older, max(1, int(window * GROUP_WINDOW_RATIO)))
+    model = str(getattr(llm, "model", ""))
+    keys = [SummaryCache.key(model, group) for group in groups]
+
+    summaries: list[str | None] = [
+        cache.get(key) if cache is not None else None for key in keys
+    ]
+    pending = [idx for idx, summary in enumerate(summaries) if summary is None]
+    total, done = len(groups), len(groups) - len(pending)
+
+    def run(idx: int) -> tuple[int, str]:
+        return idx, summarize(groups[idx])
+
+    if pending:
+        workers = max(1, min(max_workers, len(pending)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="crewai-summarize"
+        ) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, run, idx)
+                for idx in pending
+            ]
+            for future in as_completed(futures):
+                idx, summary = future.result()
+                summaries[idx] = summary
+                if cache is not None:
+                    cache.set(keys[idx], summary)
+                done += 1
+                if on_progress is not None:
+                    on_progress(done, total)
+
+    return system, recent, [summary or "" for summary in summaries]
@@ -1,12 +1,23 @@
+import atexit
 from datetime import datetime
 import json
+import logging
 import os
 import pickle
-from typing import Any, TypedDict
+import textwrap
+import threading
+import time
+from typing import IO, Any, TypedDict
 
 from typing_extensions import Unpack
 
 
+logger = logging.getLogger(__name__)
+
+# Bytes read from each end of a ``.json`` log to find where to append.
+_JSON_TAIL_BYTES = 4096
+
+
 class LogEntry(TypedDict, total=False):
     """TypedDict for log entry kwargs with optional fields for flexibility."""
 
@@ -26,8 +37,255 @@ class LogEntry(TypedDict, total=False):
     metadata: dict[str, Any]
 
 
+class JSONLLogWriter:
+    """Append-only JSON Lines log with buffered background writes.
+
+    ``write`` only serializes the entry and queues it; a daemon thread appends
+    queued lines every ``flush_interval`` seconds, or sooner once
+    ``max_buffer`` lines are waiting, so logging stays off the caller's
+    critical path. The file is fsynced at most every ``fsync_interval``
+    seconds and on ``flush``. Once it grows past ``max_bytes`` it is rotated
+    like ``logging.handlers.RotatingFileHandler``: ``log.jsonl`` becomes
+    ``log.jsonl.1``, ``log.jsonl.1`` becomes ``log.jsonl.2``, and so on up to
+    ``backup_count`` files.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = 1.0,
+        fsync_interval: float = 5.0,
+        max_bytes: int | None = None,
+        backup_count: int = 5,
+        max_buffer: int = 1000,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            path: Path to the ``.jsonl`` file.
+            flush_interval: Seconds queued lines may wait before being written.
+            fsync_interval: Minimum seconds between fsyncs of the file.
+            max_bytes: Size after which the file is rotated; None disables rotation.
+            backup_count: Number of rotated files to keep.
+            max_buffer: Number of queued lines that triggers an early write.
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_buffer = max_buffer
+        self._buffer: list[str] = []
+        self._cond = threading.Condition()
+        # Held while a batch is taken from the buffer and written, so batches
+        # reach the file in the order they were queued.
+        self._file_lock = threading.Lock()
+        self._file: IO[str] | None = None
+        self._size = 0
+        self._last_fsync = time.monotonic()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+
+    def write(self, entry: dict[str, Any]) -> None:
+        """Queue one entry.
+
+        Args:
+            entry: JSON-serializable mapping; other values are stored as strings.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot write log entry: writer is closed")
+            self._buffer.append(line)
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_writer, name="crewai-log-writer", daemon=True
+                )
+                self._worker.start()
+                atexit.register(self.close)
+            if len(self._buffer) >= self.max_buffer:
+                self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Write every queued line and fsync the file."""
+        self._drain(fsync=True)
+
+    def close(self) -> None:
+        """Flush queued lines, stop the background thread and close the file."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+            self._cond.notify_all()
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+        self._drain(fsync=True)
+        with self._file_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._cond:
+                if not self._closed and len(self._buffer) < self.max_buffer:
+                    self._cond.wait(self.flush_interval)
+                closed = self._closed
+            try:
+                self._drain(fsync=False)
+            except OSError as e:
+                logger.error(f"Failed to write log file {self.path}: {e}")
+            if closed:
+                return
+
+    def _drain(self, fsync: bool) -> None:
+        with self._file_lock:
+            with self._cond:
+                lines, self._buffer = self._buffer, []
+            if not lines:
+                if fsync and self._file is not None:
+                    self._fsync()
+                return
+            data = "".join(lines)
+            if self._file is None:
+                self._open()
+            elif self.max_bytes is not None and self._size > 0:
+                if self._size + len(data.encode()) > self.max_bytes:
+                    self._rotate()
+            file = self._file
+            if file is None:
+                return
+            file.write(data)
+            file.flush()
+            self._size += len(data.encode())
+            if fsync or time.monotonic() - self._last_fsync >= self.fsync_interval:
+                self._fsync()
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+
+    def _fsync(self) -> None:
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+        self._last_fsync = time.monotonic()
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._fsync()
+            self._file.close()
+            self._file = None
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+
+def read_jsonl_log(path: str, include_rotated: bool = True) -> list[dict[str, Any]]:
+    """Read the entries of a JSON Lines log, oldest first.
+
+    A truncated last line, left behind by a crash in the middle of a write,
+    is skipped.
+
+    Args:
+        path: Path to the ``.jsonl`` file.
+        include_rotated: Also read ``path.1``, ``path.2``, ... left by rotation.
+
+    Returns:
+        The logged entries.
+    """
+    paths = []
+    if include_rotated:
+        index = 1
+        while os.path.exists(f"{path}.{index}"):
+            paths.append(f"{path}.{index}")
+            index += 1
+        paths.reverse()
+    if os.path.exists(path):
+        paths.append(path)
+
+    entries: list[dict[str, Any]] = []
+    for log_path in paths:
+        with open(log_path, encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed log line in {log_path}")
+    return entries
+
+
+def export_json_log(jsonl_path: str, json_path: str) -> None:
+    """Export a JSON Lines log to the JSON array format of ``.json`` log files.
+
+    Args:
+        jsonl_path: Path to the ``.jsonl`` file, including rotated files.
+        json_path: Path of the JSON file to write.
+    """
+    with open(json_path, "w", encoding="utf-8") as file:
+        json.dump(read_jsonl_log(jsonl_path), file, indent=4)
+        file.write("\n")
+
+
+def _append_to_json_array(path: str, entry: dict[str, Any]) -> None:
+    """Append an entry to a JSON array file without rewriting earlier entries.
+
+    Produces the same bytes as ``json.dump(entries, indent=4)`` followed by a
+    newline, which is how ``.json`` logs have always been written, but only
+    rewrites the closing bracket. Files whose end cannot be recognized fall
+    back to reading and rewriting the whole array.
+    """
+    block = textwrap.indent(json.dumps(entry, indent=4), " " * 4)
+    try:
+        with open(path, "r+b") as file:
+            head = file.read(_JSON_TAIL_BYTES).lstrip()
+            end = file.seek(0, os.SEEK_END)
+            start = max(0, end - _JSON_TAIL_BYTES)
+            file.seek(start)
+            stripped = file.read().rstrip()
+            inner = stripped[:-1].rstrip()
+            if head.startswith(b"[") and stripped.endswith(b"]") and inner:
+                separator = "" if inner.endswith(b"[") else ","
+                file.seek(start + len(inner))
+                file.write(f"{separator}\n{block}\n]\n".encode())
+                file.truncate()
+                return
+    except FileNotFoundError:
+        with open(path, "w", encoding="utf-8") as new_file:
+            new_file.write(f"[\n{block}\n]\n")
+        return
+
+    try:
+        with open(path, encoding="utf-8") as read_file:
+            entries = json.load(read_file)
+        entries.append(entry)
+    except json.JSONDecodeError:
+        # If no valid JSON, start with an empty list
+        entries = [entry]
+    with open(path, "w", encoding="utf-8") as write_file:
+        json.dump(entries, write_file, indent=4)
+        write_file.write("\n")
+
+
 class FileHandler:
-    """Handler for file operations supporting both JSON and text-based logging.
+    """Handler for file operations supporting JSON, JSON Lines and text logging.
+
+    ``.jsonl`` paths are written by a ``JSONLLogWriter``; ``.json`` paths keep
+    their JSON array format and are appended to in place.
 
     Attributes:
         _path: The path to the log file.
@@ -38,7 +296,10 @@ class FileHandler:
         Args:
             file_path: Path to the log file or boolean flag.
         """
+        self._writer: JSONLLogWriter | None = None
         self._initialize_path(file_path)
+        if self._path.endswith(".jsonl"):
+            self._writer = JSONLLogWriter(self._path)
 
     def _initialize_path(self, file_path: bool | str) -> None:
         """Initialize the file path based on the input type.
@@ -53,14 +314,12 @@ class FileHandler:
             self._path = os.path.join(os.curdir, "logs.txt")
 
         elif isinstance(file_path, str):  # File path is a string
-            if file_path.endswith((".json", ".txt")):
-                self._path = (
-                    file_path  # No modification if the file ends with .json or .txt
-                )
+            if file_path.endswith((".json", ".jsonl", ".txt")):
+                self._path = file_path  # No modification for known extensions
             else:
                 self._path = (
                     file_path + ".txt"
-                )  # Append .txt if the file doesn't end with .json or .txt
+                )  # Append .txt if the file doesn't end with .json, .jsonl or .txt
 
         else:
             raise ValueError(
@@ -93,20 +352,11 @@ class FileHandler:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_entry = {"timestamp": now, **kwargs}
 
-            if self._path.endswith(".json"):
-                # Append log in JSON format
-                try:
-                    # Try reading existing content to avoid overwriting
-                    with open(self._path, encoding="utf-8") as read_file:
-                        existing_data = json.load(read_file)
-                        existing_data.append(log_entry)
-                except (json.JSONDecodeError, FileNotFoundError):
-                    # If no valid JSON or file doesn't exist, start with an empty list
-                    existing_data = [log_entry]
-
-                with open(self._path, "w", encoding="utf-8") as write_file:
-                    json.dump(existing_data, write_file, indent=4)
-                    write_file.write("\n")
+            if self._writer is not None:
+                self._writer.write(log_entry)
+
+            elif self._path.endswith(".json"):
+                _append_to_json_array(self._path, log_entry)
 
             else:
                 # Append log in plain text format
@@ -121,6 +371,16 @@ class FileHandler:
         except Exception as e:
             raise ValueError(f"Failed to log message: {e!s}") from e
 
+    def flush(self) -> None:
+        """Write buffered JSON Lines entries to disk; other formats are unbuffered."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Flush and stop the JSON Lines writer, if any."""
+        if self._writer is not None:
+            self._writer.close()
+
 
 class PickleHandler:
     """Handler for saving and loading data using pickle.
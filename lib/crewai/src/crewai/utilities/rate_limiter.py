@@ -0,0 +1,229 @@
+"""Token-bucket rate limiting shared across agents, crews and processes."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import threading
+import time
+
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import get_sqlite_pool
+
+
+logger = logging.getLogger(__name__)
+
+
+def _refill(
+    tokens: float, updated_at: float, now: float, capacity: float, rate: float
+) -> float:
+    """Return the bucket balance after refilling for the elapsed time."""
+    return min(capacity, tokens + max(0.0, now - updated_at) * rate)
+
+
+class RateLimitBackend(ABC):
+    """Stores token bucket balances.
+
+    Buckets use reservation semantics: a request always takes its tokens
+    immediately, possibly driving the balance negative, and is told how long
+    to wait until the balance it borrowed has been refilled. Waiting therefore
+    happens outside any lock, and concurrent callers queue up in order.
+    """
+
+    @abstractmethod
+    def reserve(self, key: str, amount: float, capacity: float, rate: float) -> float:
+        """Take ``amount`` tokens from a bucket.
+
+        Args:
+            key: Bucket identifier.
+            amount: Tokens to take; 0 only reports the wait for a negative balance.
+            capacity: Maximum balance, which is also the initial balance.
+            rate: Tokens refilled per second.
+
+        Returns:
+            Seconds the caller must wait before proceeding.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Thread-safe bucket storage for a single process."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, amount: float, capacity: float, rate: float) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = _refill(tokens, updated_at, now, capacity, rate) - amount
+            self._buckets[key] = (tokens, now)
+        return -tokens / rate if tokens < 0 else 0.0
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Bucket storage in SQLite, shared by every process using the same file.
+
+    Each reservation runs in an ``IMMEDIATE`` transaction so concurrent
+    workers serialize on the bucket row. Wall-clock time is used because
+    monotonic clocks are not comparable across processes.
+    """
+
+    def __init__(self, db_path: str | None = None) -> None:
+        """Initialize the SQLite rate limit backend.
+
+        Args:
+            db_path: Optional path to the database file.
+        """
+        if db_path is None:
+            db_path = str(Path(db_storage_path()) / "rate_limits.db")
+        self.db_path = db_path
+        self._pool = get_sqlite_pool(self.db_path)
+        with self._pool.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                    key TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+
+    def reserve(self, key: str, amount: float, capacity: float, rate: float) -> float:
+        now = time.time()
+        with self._pool.transaction(immediate=True) as conn:
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?",
+                (key,),
+            ).fetchone()
+            tokens, updated_at = row if row else (capacity, now)
+            tokens = _refill(tokens, updated_at, now, capacity, rate) - amount
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated_at) "
+                "VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+        return -tokens / rate if tokens < 0 else 0.0
+
+
+@dataclass
+class RateLimitStats:
+    """Counters describing how much a limiter has throttled its callers."""
+
+    requests: int = 0
+    tokens: int = 0
+    waits: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budget for one key.
+
+    The request budget is reserved before each call. The token budget can only
+    be settled after a response reports its usage, so ``record_tokens`` debits
+    it afterwards and the next ``reserve`` waits until the debt is refilled.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        max_rpm: int | None = None,
+        max_tpm: int | None = None,
+        backend: RateLimitBackend | None = None,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            key: Bucket identifier, e.g. ``"openai/gpt-4o"``.
+            max_rpm: Maximum requests per minute, or None for no request limit.
+            max_tpm: Maximum tokens per minute, or None for no token limit.
+            backend: Bucket storage; defaults to a private in-memory backend.
+        """
+        self.key = key
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.stats = RateLimitStats()
+        self._stats_lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve one request.
+
+        Returns:
+            Seconds the caller must wait before sending it.
+        """
+        wait = 0.0
+        if self.max_rpm:
+            wait = self.backend.reserve(
+                f"{self.key}:rpm", 1, self.max_rpm, self.max_rpm / 60
+            )
+        if self.max_tpm:
+            wait = max(
+                wait,
+                self.backend.reserve(
+                    f"{self.key}:tpm", 0, self.max_tpm, self.max_tpm / 60
+                ),
+            )
+        with self._stats_lock:
+            self.stats.requests += 1
+            if wait > 0:
+                self.stats.waits += 1
+                self.stats.total_wait_seconds += wait
+                self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, wait)
+        return wait
+
+    def record_tokens(self, tokens: int) -> None:
+        """Debit tokens consumed by a completed request from the token budget."""
+        if tokens <= 0:
+            return
+        with self._stats_lock:
+            self.stats.tokens += tokens
+        if self.max_tpm:
+            self.backend.reserve(
+                f"{self.key}:tpm", tokens, self.max_tpm, self.max_tpm / 60
+            )
+
+
+_shared_limiters: dict[str, RateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(
+    key: str,
+    max_rpm: int | None = None,
+    max_tpm: int | None = None,
+    backend: RateLimitBackend | None = None,
+) -> RateLimiter:
+    """Return the process-wide limiter for ``key``, creating it on first use.
+
+    Every crew and agent that asks for the same key, typically
+    ``"<provider>/<model>"``, draws from the same budget. The budget of the
+    first caller wins; later callers with different limits reuse it as is.
+
+    Args:
+        key: Bucket identifier.
+        max_rpm: Maximum requests per minute.
+        max_tpm: Maximum tokens per minute.
+        backend: Optional shared storage, e.g. ``SQLiteRateLimitBackend`` for
+            budgets shared between worker processes.
+
+    Returns:
+        The shared rate limiter.
+    """
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                key, max_rpm=max_rpm, max_tpm=max_tpm, backend=backend
+            )
+            _shared_limiters[key] = limiter
+        elif (limiter.max_rpm, limiter.max_tpm) != (max_rpm, max_tpm):
+            logger.debug(
+                f"Rate limiter '{key}' already exists with rpm={limiter.max_rpm}, "
+                f"tpm={limiter.max_tpm}; ignoring rpm={max_rpm}, tpm={max_tpm}"
+            )
+        return limiter
@@ -1,89 +1,142 @@
 """Controls request rate limiting for API calls."""
 
-import threading
+import asyncio
 import time
+from typing import Any
+import uuid
 
-from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 from typing_extensions import Self
 
 from crewai.utilities.logger import Logger
+from crewai.utilities.rate_limiter import (
+    RateLimitBackend,
+    RateLimiter,
+    get_shared_rate_limiter,
+)
 
 
 class RPMController(BaseModel):
-    """Manages requests per minute limiting."""
+    """Manages requests per minute and tokens per minute limiting.
+
+    Budgets are token buckets: up to ``max_rpm`` requests may burst at once,
+    after which requests are spaced evenly over the minute. Waiting happens
+    without holding any lock, so other agents sharing the controller keep
+    reserving their own slots, and ``acquire`` waits without blocking the
+    event loop.
+
+    Controllers created with the same ``scope`` (for example
+    ``"openai/gpt-4o"``) share one budget across every crew in the process;
+    pass a ``backend`` such as ``SQLiteRateLimitBackend`` to share it across
+    processes as well.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     max_rpm: int | None = Field(
         default=None,
         description="Maximum requests per minute. If None, no limit is applied.",
     )
+    max_tpm: int | None = Field(
+        default=None,
+        description="Maximum tokens per minute. If None, no token limit is applied.",
+    )
+    scope: str | None = Field(
+        default=None,
+        description="Key of a process-wide budget to share, e.g. '<provider>/<model>'.",
+    )
+    backend: RateLimitBackend | None = Field(
+        default=None,
+        description="Storage for the budget; defaults to in-memory.",
+    )
     logger: Logger = Field(default_factory=lambda: Logger(verbose=False))
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: "threading.Timer | None" = PrivateAttr(default=None)
-    _lock: "threading.Lock | None" = PrivateAttr(default=None)
-    _shutdown_flag: bool = PrivateAttr(default=False)
+    _limiter: RateLimiter | None = PrivateAttr(default=None)
 
     @model_validator(mode="after")
     def reset_counter(self) -> Self:
-        """Resets the RPM counter and starts the timer if max_rpm is set.
+        """Creates the rate limiter if a budget is set.
 
         Returns:
             The instance of the RPMController.
         """
-        if self.max_rpm is not None:
-            if not self._shutdown_flag:
-                self._lock = threading.Lock()
-                self._reset_request_count()
+        if self.max_rpm is not None or self.max_tpm is not None:
+            if self.scope is not None:
+                self._limiter = get_shared_rate_limiter(
+                    self.scope,
+                    max_rpm=self.max_rpm,
+                    max_tpm=self.max_tpm,
+                    backend=self.backend,
+                )
+            else:
+                self._limiter = RateLimiter(
+                    f"rpm-controller-{uuid.uuid4()}",
+                    max_rpm=self.max_rpm,
+                    max_tpm=self.max_tpm,
+                    backend=self.backend,
+                )
         return self
 
+    def _reserve(self) -> float:
+        if self._limiter is None:
+            return 0.0
+        wait = self._limiter.reserve()
+        if wait > 0:
+            self.logger.log(
+                "info",
+                f"Rate limit reached, waiting {wait:.1f}s for the budget to refill.",
+            )
+        return wait
+
     def check_or_wait(self) -> bool:
-        """Checks if a new request can be made based on the RPM limit.
+        """Waits until a new request fits in the budget.
 
         Returns:
-            True if a new request can be made, False otherwise.
+            True once the request can be made.
         """
-        if self.max_rpm is None:
-            return True
-
-        def _check_and_increment() -> bool:
-            if self.max_rpm is not None and self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
-                return True
-            if self.max_rpm is not None:
-                self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
-                )
-                self._wait_for_next_minute()
-                self._current_rpm = 1
-                return True
-            return True
+        wait = self._reserve()
+        if wait > 0:
+            self._wait_for_next_minute(wait)
+        return True
+
+    async def acquire(self) -> bool:
+        """Waits until a new request fits in the budget without blocking the event loop.
+
+        Returns:
+            True once the request can be made.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def record_tokens(self, tokens: int) -> None:
+        """Debits tokens used by a completed request from the token budget.
 
-        if self._lock:
-            with self._lock:
-                return _check_and_increment()
-        else:
-            return _check_and_increment()
+        Args:
+            tokens: Total tokens reported by the LLM for the request.
+        """
+        if self._limiter is not None:
+            self._limiter.record_tokens(tokens)
+
+    def stats(self) -> dict[str, Any]:
+        """Returns request, token and wait-time counters.
+
+        Returns:
+            Dictionary of counters; empty when no budget is set.
+        """
+        if self._limiter is None:
+            return {}
+        stats = self._limiter.stats
+        return {
+            "requests": stats.requests,
+            "tokens": stats.tokens,
+            "waits": stats.waits,
+            "total_wait_seconds": stats.total_wait_seconds,
+            "max_wait_seconds": stats.max_wait_seconds,
+        }
 
     def stop_rpm_counter(self) -> None:
-        """Stops the RPM counter and cancels any active timers."""
-        self._shutdown_flag = True
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-
-    def _wait_for_next_minute(self) -> None:
-        time.sleep(60)
-        self._current_rpm = 0
-
-    def _reset_request_count(self) -> None:
-        def _reset():
-            self._current_rpm = 0
-            if not self._shutdown_flag:
-                self._timer = threading.Timer(60.0, self._reset_request_count)
-                self._timer.daemon = True
-                self._timer.start()
-
-        if self._lock:
-            with self._lock:
-                _reset()
-        else:
-            _reset()
+        """Kept for compatibility; buckets refill lazily, so there is no timer to stop."""
+
+    def _wait_for_next_minute(self, wait: float = 60.0) -> None:
+        time.sleep(wait)
@@ -0,0 +1,127 @@
+"""Pooled SQLite connections for crewAI's local storage."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Final, TypeVar
+
+
+T = TypeVar("T")
+
+_PRAGMAS: Final[tuple[str, ...]] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+class SQLitePool:
+    """Per-thread connections to one SQLite database file.
+
+    Each thread reuses a single connection opened in WAL mode, so readers do
+    not block the writer and no file is reopened per query. Connections run in
+    autocommit mode; group statements with ``transaction``. Async callers go
+    through ``arun``, which executes on the default thread pool and therefore
+    reuses those threads' connections instead of opening one per call.
+    """
+
+    def __init__(self, db_path: str, timeout: float = 30.0) -> None:
+        """Initialize the pool.
+
+        Args:
+            db_path: Path to the database file.
+            timeout: Seconds to wait for a lock held by another connection.
+        """
+        self.db_path = db_path
+        self.timeout = timeout
+        self._local = threading.local()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        # A connection inherited through fork must not be used by the child.
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.db_path, timeout=self.timeout, isolation_level=None
+            )
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements in one transaction.
+
+        Nested uses join the outer transaction.
+
+        Args:
+            immediate: Take the write lock up front, for read-modify-write
+                sequences that must not interleave with other writers.
+
+        Yields:
+            The calling thread's connection.
+        """
+        conn = self.connection()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        try:
+            conn.execute("COMMIT")
+        except BaseException:
+            # A failed COMMIT, e.g. on a deferred constraint or SQLITE_BUSY,
+            # can leave the transaction open on this thread's connection.
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def run(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Call ``fn`` with the calling thread's connection inside a transaction."""
+        with self.transaction() as conn:
+            return fn(conn)
+
+    async def arun(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Call ``fn`` inside a transaction without blocking the event loop."""
+        return await asyncio.to_thread(self.run, fn)
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_pools: dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_sqlite_pool(db_path: str) -> SQLitePool:
+    """Return the process-wide pool for a database file.
+
+    Args:
+        db_path: Path to the database file.
+
+    Returns:
+        The pool shared by every storage using that file.
+    """
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SQLitePool(db_path)
+        return pool
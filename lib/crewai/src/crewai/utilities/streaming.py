@@ -137,11 +137,7 @@ def _unregister_handler(handler: Callable[[Any, BaseEvent], None]) -> None:
     Args:
         handler: The handler function to unregister.
     """
-    with crewai_event_bus._rwlock.w_locked():
-        handlers: frozenset[Callable[[Any, BaseEvent], None]] = (
-            crewai_event_bus._sync_handlers.get(LLMStreamChunkEvent, frozenset())
-        )
-        crewai_event_bus._sync_handlers[LLMStreamChunkEvent] = handlers - {handler}
+    crewai_event_bus.unregister_handler(LLMStreamChunkEvent, handler)
 
 
 def _finalize_streaming(
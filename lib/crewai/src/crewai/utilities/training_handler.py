@@ -1,10 +1,116 @@
+import json
 import os
-from typing import Any
+import threading
+from typing import Any, NamedTuple
 
 from crewai.utilities.file_handler import PickleHandler
 
 
+class _CachedTrainingData(NamedTuple):
+    mtime_ns: int
+    size: int
+    data: Any
+
+
+# Process-wide, keyed by absolute file path. Entries are revalidated against
+# the file's mtime and size on every load, so edits by other processes (for
+# example a ``crewai train`` run) are picked up on the next task.
+_training_data_cache: dict[str, _CachedTrainingData] = {}
+_training_data_cache_lock = threading.Lock()
+
+
+def clear_training_data_cache() -> None:
+    """Drop every cached training file so the next load reads from disk."""
+    with _training_data_cache_lock:
+        _training_data_cache.clear()
+
+
+def _remember(file_path: str, stat: os.stat_result, data: Any) -> None:
+    with _training_data_cache_lock:
+        _training_data_cache[file_path] = _CachedTrainingData(
+            stat.st_mtime_ns, stat.st_size, data
+        )
+
+
 class CrewTrainingHandler(PickleHandler):
+    """Handler for training data files shared by every crew in the process.
+
+    Loaded data is cached per file and only deserialized again when the file
+    changes on disk, so agents can consult it on every task cheaply. Data
+    returned by ``load`` is shared and must be treated as read-only; copy it
+    before modifying.
+
+    Files ending in ``.json`` are stored as JSON instead of pickle. When a
+    ``.pkl`` file does not exist, a ``.json`` file with the same name is read
+    instead, so trained agents can be shipped without unpickling. JSON turns
+    integer keys, such as training iterations, into strings.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """Initialize the handler.
+
+        Args:
+            file_name: The name of the file for saving and loading data.
+        """
+        if file_name.endswith(".json"):
+            self.file_path = os.path.join(os.getcwd(), file_name)
+        else:
+            super().__init__(file_name)
+
+    @property
+    def is_json(self) -> bool:
+        """Whether the file is stored as JSON rather than pickle."""
+        return self.file_path.endswith(".json")
+
+    def save(self, data: Any) -> None:
+        """Save the data to the file and refresh the cached copy.
+
+        Args:
+            data: The data to be saved to the file.
+        """
+        if self.is_json:
+            with open(self.file_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        else:
+            super().save(data)
+        _remember(self.file_path, os.stat(self.file_path), data)
+
+    def load(self) -> Any:
+        """Load the data from the file, reusing the cached copy if unchanged.
+
+        Returns:
+            The data loaded from the file, or an empty dictionary if neither
+            the file nor its ``.json`` counterpart exists.
+        """
+        file_path = self.file_path
+        if not os.path.exists(file_path) and not self.is_json:
+            json_path = os.path.splitext(file_path)[0] + ".json"
+            if os.path.exists(json_path):
+                file_path = json_path
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return {}
+        if stat.st_size == 0:
+            return {}
+
+        with _training_data_cache_lock:
+            cached = _training_data_cache.get(file_path)
+        if (
+            cached is not None
+            and cached.mtime_ns == stat.st_mtime_ns
+            and cached.size == stat.st_size
+        ):
+            return cached.data
+
+        if file_path.endswith(".json"):
+            with open(file_path, encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            data = super().load()
+        _remember(file_path, stat, data)
+        return data
+
     def save_trained_data(self, agent_id: str, trained_data: dict[str, Any]) -> None:
         """Save the trained data for a specific agent.
 
@@ -12,7 +118,7 @@ class CrewTrainingHandler(PickleHandler):
             agent_id: The ID of the agent.
             trained_data: The trained data to be saved.
         """
-        data = self.load()
+        data = dict(self.load())
         data[agent_id] = trained_data
         self.save(data)
 
@@ -24,10 +130,8 @@ class CrewTrainingHandler(PickleHandler):
             agent_id: The ID of the agent.
             new_data: The new training data to append.
         """
-        data = self.load()
-        if agent_id not in data:
-            data[agent_id] = {}
-        data[agent_id][train_iteration] = new_data
+        data = dict(self.load())
+        data[agent_id] = {**data.get(agent_id, {}), train_iteration: new_data}
         self.save(data)
 
     def clear(self) -> None:
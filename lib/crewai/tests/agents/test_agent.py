@@ -695,7 +695,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         )
         assert "42" in output or "final answer" in output.lower()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Rate limit reached, waiting" in captured.out
         moveon.assert_called()
 
 
@@ -733,7 +733,7 @@ def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." not in captured.out
+        assert "Rate limit reached, waiting" not in captured.out
         moveon.assert_not_called()
 
 
@@ -0,0 +1,187 @@
+from datetime import timedelta
+import time
+from unittest.mock import patch
+
+import pytest
+
+from crewai.agents.cache import CacheBackend, CacheHandler, SQLiteCacheBackend
+from crewai.tools import BaseTool
+from crewai.tools.tool_calling import ToolCalling
+from crewai.tools.tool_usage import ToolUsage
+
+
+def test_read_returns_added_output():
+    cache = CacheHandler()
+    cache.add(tool="search", input='{"query": "ai"}', output="result")
+
+    assert cache.read(tool="search", input='{"query": "ai"}') == "result"
+    assert cache.read(tool="search", input='{"query": "ml"}') is None
+    assert cache.read(tool="other", input='{"query": "ai"}') is None
+
+
+def test_argument_order_does_not_cause_misses():
+    cache = CacheHandler()
+    cache.add(tool="multiply", input='{"b": 2, "a": 1}', output=2)
+
+    assert cache.read(tool="multiply", input='{"a": 1, "b": 2}') == 2
+    assert cache.read(tool="multiply", input='{"a":1,"b":2}') == 2
+
+
+def test_non_json_input_is_used_verbatim():
+    cache = CacheHandler()
+    cache.add(tool="echo", input="plain text", output="plain text")
+
+    assert cache.read(tool="echo", input="plain text") == "plain text"
+    assert cache._cache == {"echo-plain text": "plain text"}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = CacheHandler(max_size=2)
+    cache.add(tool="t", input="a", output=1)
+    cache.add(tool="t", input="b", output=2)
+    cache.read(tool="t", input="a")
+    cache.add(tool="t", input="c", output=3)
+
+    assert cache.read(tool="t", input="a") == 1
+    assert cache.read(tool="t", input="b") is None
+    assert cache.read(tool="t", input="c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_unbounded_cache_never_evicts():
+    cache = CacheHandler(max_size=None)
+    for i in range(2000):
+        cache.add(tool="t", input=str(i), output=i)
+
+    assert cache.stats()["size"] == 2000
+
+
+def test_entries_expire_after_ttl():
+    cache = CacheHandler(ttl=10)
+    now = time.time()
+    with patch("crewai.agents.cache.cache_handler.time.time", return_value=now):
+        cache.add(tool="t", input="a", output=1)
+    with patch("crewai.agents.cache.cache_handler.time.time", return_value=now + 5):
+        assert cache.read(tool="t", input="a") == 1
+    with patch("crewai.agents.cache.cache_handler.time.time", return_value=now + 11):
+        assert cache.read(tool="t", input="a") is None
+
+
+def test_ttl_precedence():
+    cache = CacheHandler(ttl=100, tool_ttls={"fast": 1})
+    now = time.time()
+    with patch("crewai.agents.cache.cache_handler.time.time", return_value=now):
+        cache.add(tool="fast", input="a", output=1)
+        cache.add(tool="fast", input="b", output=2, ttl=50)
+        cache.add(tool="slow", input="a", output=3)
+    with patch("crewai.agents.cache.cache_handler.time.time", return_value=now + 10):
+        assert cache.read(tool="fast", input="a") is None
+        assert cache.read(tool="fast", input="b") == 2
+        assert cache.read(tool="slow", input="a") == 3
+
+
+def test_zero_ttl_is_not_cached():
+    cache = CacheHandler()
+    cache.add(tool="t", input="a", output=1, ttl=0)
+
+    assert cache.read(tool="t", input="a") is None
+
+
+def test_stats_counts_hits_and_misses():
+    cache = CacheHandler()
+    cache.add(tool="t", input="a", output=1)
+    cache.read(tool="t", input="a")
+    cache.read(tool="t", input="a")
+    cache.read(tool="t", input="b")
+
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "size": 1}
+
+
+def test_sqlite_backend_is_shared_between_handlers(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    writer = CacheHandler(backend=SQLiteCacheBackend(db_path=db_path))
+    writer.add(tool="search", input='{"q": "ai", "n": 3}', output={"hits": ["a"]})
+
+    reader = CacheHandler(backend=SQLiteCacheBackend(db_path=db_path))
+
+    assert reader.read(tool="search", input='{"n": 3, "q": "ai"}') == {"hits": ["a"]}
+    assert reader.stats()["hits"] == 1
+
+
+def test_sqlite_backend_skips_expired_and_unserializable(tmp_path):
+    backend = SQLiteCacheBackend(db_path=str(tmp_path / "tool_cache.db"))
+    backend.set("expired", "value", time.time() - 1)
+    backend.set("object", object(), None)
+
+    assert backend.get("expired") is None
+    assert backend.get("object") is None
+
+
+def test_sqlite_backend_prune_keeps_newest_entries(tmp_path):
+    backend = SQLiteCacheBackend(db_path=str(tmp_path / "tool_cache.db"), max_entries=2)
+    for key in ("a", "b", "c"):
+        backend.set(key, key, None)
+    backend.prune()
+
+    assert backend.get("a") is None
+    assert backend.get("b") == ("b", None)
+    assert backend.get("c") == ("c", None)
+
+
+class _TTLTool(BaseTool):
+    name: str = "ttl_tool"
+    description: str = "Tool with cache settings"
+
+    def _run(self) -> str:
+        return "ok"
+
+
+def test_cache_policy_uses_tool_ttl_and_cache_function():
+    calling = ToolCalling(tool_name="ttl_tool", arguments={})
+
+    tool = _TTLTool(cache_ttl=30)
+    assert ToolUsage._resolve_cache_policy(
+        tool.to_structured_tool(), calling, "ok"
+    ) == (True, 30)
+
+    tool = _TTLTool(cache_function=lambda _args, _result: False)
+    assert ToolUsage._resolve_cache_policy(
+        tool.to_structured_tool(), calling, "ok"
+    ) == (False, None)
+
+    tool = _TTLTool(cache_ttl=30, cache_function=lambda _args, _result: 5.0)
+    assert ToolUsage._resolve_cache_policy(
+        tool.to_structured_tool(), calling, "ok"
+    ) == (True, 5.0)
+
+
+@pytest.mark.parametrize(
+    ("decision", "expected"),
+    [
+        (True, (True, 30)),
+        (False, (False, 30)),
+        (1, (True, 30)),
+        (0, (False, 30)),
+        (None, (False, 30)),
+        (90.0, (True, 90.0)),
+        (0.0, (False, 0.0)),
+        (timedelta(minutes=2), (True, 120.0)),
+    ],
+)
+def test_cache_function_ttls_are_floats_or_timedeltas(decision, expected):
+    calling = ToolCalling(tool_name="ttl_tool", arguments={})
+    tool = _TTLTool(cache_ttl=30, cache_function=lambda _args, _result: decision)
+
+    assert (
+        ToolUsage._resolve_cache_policy(tool.to_structured_tool(), calling, "ok")
+        == expected
+    )
+
+
+def test_cache_backend_requires_the_full_interface():
+    class GetOnlyBackend(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnlyBackend()
@@ -0,0 +1,158 @@
+"""Tests for concurrent batch kickoff of crews."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from crewai import Agent, Crew, Task
+from crewai.crews.utils import copy_for_batch
+from crewai.tasks.task_output import TaskOutput
+
+
+class ConcurrencyProbe:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *args: object) -> None:
+        with self._lock:
+            self.active -= 1
+
+
+@pytest.fixture
+def crew() -> Crew:
+    agent = Agent(role="Researcher", goal="Research {topic}", backstory="Expert")
+    task = Task(
+        description="Research {topic}", expected_output="Summary", agent=agent
+    )
+    return Crew(agents=[agent], tasks=[task], max_rpm=1000)
+
+
+def _inputs(count: int) -> list[dict[str, str]]:
+    return [{"topic": f"topic_{i}"} for i in range(count)]
+
+
+def test_kickoff_for_each_runs_concurrently_in_input_order(crew):
+    probe = ConcurrencyProbe()
+
+    def execute_task(task, context=None, tools=None):
+        with probe:
+            time.sleep(0.05)
+        return f"done: {task.description}"
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        results = crew.kickoff_for_each(inputs=_inputs(6), max_concurrency=3)
+
+    assert [result.raw for result in results] == [
+        f"done: Research topic_{i}" for i in range(6)
+    ]
+    assert 1 < probe.peak <= 3
+
+
+def test_iter_kickoff_for_each_isolates_failures(crew):
+    def execute_task(task, context=None, tools=None):
+        if "topic_1" in task.description:
+            raise ValueError("bad input")
+        return "ok"
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        results = list(crew.iter_kickoff_for_each(_inputs(4), max_concurrency=2))
+
+    assert sorted(result.input_index for result in results) == [0, 1, 2, 3]
+    failed = [result for result in results if result.error is not None]
+    assert len(failed) == 1
+    assert failed[0].inputs == {"topic": "topic_1"}
+    assert failed[0].output is None
+    assert isinstance(failed[0].error, ValueError)
+    assert all(r.output.raw == "ok" for r in results if r.error is None)
+
+
+def test_iter_kickoff_for_each_yields_in_completion_order(crew):
+    def execute_task(task, context=None, tools=None):
+        time.sleep(0.2 if "topic_0" in task.description else 0)
+        return task.description
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        indexes = [
+            result.input_index
+            for result in crew.iter_kickoff_for_each(_inputs(3), max_concurrency=3)
+        ]
+
+    assert indexes[-1] == 0
+
+
+def test_kickoff_for_each_raises_after_the_batch_finishes(crew):
+    completed: list[str] = []
+
+    def execute_task(task, context=None, tools=None):
+        if "topic_0" in task.description:
+            raise ValueError("bad input")
+        completed.append(task.description)
+        return "ok"
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        with pytest.raises(ValueError, match="bad input"):
+            crew.kickoff_for_each(inputs=_inputs(3), max_concurrency=2)
+
+    assert sorted(completed) == ["Research topic_1", "Research topic_2"]
+
+
+def test_batch_copies_share_cache_and_rate_limits(crew):
+    crew_copy = copy_for_batch(crew)
+
+    assert crew_copy._cache_handler is crew._cache_handler
+    assert crew_copy._rpm_controller is crew._rpm_controller
+    assert crew_copy.agents[0]._rpm_controller is crew.agents[0]._rpm_controller
+    assert crew_copy.agents[0].cache_handler is crew._cache_handler
+    assert crew_copy.agents[0].llm is not crew.agents[0].llm
+
+
+def test_akickoff_for_each_bounds_concurrency(crew):
+    probe = ConcurrencyProbe()
+
+    async def aexecute_sync(self, agent=None, context=None, tools=None):
+        with probe:
+            await asyncio.sleep(0.05)
+        return TaskOutput(description=self.description, raw="ok", agent=agent.role)
+
+    with patch.object(Task, "aexecute_sync", aexecute_sync):
+        results = asyncio.run(crew.akickoff_for_each(_inputs(5), max_concurrency=2))
+
+    assert len(results) == 5
+    assert probe.peak == 2
+
+
+def test_akickoff_for_each_copies_crews_only_when_a_slot_is_free(crew):
+    live = ConcurrencyProbe()
+
+    def counted_copy(source):
+        live.__enter__()
+        return copy_for_batch(source)
+
+    async def aexecute_sync(self, agent=None, context=None, tools=None):
+        await asyncio.sleep(0.02)
+        live.__exit__()
+        return TaskOutput(description=self.description, raw="ok", agent=agent.role)
+
+    with (
+        patch("crewai.crews.utils.copy_for_batch", side_effect=counted_copy),
+        patch.object(Task, "aexecute_sync", aexecute_sync),
+    ):
+        results = asyncio.run(crew.akickoff_for_each(_inputs(6), max_concurrency=2))
+
+    assert len(results) == 6
+    assert live.peak == 2
+
+
+def test_max_concurrency_must_be_positive(crew):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        list(crew.iter_kickoff_for_each(_inputs(1), max_concurrency=0))
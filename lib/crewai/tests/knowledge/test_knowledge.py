@@ -679,3 +679,32 @@ def test_hash_based_id_generation_with_doc_id_in_metadata(mock_vector_db):
     for doc_id in result_without_doc_id.ids:
         assert len(doc_id) == 64, "ID should be 64 characters"
         assert all(c in "0123456789abcdef" for c in doc_id), "ID should be hex"
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_file_sources_load_files_in_parallel(tmpdir, use_processes):
+    paths = []
+    for i in range(4):
+        path = Path(tmpdir.join(f"file_{i}.txt"))
+        path.write_text(f"content {i}", encoding="utf-8")
+        paths.append(path)
+
+    source = TextFileKnowledgeSource(
+        file_paths=paths, max_workers=4, use_processes=use_processes
+    )
+
+    assert list(source.content) == paths
+    assert list(source.content.values()) == [f"content {i}" for i in range(4)]
+
+
+def test_json_and_csv_sources_flatten_content(tmpdir):
+    json_path = Path(tmpdir.join("data.json"))
+    json_path.write_text('{"a": [1, {"b": 2}]}', encoding="utf-8")
+    csv_path = Path(tmpdir.join("data.csv"))
+    csv_path.write_text("x,y\n1,2\n", encoding="utf-8")
+
+    json_source = JSONKnowledgeSource(file_paths=[json_path])
+    csv_source = CSVKnowledgeSource(file_paths=[csv_path])
+
+    assert json_source.content[json_path] == "a:   - 1\n  -     b: 2\n\n\n"
+    assert csv_source.content[csv_path] == "x y\n1 2\n"
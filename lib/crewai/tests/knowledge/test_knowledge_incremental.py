@@ -0,0 +1,226 @@
+"""Tests for incremental knowledge ingestion."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+import uuid
+
+import chromadb
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+import pytest
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
+from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+from crewai.knowledge.storage.knowledge_manifest import KnowledgeManifest, chunk_id
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.rag.chromadb.client import ChromaDBClient
+
+
+class CountingEmbeddingFunction(EmbeddingFunction[Documents]):
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.embedded.extend(input)
+        return [[float(len(text)), 1.0] for text in input]
+
+
+@pytest.fixture
+def embedder() -> CountingEmbeddingFunction:
+    return CountingEmbeddingFunction()
+
+
+@pytest.fixture
+def storage(tmp_path: Path, embedder: CountingEmbeddingFunction) -> KnowledgeStorage:
+    client = ChromaDBClient(
+        client=chromadb.EphemeralClient(),
+        embedding_function=embedder,
+    )
+    storage = KnowledgeStorage(collection_name=f"test_{uuid.uuid4().hex[:8]}")
+    storage._client = client
+    with patch(
+        "crewai.knowledge.storage.knowledge_manifest.db_storage_path",
+        return_value=str(tmp_path / "db"),
+    ):
+        yield storage
+
+
+def _stored_ids(storage: KnowledgeStorage) -> set[str]:
+    client = storage._get_client()
+    assert isinstance(client, ChromaDBClient)
+    collection = client.client.get_collection(storage._collection_name())
+    return set(collection.get(include=[])["ids"])
+
+
+def test_save_skips_chunks_already_stored(storage, embedder):
+    storage.save(["alpha", "beta"])
+    storage.save(["alpha", "beta", "gamma"])
+
+    assert embedder.embedded == ["alpha", "beta", "gamma"]
+    assert _stored_ids(storage) == {chunk_id(c) for c in ("alpha", "beta", "gamma")}
+
+
+def test_save_files_reembeds_only_changed_files(storage, embedder, tmp_path):
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    a.write_text("a")
+    b.write_text("b")
+
+    storage.save_files({a: ["a1", "a2"], b: ["b1"]})
+    embedder.embedded.clear()
+    storage.save_files({a: ["a1", "a2"], b: ["b1"]})
+    assert embedder.embedded == []
+
+    storage.save_files({a: ["a1", "a3"], b: ["b1"]})
+    assert embedder.embedded == ["a3"]
+    assert _stored_ids(storage) == {chunk_id(c) for c in ("a1", "a3", "b1")}
+
+
+def test_save_files_restores_chunks_missing_from_a_new_store(
+    storage, embedder, tmp_path
+):
+    a = tmp_path / "a.txt"
+    storage.save_files({a: ["a1", "a2"]})
+
+    # The manifest on disk outlives the vector store, e.g. an ephemeral client.
+    storage._client = ChromaDBClient(
+        client=chromadb.EphemeralClient(), embedding_function=embedder
+    )
+    storage._get_client().client.delete_collection(storage._collection_name())
+    embedder.embedded.clear()
+    storage.save_files({a: ["a1", "a2"]})
+
+    assert embedder.embedded == ["a1", "a2"]
+    assert _stored_ids(storage) == {chunk_id("a1"), chunk_id("a2")}
+
+
+def test_streaming_file_source_saves_chunks_in_batches(storage, embedder, tmp_path):
+    path = tmp_path / "large.txt"
+    text = "".join(f"line {i}\n" for i in range(40))
+    path.write_text(text)
+    source = TextFileKnowledgeSource(
+        file_paths=[path],
+        chunk_size=20,
+        chunk_overlap=5,
+        stream=True,
+        stream_batch_size=4,
+        storage=storage,
+    )
+    client = storage._get_client()
+    blocks = [text[i : i + 7] for i in range(0, len(text), 7)]
+
+    with (
+        patch(
+            "crewai.knowledge.source.text_file_knowledge_source._iter_text_blocks",
+            return_value=iter(blocks),
+        ),
+        patch.object(client, "add_documents", wraps=client.add_documents) as add,
+    ):
+        source.add()
+
+    expected = source._chunk_text(text)
+    assert source.content == {}
+    assert embedder.embedded == expected
+    batch_sizes = [len(call.kwargs["documents"]) for call in add.call_args_list]
+    assert len(batch_sizes) > 1
+    assert max(batch_sizes) <= 4
+    assert storage._manifest().files[KnowledgeManifest.key(path)] == {
+        "chunk_ids": [chunk_id(chunk) for chunk in expected]
+    }
+
+
+def test_streaming_requires_a_source_that_supports_it(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+
+    with pytest.raises(ValueError, match="does not support streaming"):
+        CSVKnowledgeSource(file_paths=[path], stream=True)
+
+
+def test_chunks_shared_with_another_file_are_kept(storage, tmp_path):
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    storage.save_files({a: ["shared", "a"], b: ["shared"]})
+
+    storage.save_files({a: ["a"]})
+
+    assert _stored_ids(storage) == {chunk_id("shared"), chunk_id("a")}
+
+
+def test_prune_files_deletes_chunks_of_removed_files(storage, tmp_path):
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    storage.save_files({a: ["a"], b: ["b"]})
+
+    storage.prune_files([a])
+
+    assert _stored_ids(storage) == {chunk_id("a")}
+    assert list(storage._manifest().files) == [KnowledgeManifest.key(a)]
+
+
+def test_manifest_records_chunk_ids(storage, tmp_path):
+    a = tmp_path / "a.txt"
+    storage.save_files({a: ["content"]})
+
+    assert storage._manifest().files == {
+        KnowledgeManifest.key(a): {"chunk_ids": [chunk_id("content")]}
+    }
+
+
+def test_reset_removes_manifest(storage, tmp_path):
+    storage.save_files({tmp_path / "a.txt": ["a"]})
+    storage.reset()
+
+    assert storage._manifest().files == {}
+
+
+def test_knowledge_ingests_file_sources_incrementally(storage, embedder, tmp_path):
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    first.write_text("first file")
+    second.write_text("second file")
+
+    def build(paths: list[Path]) -> Knowledge:
+        return Knowledge(
+            collection_name=storage.collection_name,
+            sources=[TextFileKnowledgeSource(file_paths=paths)],
+            storage=storage,
+            prune_removed_files=True,
+        )
+
+    build([first, second]).add_sources()
+    build([first, second]).add_sources()
+    assert embedder.embedded == ["first file", "second file"]
+
+    build([first]).add_sources()
+    assert _stored_ids(storage) == {chunk_id("first file")}
+
+
+def test_two_crews_sharing_a_collection_keep_each_others_chunks(storage, tmp_path):
+    # Every crew stores its knowledge in the "crew" collection.
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    first.write_text("first crew")
+    second.write_text("second crew")
+
+    def kickoff(path: Path) -> None:
+        Knowledge(
+            collection_name="crew",
+            sources=[TextFileKnowledgeSource(file_paths=[path])],
+            storage=storage,
+        ).add_sources()
+
+    for _ in range(2):
+        kickoff(first)
+        kickoff(second)
+
+    assert _stored_ids(storage) == {chunk_id("first crew"), chunk_id("second crew")}
+
+
+@pytest.mark.asyncio
+async def test_asave_files_falls_back_for_other_clients(tmp_path):
+    client = MagicMock()
+    client.aget_or_create_collection = AsyncMock()
+    client.aadd_documents = AsyncMock()
+    storage = KnowledgeStorage(collection_name="other")
+    storage._client = client
+
+    await storage.asave_files({tmp_path / "a.txt": ["a", "b"]})
+
+    documents = client.aadd_documents.call_args.kwargs["documents"]
+    assert [doc["content"] for doc in documents] == ["a", "b"]
@@ -124,6 +124,48 @@ def test_anthropic_tool_use_conversation_flow():
         assert "sunny and 75°F" in tool_result["content"]
 
 
+def test_anthropic_parallel_tool_uses_keep_tool_use_order():
+    """
+    Test that tool uses from one response run concurrently and their results
+    are returned in the order of the tool use blocks
+    """
+    import time
+    from unittest.mock import Mock, patch
+    from crewai.llms.providers.anthropic.completion import AnthropicCompletion
+    from anthropic.types.tool_use_block import ToolUseBlock
+
+    completion = AnthropicCompletion(model="claude-3-5-sonnet-20241022")
+
+    def slow_lookup(city: str, delay: float) -> str:
+        time.sleep(delay)
+        return f"weather in {city}"
+
+    tool_uses = []
+    for index, (city, delay) in enumerate([("Paris", 0.3), ("Rome", 0.1), ("Oslo", 0.2)]):
+        tool_use = Mock(spec=ToolUseBlock)
+        tool_use.type = "tool_use"
+        tool_use.id = f"tool_{index}"
+        tool_use.name = "lookup"
+        tool_use.input = {"city": city, "delay": delay}
+        tool_uses.append(tool_use)
+
+    with patch.object(completion.client.messages, "create") as mock_create:
+        started = time.perf_counter()
+        results = completion._execute_tools_and_collect_results(
+            tool_uses, {"lookup": slow_lookup}
+        )
+        elapsed = time.perf_counter() - started
+
+    mock_create.assert_not_called()
+    assert [r["tool_use_id"] for r in results] == ["tool_0", "tool_1", "tool_2"]
+    assert [r["content"] for r in results] == [
+        "weather in Paris",
+        "weather in Rome",
+        "weather in Oslo",
+    ]
+    assert elapsed < 0.55
+
+
 def test_anthropic_completion_module_is_imported():
     """
     Test that the completion module is properly imported when using Anthropic provider
@@ -0,0 +1,244 @@
+"""Tests for the LLM response cache and its record/replay modes."""
+
+import asyncio
+import copy
+
+import pytest
+from pydantic import BaseModel
+
+from crewai import Agent, Crew, Task
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.llm_events import LLMCallCompletedEvent, LLMCallType
+from crewai.llm import LLM
+from crewai.llms.base_llm import BaseLLM
+from crewai.llms.cache import (
+    LLMCacheMissError,
+    LLMResponseCache,
+    make_cache_key,
+    set_default_llm_cache,
+)
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class CountingLLM(BaseLLM):
+    def __init__(self, **kwargs):
+        super().__init__(model="counting-model", **kwargs)
+        self.calls = 0
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ):
+        self.calls += 1
+        if response_model is not None:
+            return response_model(value=self.calls)
+        self._emit_call_completed_event(
+            response=f"response {self.calls}",
+            call_type=LLMCallType.LLM_CALL,
+            messages=messages,
+        )
+        return f"response {self.calls}"
+
+    async def acall(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ):
+        self.calls += 1
+        return f"async response {self.calls}"
+
+
+@pytest.fixture(autouse=True)
+def no_default_cache():
+    yield
+    set_default_llm_cache(None)
+
+
+def test_cache_key_is_canonical():
+    a = make_cache_key(
+        "gpt-4o",
+        [{"role": "user", "content": "hi", "name": "x"}],
+        tools=[{"type": "function", "function": {"name": "f", "parameters": {}}}],
+        temperature=0.2,
+        response_format=Answer,
+    )
+    b = make_cache_key(
+        "gpt-4o",
+        [{"name": "x", "content": "hi", "role": "user"}],
+        tools=[{"function": {"parameters": {}, "name": "f"}, "type": "function"}],
+        temperature=0.2,
+        response_format=Answer,
+    )
+
+    assert a == b
+    assert make_cache_key("gpt-4o", "hi") == make_cache_key(
+        "gpt-4o", [{"role": "user", "content": "hi"}]
+    )
+    assert a != make_cache_key(
+        "gpt-4o",
+        [{"role": "user", "content": "hi", "name": "x"}],
+        temperature=0.3,
+        response_format=Answer,
+    )
+
+
+@pytest.mark.parametrize(
+    ("param", "values"),
+    [
+        ("max_tokens", (100, 200)),
+        ("top_p", (0.5, 0.9)),
+        ("seed", (1, 2)),
+        ("reasoning_effort", ("low", "high")),
+        ("base_url", ("http://a.example", "http://b.example")),
+        ("additional_params", ({"top_k": 1}, {"top_k": 5})),
+    ],
+)
+def test_output_affecting_parameters_are_part_of_the_key(param, values):
+    cache = LLMResponseCache()
+    llms = [CountingLLM(response_cache=cache) for _ in range(3)]
+    for llm, value in zip(llms, (*values, values[0]), strict=True):
+        setattr(llm, param, value)
+
+    responses = [llm.call("hello") for llm in llms]
+
+    assert [llm.calls for llm in llms] == [1, 1, 0]
+    assert responses[2] == responses[0]
+
+
+def test_identical_calls_are_served_from_cache():
+    llm = CountingLLM(response_cache=LLMResponseCache())
+
+    assert llm.call("hello") == "response 1"
+    assert llm.call("hello") == "response 1"
+    assert llm.call("other") == "response 2"
+    assert llm.calls == 2
+    assert llm.response_cache.stats()["hits"] == 1
+    assert "response_cache" not in llm.additional_params
+
+
+def test_structured_responses_are_rebuilt():
+    llm = CountingLLM(response_cache=LLMResponseCache())
+
+    first = llm.call("answer", response_model=Answer)
+    second = llm.call("answer", response_model=Answer)
+
+    assert isinstance(second, Answer)
+    assert second == first
+    assert llm.calls == 1
+
+
+def test_record_then_replay_from_disk(tmp_path):
+    path = tmp_path / "llm_cache.db"
+    recorder = CountingLLM(response_cache=LLMResponseCache(path, mode="record"))
+    recorder.call("hello")
+    recorder.call("hello")
+    assert recorder.calls == 2
+
+    replayer = CountingLLM(response_cache=LLMResponseCache(path, mode="replay"))
+    assert replayer.call("hello") == "response 2"
+    assert replayer.calls == 0
+
+    with pytest.raises(LLMCacheMissError):
+        replayer.call("never recorded")
+    assert replayer.calls == 0
+
+
+def test_default_cache_applies_to_llms_without_their_own():
+    set_default_llm_cache(LLMResponseCache())
+    llm = CountingLLM()
+
+    llm.call("hello")
+    llm.call("hello")
+
+    assert llm.calls == 1
+
+
+def test_async_calls_are_cached():
+    llm = CountingLLM(response_cache=LLMResponseCache())
+
+    async def run():
+        return [await llm.acall("hello"), await llm.acall("hello")]
+
+    assert asyncio.run(run()) == ["async response 1", "async response 1"]
+    assert llm.calls == 1
+
+
+def test_completed_events_report_cache_stats():
+    events: list[LLMCallCompletedEvent] = []
+    llm = CountingLLM(response_cache=LLMResponseCache())
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(LLMCallCompletedEvent, inline=True)
+        def on_completed(source, event):
+            events.append(event)
+
+        llm.call("hello")
+        llm.call("hello")
+
+    assert [event.cache_hit for event in events] == [False, True]
+    assert events[-1].cache_stats["hits"] == 1
+    assert events[-1].cache_stats["misses"] == 1
+
+
+def test_llm_without_cache_reports_no_cache_fields():
+    events: list[LLMCallCompletedEvent] = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(LLMCallCompletedEvent, inline=True)
+        def on_completed(source, event):
+            events.append(event)
+
+        CountingLLM().call("hello")
+
+    assert events[0].cache_hit is None
+    assert events[0].cache_stats is None
+
+
+def test_litellm_fallback_does_not_forward_cache_to_provider():
+    llm = LLM(
+        model="openrouter/some-model",
+        is_litellm=True,
+        response_cache=LLMResponseCache(),
+    )
+
+    assert isinstance(llm.response_cache, LLMResponseCache)
+    assert "response_cache" not in llm._prepare_completion_params("hi")
+
+
+@pytest.mark.parametrize("copy_fn", [copy.copy, copy.deepcopy])
+def test_litellm_copies_share_the_cache(copy_fn):
+    cache = LLMResponseCache()
+    llm = LLM(model="openrouter/some-model", is_litellm=True, response_cache=cache)
+
+    assert copy_fn(llm).response_cache is cache
+
+
+def test_crew_copy_keeps_the_llm_cache():
+    cache = LLMResponseCache()
+    agent = Agent(
+        role="Researcher",
+        goal="Research",
+        backstory="Expert",
+        llm=LLM(model="openrouter/some-model", is_litellm=True, response_cache=cache),
+    )
+    task = Task(description="Research", expected_output="Summary", agent=agent)
+
+    crew_copy = Crew(agents=[agent], tasks=[task]).copy()
+
+    assert crew_copy.agents[0].llm.response_cache is cache
@@ -0,0 +1,111 @@
+"""Tests for concurrent execution of the tool calls in one LLM turn."""
+
+import asyncio
+import threading
+import time
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.tools.base_tool import BaseTool
+
+
+class StubLLM(BaseLLM):
+    def call(self, messages, *args, **kwargs):
+        return ""
+
+
+class ConcurrencyProbe:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, delay: float, value: str) -> str:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(delay)
+        with self._lock:
+            self.active -= 1
+        return value
+
+
+class ProbeTool(BaseTool):
+    name: str = "probe"
+    description: str = "Sleeps and echoes."
+    thread_safe: bool = False
+
+    def _run(self, delay: float, value: str) -> str:
+        time.sleep(delay)
+        return value
+
+
+def test_independent_calls_run_concurrently_and_keep_call_order():
+    probe = ConcurrencyProbe()
+    calls = [
+        ("fetch", {"delay": 0.3, "value": "first"}),
+        ("fetch", {"delay": 0.1, "value": "second"}),
+        ("fetch", {"delay": 0.2, "value": "third"}),
+    ]
+
+    started = time.perf_counter()
+    results = StubLLM(model="stub")._execute_tool_calls(calls, {"fetch": probe})
+    elapsed = time.perf_counter() - started
+
+    assert results == ["first", "second", "third"]
+    assert probe.peak == 3
+    assert elapsed < 0.55
+
+
+def test_thread_unsafe_functions_run_one_at_a_time():
+    probe = ConcurrencyProbe()
+    probe.thread_safe = False
+    calls = [("fetch", {"delay": 0.05, "value": str(i)}) for i in range(3)]
+
+    results = StubLLM(model="stub")._execute_tool_calls(calls, {"fetch": probe})
+
+    assert results == ["0", "1", "2"]
+    assert probe.peak == 1
+
+
+def test_tool_opt_out_is_read_from_bound_methods():
+    tool = ProbeTool()
+    safe = ConcurrencyProbe()
+    calls = [
+        ("unsafe", {"delay": 0.01, "value": "a"}),
+        ("safe", {"delay": 0.01, "value": "b"}),
+        ("safe", {"delay": 0.01, "value": "c"}),
+    ]
+
+    results = StubLLM(model="stub")._execute_tool_calls(
+        calls, {"unsafe": tool.run, "safe": safe}
+    )
+
+    assert results == ["a", "b", "c"]
+    assert safe.peak == 2
+
+
+def test_failed_calls_do_not_affect_the_others():
+    def boom(**kwargs):
+        raise RuntimeError("boom")
+
+    results = StubLLM(model="stub")._execute_tool_calls(
+        [("boom", {}), ("missing", {}), ("echo", {"value": "ok"})],
+        {"boom": boom, "echo": lambda value: value},
+    )
+
+    assert results == [None, None, "ok"]
+
+
+def test_async_calls_are_gathered_in_call_order():
+    probe = ConcurrencyProbe()
+    calls = [
+        ("fetch", {"delay": 0.2, "value": "first"}),
+        ("fetch", {"delay": 0.05, "value": "second"}),
+    ]
+
+    results = asyncio.run(
+        StubLLM(model="stub")._aexecute_tool_calls(calls, {"fetch": probe})
+    )
+
+    assert results == ["first", "second"]
+    assert probe.peak == 2
@@ -0,0 +1,9 @@
+import pytest
+from crewai.mcp.pool import get_mcp_session_pool
+
+
+@pytest.fixture(autouse=True)
+def reset_mcp_session_pool():
+    """Keep pooled sessions (and patched clients) from leaking across tests."""
+    yield
+    get_mcp_session_pool().close()
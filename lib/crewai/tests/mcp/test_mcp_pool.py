@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from crewai.mcp.config import MCPServerHTTP, MCPServerStdio
+from crewai.mcp.pool import MCPSessionPool, mcp_server_key
+
+
+class FakeClient:
+    """Client double that, like real transports, must be closed by its opener."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.connected = False
+        self.connects = 0
+        self.disconnects = 0
+        self.active = 0
+        self.peak = 0
+        self.fail_next_call = False
+        self._opened_by = None
+
+    async def connect(self):
+        self._opened_by = asyncio.current_task()
+        self.connected = True
+        self.connects += 1
+        return self
+
+    async def disconnect(self):
+        assert asyncio.current_task() is self._opened_by
+        self.connected = False
+        self.disconnects += 1
+
+    async def list_tools(self):
+        return [{"name": "echo", "description": "", "inputSchema": {}}]
+
+    async def call_tool(self, tool_name, arguments=None):
+        if self.fail_next_call:
+            self.fail_next_call = False
+            self.connected = False
+            raise RuntimeError("Client not connected")
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return f"{tool_name}:{arguments['value']}"
+
+
+@pytest.fixture
+def pool():
+    pool = MCPSessionPool(max_concurrent_calls=2)
+    yield pool
+    pool.close()
+
+
+def test_session_is_reused_across_calls(pool):
+    client = FakeClient()
+    pool.register("server", lambda: client)
+
+    assert pool.list_tools("server")[0]["name"] == "echo"
+    assert pool.call_tool("server", "echo", {"value": 1}) == "echo:1"
+    assert pool.call_tool("server", "echo", {"value": 2}) == "echo:2"
+
+    assert client.connects == 1
+    assert client.disconnects == 0
+
+
+def test_register_only_builds_one_client_per_key(pool):
+    first = pool.register("server", FakeClient)
+    second = pool.register("server", FakeClient)
+
+    assert first is second
+
+
+def test_calls_from_many_threads_respect_concurrency_limit(pool):
+    client = FakeClient(delay=0.05)
+    pool.register("server", lambda: client)
+    results = []
+
+    def worker(value):
+        results.append(pool.call_tool("server", "echo", {"value": value}))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [f"echo:{i}" for i in range(6)]
+    assert client.peak == 2
+    assert client.connects == 1
+
+
+def test_dropped_connection_is_reopened_and_call_retried(pool):
+    client = FakeClient()
+    pool.register("server", lambda: client)
+    pool.call_tool("server", "echo", {"value": 1})
+
+    client.fail_next_call = True
+
+    assert pool.call_tool("server", "echo", {"value": 2}) == "echo:2"
+    assert client.connects == 2
+    assert client.disconnects == 1
+
+
+def test_idle_sessions_are_evicted_and_reconnect_on_use():
+    pool = MCPSessionPool(idle_timeout=0.05, health_check_interval=0.05)
+    client = FakeClient()
+    pool.register("server", lambda: client)
+    try:
+        pool.call_tool("server", "echo", {"value": 1})
+        deadline = time.monotonic() + 2
+        while client.disconnects == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        assert client.disconnects == 1
+        assert pool.call_tool("server", "echo", {"value": 2}) == "echo:2"
+        assert client.connects == 2
+    finally:
+        pool.close()
+
+
+def test_close_disconnects_and_allows_reuse(pool):
+    client = FakeClient()
+    pool.register("server", lambda: client)
+    pool.call_tool("server", "echo", {"value": 1})
+
+    pool.close()
+
+    assert client.disconnects == 1
+    pool.register("server", lambda: client)
+    assert pool.call_tool("server", "echo", {"value": 2}) == "echo:2"
+
+
+def test_unregistered_key_raises(pool):
+    with pytest.raises(KeyError):
+        pool.call_tool("missing", "echo", {"value": 1})
+
+
+def test_server_key_ignores_tool_filter_and_caching():
+    plain = MCPServerHTTP(url="https://api.example.com/mcp")
+    filtered = MCPServerHTTP(
+        url="https://api.example.com/mcp",
+        tool_filter=lambda tool: True,
+        cache_tools_list=True,
+    )
+
+    assert mcp_server_key(plain) == mcp_server_key(filtered)
+    assert mcp_server_key(plain) != mcp_server_key(
+        MCPServerHTTP(url="https://other.example.com/mcp")
+    )
+    assert mcp_server_key(MCPServerStdio(command="python")) != mcp_server_key(
+        MCPServerStdio(command="python", args=["server.py"])
+    )
@@ -948,7 +948,7 @@ def test_api_calls_throttling(capsys):
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Rate limit reached, waiting" in captured.out
         moveon.assert_called()
 
 
@@ -2192,8 +2192,8 @@ def test_tools_with_custom_caching():
     ) as add_to_cache:
         result = crew.kickoff()
 
-        # Check that add_to_cache was called exactly twice
-        assert add_to_cache.call_count == 2
+        # Only the even result passes cache_func, so it is the single cache write
+        assert add_to_cache.call_count == 1
 
         # Verify that one of those calls was with the even number that should be cached
         add_to_cache.assert_any_call(
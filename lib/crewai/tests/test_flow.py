@@ -2,8 +2,10 @@
 
 import asyncio
 import threading
+import time
 from datetime import datetime
 from typing import Optional
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel
@@ -1633,3 +1635,162 @@ class TestFlowAkickoff:
 
         assert execution_order == ["begin", "route", "path_a"]
         assert result == "path_a_result"
+
+
+
+def _parallel_listeners_flow(**attrs):
+    probe = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def work():
+        with lock:
+            probe["active"] += 1
+            probe["peak"] = max(probe["peak"], probe["active"])
+        time.sleep(0.1)
+        with lock:
+            probe["active"] -= 1
+        return threading.current_thread().name
+
+    class ParallelListenersFlow(Flow):
+        @start()
+        def begin(self):
+            return "go"
+
+        @listen(begin)
+        def first(self):
+            return work()
+
+        @listen(begin)
+        def second(self):
+            return work()
+
+        @listen(begin)
+        def third(self):
+            return work()
+
+    for name, value in attrs.items():
+        setattr(ParallelListenersFlow, name, value)
+    return ParallelListenersFlow(), probe
+
+
+def test_sync_listeners_run_in_parallel_threads():
+    flow, probe = _parallel_listeners_flow(method_executor="thread")
+    flow.kickoff()
+
+    assert probe["peak"] == 3
+
+
+def test_sync_listeners_run_inline_by_default():
+    flow, probe = _parallel_listeners_flow()
+    flow.kickoff()
+
+    assert probe["peak"] == 1
+
+
+def test_max_method_concurrency_caps_dispatched_methods():
+    flow, probe = _parallel_listeners_flow(
+        method_executor="thread", max_method_concurrency=2
+    )
+    flow.kickoff()
+
+    assert probe["peak"] == 2
+
+
+def test_custom_executor_runs_sync_methods():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(thread_name_prefix="flow-methods") as executor:
+        flow, probe = _parallel_listeners_flow(method_executor=executor)
+        flow.kickoff()
+
+    assert probe["peak"] == 3
+    listener_outputs = [output for output in flow._method_outputs if output != "go"]
+    assert len(listener_outputs) == 3
+    assert all(output.startswith("flow-methods") for output in listener_outputs)
+
+
+def test_state_snapshots_share_unchanged_subtrees():
+    class DocumentState(BaseModel):
+        id: str = "snapshot"
+        documents: list[str] = []
+        counter: int = 0
+
+    class SnapshotFlow(Flow[DocumentState]):
+        @start()
+        def load(self):
+            self.state.documents = ["x" * 1000] * 10
+
+        @listen(load)
+        def count(self):
+            self.state.counter += 1
+
+    snapshots = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def collect(source, event):
+            snapshots.append((event.method_name, event.state))
+
+        flow = SnapshotFlow()
+        with patch.object(
+            DocumentState, "model_copy", side_effect=AssertionError("deep copy")
+        ):
+            flow.kickoff()
+
+    states = dict(snapshots)
+    assert states["load"]["counter"] == 0
+    assert states["count"]["counter"] == 1
+    assert states["count"]["documents"] is states["load"]["documents"]
+
+
+def test_state_snapshots_do_not_share_equal_values_of_other_types():
+    class ValueState(BaseModel):
+        id: str = "snapshot"
+        value: bool | int | float = 1
+        values: list[bool | int | float] = [0, 1]
+
+    class ValueFlow(Flow[ValueState]):
+        @start()
+        def first(self):
+            pass
+
+        @listen(first)
+        def second(self):
+            self.state.value = True
+            self.state.values = [False, 1.0]
+
+    snapshots = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def collect(source, event):
+            snapshots.append((event.method_name, event.state))
+
+        ValueFlow().kickoff()
+
+    states = dict(snapshots)
+    assert states["first"]["value"] == 1 and type(states["first"]["value"]) is int
+    assert states["second"]["value"] is True
+    assert [type(value) for value in states["second"]["values"]] == [bool, float]
+
+
+def test_state_is_not_snapshotted_without_method_event_handlers():
+    class CounterState(BaseModel):
+        id: str = "snapshot"
+        counter: int = 0
+
+    class CounterFlow(Flow[CounterState]):
+        @start()
+        def count(self):
+            self.state.counter += 1
+
+    with crewai_event_bus.scoped_handlers():
+        flow = CounterFlow()
+        with patch.object(
+            CounterFlow,
+            "_copy_and_serialize_state",
+            side_effect=AssertionError("snapshot"),
+        ):
+            flow.kickoff()
+
+    assert flow.state.counter == 1
@@ -0,0 +1,97 @@
+"""Tests for the precompiled flow dispatch table."""
+
+from unittest.mock import patch
+
+from crewai.flow.dispatch import CompiledCondition, compile_condition
+from crewai.flow.flow import Flow, and_, listen, or_, router, start
+
+
+class FanOutFlow(Flow):
+    @start()
+    def begin(self):
+        return "begin"
+
+    @listen(begin)
+    def a(self, result):
+        return f"a:{result}"
+
+    @listen("a")
+    def b(self):
+        return "b"
+
+    @listen(and_("a", "b"))
+    def joined(self):
+        return "joined"
+
+    @router(b)
+    def route(self):
+        return "DONE"
+
+    @listen(or_("DONE", and_("a", "b")))
+    def finish(self):
+        return "finish"
+
+
+def test_dispatch_table_indexes_listeners_by_trigger():
+    dispatch = FanOutFlow._dispatch
+
+    assert dispatch.listeners["begin"] == ("a",)
+    assert dispatch.listeners["a"] == ("b", "joined", "finish")
+    assert dispatch.routers == {"b": ("route",)}
+    assert dispatch.listeners["DONE"] == ("finish",)
+
+
+def test_nested_conditions_are_compiled_once():
+    compiled = compile_condition(or_("DONE", and_("a", "b")))
+
+    assert compiled.type == "OR"
+    assert compiled.conditions[0] == "DONE"
+    nested = compiled.conditions[1]
+    assert isinstance(nested, CompiledCondition)
+    assert nested.methods == frozenset({"a", "b"})
+    assert compiled.triggers() == {"DONE", "a", "b"}
+
+
+def test_flow_runs_with_dispatch_table():
+    flow = FanOutFlow()
+    flow.kickoff()
+
+    assert flow._method_execution_counts == {
+        "begin": 1,
+        "a": 1,
+        "b": 1,
+        "joined": 1,
+        "route": 1,
+        "finish": 2,
+    }
+
+
+def test_only_candidate_listeners_are_evaluated():
+    calls: list[str] = []
+
+    import crewai.flow.flow as flow_module
+
+    original = flow_module.evaluate_condition
+
+    def counting(condition, trigger, listener_name, pending):
+        calls.append(listener_name)
+        return original(condition, trigger, listener_name, pending)
+
+    with patch.object(flow_module, "evaluate_condition", side_effect=counting):
+        FanOutFlow().kickoff()
+
+    assert calls.count("a") == 1
+    assert calls.count("route") == 1
+
+
+def test_method_arity_is_cached_per_class():
+    FanOutFlow._dispatch.accepts_result.clear()
+    FanOutFlow().kickoff()
+
+    assert FanOutFlow._dispatch.accepts_result == {
+        "a": True,
+        "b": False,
+        "joined": False,
+        "route": False,
+        "finish": False,
+    }
@@ -1,12 +1,15 @@
 """Test flow state persistence functionality."""
 
 import os
+import sqlite3
 from typing import Dict, List
+from unittest.mock import patch
 
 from crewai.flow.flow import Flow, FlowState, listen, start
 from crewai.flow.persistence import persist
 from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
 from pydantic import BaseModel
+import pytest
 
 
 class TestState(FlowState):
@@ -248,3 +251,164 @@ def test_persistence_with_base_model(tmp_path):
     assert message.type == "text"
     assert message.content == "Hello, World!"
     assert isinstance(flow.state, State)
+
+
+def _row_count(db_path: str, flow_uuid: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT COUNT(*) FROM flow_states WHERE flow_uuid = ?", (flow_uuid,)
+        ).fetchone()[0]
+
+
+def test_write_behind_coalesces_saves(tmp_path):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, write_behind=True, flush_interval=60)
+
+    for counter in range(3):
+        persistence.save_state("flow-1", "step", {"id": "flow-1", "counter": counter})
+
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "counter": 2}
+
+    persistence.flush()
+    assert _row_count(db_path, "flow-1") == 1
+
+    persistence.close()
+    assert SQLiteFlowPersistence(db_path).load_state("flow-1") == {
+        "id": "flow-1",
+        "counter": 2,
+    }
+
+
+def test_write_behind_snapshots_dict_states(tmp_path):
+    persistence = SQLiteFlowPersistence(
+        os.path.join(tmp_path, "test_flows.db"), write_behind=True, flush_interval=60
+    )
+    state = {"id": "flow-1", "items": [1]}
+
+    persistence.save_state("flow-1", "step", state)
+    state["items"].append(2)
+    persistence.close()
+
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "items": [1]}
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_delta_states_round_trip(tmp_path, compression):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, delta=True, compression=compression)
+
+    for counter in range(25):
+        state = {"id": "flow-1", "counter": counter, "log": ["start"]}
+        if counter % 2:
+            state["odd"] = True
+        persistence.save_state("flow-1", f"step_{counter}", state)
+
+    expected = {"id": "flow-1", "counter": 24, "log": ["start"]}
+    assert persistence.load_state("flow-1") == expected
+    assert SQLiteFlowPersistence(db_path).load_state("flow-1") == expected
+
+    with sqlite3.connect(db_path) as conn:
+        full_rows = conn.execute(
+            "SELECT COUNT(*) FROM flow_states WHERE is_delta = 0"
+        ).fetchone()[0]
+    assert full_rows == 2
+
+
+@pytest.mark.parametrize(
+    ("old", "new"), [(1, True), (0.0, False), (1, 1.0), ({"a": [1]}, {"a": [True]})]
+)
+def test_delta_states_keep_value_types(tmp_path, old, new):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, delta=True)
+
+    persistence.save_state("flow-1", "step_1", {"id": "flow-1", "x": old})
+    persistence.save_state("flow-1", "step_2", {"id": "flow-1", "x": new})
+
+    loaded = persistence.load_state("flow-1")
+    assert loaded == {"id": "flow-1", "x": new}
+    assert repr(loaded["x"]) == repr(new)
+
+
+def test_failed_write_does_not_become_a_delta_base(tmp_path):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, delta=True, max_checkpoints=10)
+    persistence.save_state("flow-1", "step_1", {"id": "flow-1", "counter": 0})
+
+    with patch.object(
+        persistence, "_prune", side_effect=sqlite3.OperationalError("disk I/O error")
+    ):
+        with pytest.raises(sqlite3.OperationalError):
+            persistence.save_state("flow-1", "step_2", {"id": "flow-1", "counter": 1})
+    persistence.save_state("flow-1", "step_2", {"id": "flow-1", "counter": 1})
+
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "counter": 1}
+    assert SQLiteFlowPersistence(db_path).load_state("flow-1") == {
+        "id": "flow-1",
+        "counter": 1,
+    }
+
+
+def test_retention_keeps_latest_checkpoints(tmp_path):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, max_checkpoints=2)
+
+    for counter in range(5):
+        persistence.save_state("flow-1", "step", {"id": "flow-1", "counter": counter})
+
+    assert _row_count(db_path, "flow-1") == 2
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "counter": 4}
+
+
+def test_retention_keeps_the_full_state_of_kept_deltas(tmp_path):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, delta=True, max_checkpoints=1)
+
+    for counter in range(5):
+        persistence.save_state("flow-1", "step", {"id": "flow-1", "counter": counter})
+
+    assert _row_count(db_path, "flow-1") == 5
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "counter": 4}
+
+
+def test_compact_collapses_checkpoints(tmp_path):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, delta=True)
+
+    for flow_uuid in ("flow-1", "flow-2"):
+        for counter in range(3):
+            persistence.save_state(
+                flow_uuid, "step", {"id": flow_uuid, "counter": counter}
+            )
+
+    persistence.compact()
+
+    for flow_uuid in ("flow-1", "flow-2"):
+        assert _row_count(db_path, flow_uuid) == 1
+        assert persistence.load_state(flow_uuid) == {"id": flow_uuid, "counter": 2}
+
+
+def test_loads_states_saved_by_earlier_schema(tmp_path):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE flow_states (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                flow_uuid TEXT NOT NULL,
+                method_name TEXT NOT NULL,
+                timestamp DATETIME NOT NULL,
+                state_json TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO flow_states (flow_uuid, method_name, timestamp, state_json) "
+            "VALUES (?, ?, ?, ?)",
+            ("flow-1", "step", "2024-01-01T00:00:00", '{"id": "flow-1"}'),
+        )
+
+    persistence = SQLiteFlowPersistence(db_path)
+
+    assert persistence.load_state("flow-1") == {"id": "flow-1"}
+    persistence.save_state("flow-1", "step", {"id": "flow-1", "counter": 1})
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "counter": 1}
@@ -0,0 +1,63 @@
+"""Import-time budget for the top-level ``crewai`` package.
+
+``import crewai`` must stay cheap: public classes are resolved lazily and
+heavy dependencies (LiteLLM, vector stores, OpenTelemetry) are only loaded
+when something that needs them is first accessed.
+"""
+
+import subprocess
+import sys
+
+
+# Generous compared to the ~50ms measured locally, but far below the
+# multi-second cold start of eagerly importing every provider.
+IMPORT_BUDGET_US = 1_500_000
+
+HEAVY_MODULES = ("litellm", "chromadb", "qdrant_client", "opentelemetry")
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+
+
+def _cumulative_us(stderr: str, module: str) -> int:
+    # Lines look like "import time:  <self us> | <cumulative us> | <module>".
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module:
+            return int(cumulative_us)
+    raise AssertionError(f"{module!r} not found in -X importtime output")
+
+
+def test_import_crewai_within_budget():
+    result = _run("import crewai")
+
+    assert _cumulative_us(result.stderr, "crewai") < IMPORT_BUDGET_US
+
+
+def test_import_crewai_does_not_load_heavy_dependencies():
+    result = _run(
+        "import sys, crewai; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_public_names_resolve_lazily():
+    result = _run(
+        "import crewai; "
+        "assert 'Crew' not in vars(crewai); "
+        "from crewai import Crew, LLM; "
+        "assert crewai.Crew is Crew and crewai.LLM is LLM"
+    )
+
+    assert result.returncode == 0
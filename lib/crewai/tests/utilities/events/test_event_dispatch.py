@@ -0,0 +1,133 @@
+"""Tests for resolved event dispatch: base-class subscriptions, inline handlers
+and the ``is_enabled`` fast path."""
+
+import threading
+import timeit
+
+from crewai.events.base_events import BaseEvent
+from crewai.events.event_bus import crewai_event_bus
+
+
+class ParentEvent(BaseEvent):
+    pass
+
+
+class ChildEvent(ParentEvent):
+    pass
+
+
+class UnrelatedEvent(BaseEvent):
+    pass
+
+
+def test_base_class_handlers_receive_subclass_events():
+    received: list[tuple[str, BaseEvent]] = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(ParentEvent, inline=True)
+        def on_parent(source, event):
+            received.append(("parent", event))
+
+        @crewai_event_bus.on(ChildEvent, inline=True)
+        def on_child(source, event):
+            received.append(("child", event))
+
+        child = ChildEvent(type="child")
+        parent = ParentEvent(type="parent")
+        crewai_event_bus.emit("source", child)
+        crewai_event_bus.emit("source", parent)
+
+    assert sorted(name for name, event in received if event is child) == [
+        "child",
+        "parent",
+    ]
+    assert [name for name, event in received if event is parent] == ["parent"]
+
+
+def test_is_enabled_reflects_registered_handlers():
+    with crewai_event_bus.scoped_handlers():
+        assert not crewai_event_bus.is_enabled(ChildEvent)
+
+        @crewai_event_bus.on(ParentEvent)
+        def handler(source, event):
+            pass
+
+        assert crewai_event_bus.is_enabled(ChildEvent)
+        assert not crewai_event_bus.is_enabled(UnrelatedEvent)
+
+        crewai_event_bus.unregister_handler(ParentEvent, handler)
+        assert not crewai_event_bus.is_enabled(ChildEvent)
+
+
+def test_inline_handlers_run_in_emitting_thread():
+    threads: list[threading.Thread] = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(UnrelatedEvent, inline=True)
+        def handler(source, event):
+            threads.append(threading.current_thread())
+
+        future = crewai_event_bus.emit("source", UnrelatedEvent(type="inline"))
+
+    assert future is None
+    assert threads == [threading.current_thread()]
+
+
+def test_direct_table_changes_invalidate_dispatch():
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(UnrelatedEvent)
+        def handler(source, event):
+            pass
+
+        assert crewai_event_bus.is_enabled(UnrelatedEvent)
+
+        with crewai_event_bus._rwlock.w_locked():
+            crewai_event_bus._sync_handlers.clear()
+
+        assert not crewai_event_bus.is_enabled(UnrelatedEvent)
+
+
+def test_scoped_handlers_restore_dispatch():
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(UnrelatedEvent, inline=True)
+        def handler(source, event):
+            pass
+
+        with crewai_event_bus.scoped_handlers():
+            assert not crewai_event_bus.is_enabled(UnrelatedEvent)
+
+        assert crewai_event_bus.is_enabled(UnrelatedEvent)
+
+
+def test_emit_overhead_microbenchmark():
+    event = UnrelatedEvent(type="benchmark")
+    number = 2000
+    calls = 0
+
+    with crewai_event_bus.scoped_handlers():
+        no_handlers = timeit.timeit(
+            lambda: crewai_event_bus.emit("source", event), number=number
+        )
+
+        @crewai_event_bus.on(UnrelatedEvent, inline=True)
+        def handler(source, event):
+            nonlocal calls
+            calls += 1
+
+        inline = timeit.timeit(
+            lambda: crewai_event_bus.emit("source", event), number=number
+        )
+
+    print(
+        f"emit overhead: {no_handlers / number * 1e6:.2f}us without handlers, "
+        f"{inline / number * 1e6:.2f}us with one inline handler"
+    )
+    assert calls == number
+    # Generous bounds: resolved dispatch takes about a microsecond per emit,
+    # versus a lock round trip and a thread pool submission before.
+    assert no_handlers / number < 50e-6
+    assert inline / number < 200e-6
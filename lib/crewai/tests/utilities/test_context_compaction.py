@@ -0,0 +1,146 @@
+import contextvars
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crewai.utilities.agent_utils import summarize_messages
+from crewai.utilities.context_compaction import (
+    SummaryCache,
+    count_tokens,
+    group_messages,
+    summary_cache,
+)
+from crewai.utilities.i18n import I18N
+
+
+@pytest.fixture(autouse=True)
+def estimated_tokens():
+    summary_cache.clear()
+    with patch(
+        "crewai.utilities.context_compaction._get_encoding", return_value=None
+    ):
+        yield
+    summary_cache.clear()
+
+
+def _llm(window: int = 100, model: str = "test-model") -> MagicMock:
+    llm = MagicMock()
+    llm.model = model
+    llm.get_context_window_size.return_value = window
+    llm.call.side_effect = lambda messages, callbacks=None: (
+        f"summary of {messages[1]['content'].split(': ', 1)[1]}"
+    )
+    return llm
+
+
+def _history() -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": "you are an agent"},
+        {"role": "user", "content": "a" * 160},
+        {"role": "assistant", "content": "b" * 160},
+        {"role": "user", "content": "c" * 160},
+        {"role": "assistant", "content": "recent answer"},
+    ]
+
+
+def test_groups_are_bounded_by_tokens():
+    messages = [{"role": "user", "content": "x" * 400}, {"role": "user", "content": "y"}]
+
+    groups = group_messages(messages, max_tokens=40)
+
+    assert all(count_tokens(group) <= 40 for group in groups)
+    assert "".join(groups).replace(" ", "") == "x" * 400 + "y"
+
+
+def test_keeps_system_and_recent_messages_verbatim():
+    messages = _history()
+
+    summarize_messages(messages, _llm(), callbacks=[], i18n=I18N(), keep_recent=1)
+
+    assert messages[0] == {"role": "system", "content": "you are an agent"}
+    assert messages[-1] == {"role": "assistant", "content": "recent answer"}
+    assert len(messages) == 3
+    summary = messages[1]["content"]
+    assert summary.index("a" * 160) < summary.index("b" * 160) < summary.index("c" * 160)
+
+
+def test_groups_are_summarized_concurrently():
+    llm = _llm()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_call(messages, callbacks=None):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return "summary"
+
+    llm.call.side_effect = slow_call
+
+    summarize_messages(
+        _history(), llm, callbacks=[], i18n=I18N(), keep_recent=1, max_workers=3
+    )
+
+    assert llm.call.call_count == 3
+    assert peak > 1
+
+
+def test_summaries_see_the_caller_context():
+    request_id = contextvars.ContextVar("request_id", default=None)
+    llm = _llm()
+    seen = []
+
+    def call(messages, callbacks=None):
+        seen.append(request_id.get())
+        return "summary"
+
+    llm.call.side_effect = call
+    request_id.set("req-1")
+
+    summarize_messages(
+        _history(), llm, callbacks=[], i18n=I18N(), keep_recent=1, max_workers=3
+    )
+
+    assert seen == ["req-1"] * 3
+
+
+def test_summaries_are_reused_on_next_overflow():
+    llm = _llm()
+    summarize_messages(_history(), llm, callbacks=[], i18n=I18N(), keep_recent=1)
+    assert llm.call.call_count == 3
+
+    grown = _history()
+    grown[-1:] = [
+        {"role": "assistant", "content": "d" * 160},
+        {"role": "user", "content": "latest"},
+    ]
+    summarize_messages(grown, llm, callbacks=[], i18n=I18N(), keep_recent=1)
+
+    assert llm.call.call_count == 4
+
+
+def test_everything_is_summarized_when_only_recent_messages_remain():
+    messages = [{"role": "user", "content": "only message"}]
+
+    summarize_messages(messages, _llm(), callbacks=[], i18n=I18N())
+
+    assert len(messages) == 1
+    assert "summary of only message" in messages[0]["content"]
+
+
+def test_summary_cache_evicts_least_recently_used():
+    cache = SummaryCache(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
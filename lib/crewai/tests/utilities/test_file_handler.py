@@ -1,9 +1,17 @@
+import json
 import os
+import time
 import unittest
 import uuid
 
 import pytest
-from crewai.utilities.file_handler import PickleHandler
+from crewai.utilities.file_handler import (
+    FileHandler,
+    JSONLLogWriter,
+    PickleHandler,
+    export_json_log,
+    read_jsonl_log,
+)
 
 
 class TestPickleHandler(unittest.TestCase):
@@ -47,3 +55,87 @@ class TestPickleHandler(unittest.TestCase):
 
         assert str(exc.value) == "pickle data was truncated"
         assert "<class '_pickle.UnpicklingError'>" == str(exc.type)
+
+
+def test_json_log_appends_in_legacy_format(tmp_path):
+    path = str(tmp_path / "logs.json")
+    handler = FileHandler(path)
+
+    handler.log(task_name="first", status="started")
+    handler.log(task_name="first", status="completed", output="done")
+
+    with open(path, encoding="utf-8") as file:
+        written = file.read()
+    entries = json.loads(written)
+    assert [e["status"] for e in entries] == ["started", "completed"]
+    # Byte-identical to rewriting the whole array, as earlier versions did.
+    assert written == json.dumps(entries, indent=4) + "\n"
+
+
+def test_json_log_recovers_from_compact_and_invalid_files(tmp_path):
+    compact = tmp_path / "compact.json"
+    compact.write_text('[{"status": "old"}]')
+    FileHandler(str(compact)).log(status="new")
+    assert [e["status"] for e in json.loads(compact.read_text())] == ["old", "new"]
+
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text("not json")
+    FileHandler(str(invalid)).log(status="new")
+    assert [e["status"] for e in json.loads(invalid.read_text())] == ["new"]
+
+
+def test_jsonl_log_is_buffered_until_flushed(tmp_path):
+    path = str(tmp_path / "logs.jsonl")
+    handler = FileHandler(path)
+    handler._writer.flush_interval = 60
+
+    handler.log(task_name="t", status="started")
+    assert not os.path.exists(path) or os.path.getsize(path) == 0
+
+    handler.flush()
+    assert [e["status"] for e in read_jsonl_log(path)] == ["started"]
+    handler.close()
+
+
+def test_jsonl_background_thread_writes_without_flush(tmp_path):
+    path = str(tmp_path / "logs.jsonl")
+    writer = JSONLLogWriter(path, flush_interval=0.01)
+
+    writer.write({"n": 1})
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and not (
+        os.path.exists(path) and os.path.getsize(path)
+    ):
+        time.sleep(0.01)
+
+    assert read_jsonl_log(path) == [{"n": 1}]
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.write({"n": 2})
+
+
+def test_jsonl_rotation_and_export(tmp_path):
+    path = str(tmp_path / "logs.jsonl")
+    writer = JSONLLogWriter(path, max_bytes=40, backup_count=2)
+
+    for n in range(6):
+        writer.write({"n": n, "pad": "x" * 10})
+        writer.flush()
+    writer.close()
+
+    assert os.path.exists(f"{path}.1")
+    assert os.path.exists(f"{path}.2")
+    assert not os.path.exists(f"{path}.3")
+    assert [e["n"] for e in read_jsonl_log(path)] == [3, 4, 5]
+
+    exported = str(tmp_path / "logs.json")
+    export_json_log(path, exported)
+    with open(exported, encoding="utf-8") as file:
+        assert [e["n"] for e in json.load(file)] == [3, 4, 5]
+
+
+def test_read_jsonl_log_skips_truncated_last_line(tmp_path):
+    path = tmp_path / "logs.jsonl"
+    path.write_text('{"n": 1}\n{"n": 2}\n{"n": ')
+
+    assert read_jsonl_log(str(path)) == [{"n": 1}, {"n": 2}]
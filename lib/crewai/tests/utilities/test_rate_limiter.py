@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+from litellm.types.utils import ModelResponse
+import pytest
+
+from crewai import Agent, Task
+from crewai.llm import LLM
+from crewai.llms.base_llm import count_call_tokens
+from crewai.utilities.rate_limiter import (
+    InMemoryRateLimitBackend,
+    RateLimiter,
+    SQLiteRateLimitBackend,
+    get_shared_rate_limiter,
+)
+from crewai.utilities.rpm_controller import RPMController
+
+
+def _frozen_clock(module: str, now: float):
+    return patch(f"crewai.utilities.rate_limiter.time.{module}", return_value=now)
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    limiter = RateLimiter("burst", max_rpm=2)
+    with _frozen_clock("monotonic", 100.0):
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(30.0)
+        assert limiter.reserve() == pytest.approx(60.0)
+
+    assert limiter.stats.requests == 4
+    assert limiter.stats.waits == 2
+    assert limiter.stats.max_wait_seconds == pytest.approx(60.0)
+
+
+def test_bucket_refills_over_time():
+    limiter = RateLimiter("refill", max_rpm=1)
+    with _frozen_clock("monotonic", 100.0):
+        limiter.reserve()
+    with _frozen_clock("monotonic", 160.0):
+        assert limiter.reserve() == 0
+
+
+def test_token_budget_is_debited_after_the_call():
+    limiter = RateLimiter("tokens", max_tpm=600)
+    with _frozen_clock("monotonic", 100.0):
+        assert limiter.reserve() == 0
+        limiter.record_tokens(900)
+        assert limiter.reserve() == pytest.approx(30.0)
+
+    assert limiter.stats.tokens == 900
+
+
+def test_shared_limiter_is_reused_by_key():
+    first = get_shared_rate_limiter("test-provider/shared-model", max_rpm=5)
+    second = get_shared_rate_limiter("test-provider/shared-model", max_rpm=50)
+
+    assert first is second
+    assert second.max_rpm == 5
+
+
+def test_sqlite_backend_shares_buckets_between_instances(tmp_path):
+    db_path = str(tmp_path / "rate_limits.db")
+    first = RateLimiter("shared", max_rpm=1, backend=SQLiteRateLimitBackend(db_path))
+    second = RateLimiter("shared", max_rpm=1, backend=SQLiteRateLimitBackend(db_path))
+    with _frozen_clock("time", 1000.0):
+        assert first.reserve() == 0
+        assert second.reserve() == pytest.approx(60.0)
+
+
+def test_controller_waits_outside_and_logs(capsys):
+    controller = RPMController(max_rpm=1, backend=InMemoryRateLimitBackend())
+    controller.logger.verbose = True
+    with patch.object(RPMController, "_wait_for_next_minute") as wait:
+        assert controller.check_or_wait() is True
+        wait.assert_not_called()
+        assert controller.check_or_wait() is True
+        wait.assert_called_once()
+
+    assert "Rate limit reached" in capsys.readouterr().out
+    assert controller.stats()["waits"] == 1
+
+
+def test_controllers_with_same_scope_share_budget():
+    first = RPMController(max_rpm=1, scope="test-provider/scoped-model")
+    second = RPMController(max_rpm=1, scope="test-provider/scoped-model")
+    with patch.object(RPMController, "_wait_for_next_minute") as wait:
+        first.check_or_wait()
+        second.check_or_wait()
+
+    wait.assert_called_once()
+
+
+def test_controller_acquire_does_not_block_event_loop():
+    controller = RPMController(max_rpm=1)
+
+    async def run() -> list[float]:
+        with patch(
+            "crewai.utilities.rpm_controller.asyncio.sleep", return_value=None
+        ) as sleep:
+            await controller.acquire()
+            await controller.acquire()
+        return [call.args[0] for call in sleep.call_args_list]
+
+    waits = asyncio.run(run())
+
+    assert len(waits) == 1
+    assert waits[0] == pytest.approx(60.0, abs=1)
+
+
+def test_controller_without_limits_never_waits():
+    controller = RPMController()
+    with patch.object(RPMController, "_wait_for_next_minute") as wait:
+        for _ in range(100):
+            controller.check_or_wait()
+
+    wait.assert_not_called()
+    assert controller.stats() == {}
+
+
+def _litellm_response(content: str, prompt_tokens: int, completion_tokens: int):
+    return ModelResponse(
+        model="gpt-4o-mini",
+        choices=[{"message": {"role": "assistant", "content": content}}],
+        usage={
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    )
+
+
+def test_executor_debits_tokens_of_litellm_responses():
+    agent = Agent(
+        role="Researcher",
+        goal="Answer",
+        backstory="Knows things",
+        llm=LLM(model="gpt-4o-mini", is_litellm=True),
+        max_tpm=600,
+    )
+    task = Task(description="Say done", expected_output="done", agent=agent)
+
+    with patch(
+        "litellm.completion",
+        return_value=_litellm_response("Thought: easy\nFinal Answer: done", 800, 100),
+    ):
+        assert agent.execute_task(task) == "done"
+
+    assert agent._rpm_controller.stats()["tokens"] == 900
+
+
+def test_call_token_counts_are_not_shared_between_threads():
+    llm = LLM(model="gpt-4o-mini", is_litellm=True)
+    barrier = threading.Barrier(2)
+    counted = {}
+
+    def call(name: str, tokens: int) -> None:
+        with count_call_tokens() as usage:
+            barrier.wait()
+            llm._track_token_usage_internal(
+                {"prompt_tokens": tokens, "completion_tokens": 0}
+            )
+            barrier.wait()
+        counted[name] = usage.total_tokens
+
+    threads = [
+        threading.Thread(target=call, args=("first", 100)),
+        threading.Thread(target=call, args=("second", 5000)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counted == {"first": 100, "second": 5000}
@@ -0,0 +1,84 @@
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+from crewai.utilities.sqlite_pool import SQLitePool, get_sqlite_pool
+
+
+def test_connection_is_reused_per_thread(tmp_path):
+    pool = SQLitePool(str(tmp_path / "pool.db"))
+    main = pool.connection()
+    assert pool.connection() is main
+    assert main.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    other: list[sqlite3.Connection] = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not main
+
+
+def test_transaction_rolls_back_on_error(tmp_path):
+    pool = SQLitePool(str(tmp_path / "pool.db"))
+    with pool.transaction() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+
+    with pytest.raises(RuntimeError):
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            raise RuntimeError
+
+    assert pool.connection().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_transaction_rolls_back_when_commit_fails(tmp_path):
+    pool = SQLitePool(str(tmp_path / "pool.db"))
+    conn = pool.connection()
+    conn.execute("PRAGMA foreign_keys=ON")
+    with pool.transaction() as conn:
+        conn.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+        conn.execute(
+            "CREATE TABLE child (parent_id INTEGER REFERENCES parent(id) "
+            "DEFERRABLE INITIALLY DEFERRED)"
+        )
+
+    with pytest.raises(sqlite3.IntegrityError):
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO child VALUES (1)")
+
+    assert not conn.in_transaction
+    with pool.transaction() as conn:
+        conn.execute("INSERT INTO parent VALUES (1)")
+    assert conn.execute("SELECT COUNT(*) FROM child").fetchone()[0] == 0
+
+
+def test_pools_are_shared_by_path(tmp_path):
+    assert get_sqlite_pool(str(tmp_path / "a.db")) is get_sqlite_pool(
+        str(tmp_path / "a.db")
+    )
+
+
+def test_ltm_storage_save_many_and_async_load(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"))
+    storage.save_many(
+        [
+            ("task", {"n": 1}, "2024-01-01", 5),
+            ("task", {"n": 2}, "2024-01-02", 7),
+            ("other", {"n": 3}, "2024-01-03", 9),
+        ]
+    )
+
+    results = asyncio.run(storage.aload("task", latest_n=5))
+
+    assert [r["metadata"]["n"] for r in results] == [2, 1]
+    plan = storage._pool.connection().execute(
+        "EXPLAIN QUERY PLAN SELECT metadata FROM long_term_memories "
+        "WHERE task_description = ? ORDER BY datetime DESC, score ASC",
+        ("task",),
+    ).fetchall()
+    assert "idx_long_term_memories_task_datetime" in str(plan)
+    assert "TEMP B-TREE" not in str(plan)
@@ -1,8 +1,13 @@
 import os
+import pickle
 import tempfile
 import unittest
+from unittest import mock
 
-from crewai.utilities.training_handler import CrewTrainingHandler
+from crewai.utilities.training_handler import (
+    CrewTrainingHandler,
+    clear_training_data_cache,
+)
 
 
 class InternalCrewTrainingHandler(unittest.TestCase):
@@ -53,3 +58,64 @@ class InternalCrewTrainingHandler(unittest.TestCase):
         # Assert that the new agent and data are appended correctly
         data = self.handler.load()
         assert data[agent_id][train_iteration] == new_data
+
+
+class TrainingDataCache(unittest.TestCase):
+    def setUp(self):
+        clear_training_data_cache()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pkl_path = os.path.join(self.temp_dir.name, "trained_agents_data.pkl")
+
+    def tearDown(self):
+        clear_training_data_cache()
+        self.temp_dir.cleanup()
+
+    def test_unchanged_file_is_unpickled_once(self):
+        CrewTrainingHandler(self.pkl_path).save({"Researcher": {"suggestions": []}})
+        clear_training_data_cache()
+
+        with mock.patch("pickle.load", wraps=pickle.load) as load:
+            first = CrewTrainingHandler(self.pkl_path).load()
+            second = CrewTrainingHandler(self.pkl_path).load()
+
+        assert load.call_count == 1
+        assert first is second
+
+    def test_file_changed_on_disk_is_reloaded(self):
+        CrewTrainingHandler(self.pkl_path).save({"Researcher": {"suggestions": []}})
+        CrewTrainingHandler(self.pkl_path).load()
+
+        with open(self.pkl_path, "wb") as f:
+            pickle.dump({"Writer": {"suggestions": ["Be brief"]}}, f)
+        stat = os.stat(self.pkl_path)
+        os.utime(self.pkl_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert CrewTrainingHandler(self.pkl_path).load() == {
+            "Writer": {"suggestions": ["Be brief"]}
+        }
+
+    def test_updates_do_not_mutate_previously_loaded_data(self):
+        handler = CrewTrainingHandler(self.pkl_path)
+        handler.append(0, "agent1", {"human_feedback": "first"})
+        before = handler.load()
+
+        handler.append(1, "agent1", {"human_feedback": "second"})
+
+        assert list(before["agent1"]) == [0]
+        assert list(handler.load()["agent1"]) == [0, 1]
+
+    def test_json_format_round_trips_without_pickle(self):
+        json_path = os.path.join(self.temp_dir.name, "trained_agents_data.json")
+        CrewTrainingHandler(json_path).save_trained_data(
+            "Researcher", {"suggestions": ["Cite sources"]}
+        )
+        clear_training_data_cache()
+
+        with mock.patch("pickle.load") as load:
+            data = CrewTrainingHandler(json_path).load()
+            fallback = CrewTrainingHandler(self.pkl_path).load()
+
+        load.assert_not_called()
+        assert data == {"Researcher": {"suggestions": ["Cite sources"]}}
+        assert fallback == data
+        assert not os.path.exists(self.pkl_path)